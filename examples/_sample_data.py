@@ -0,0 +1,96 @@
+"""
+Shared sample data and store checks for the examples.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+import zarr
+
+
+@lru_cache(maxsize=8)
+def make_sample(periods: int = 10, t0: str = "2000-01-01", seed: int = 42) -> xr.Dataset:
+    """
+    Build a small float32 sample dataset.
+
+    The result is memoized on ``(periods, t0, seed)``, so treat it as read-only.
+
+    Args:
+        periods: Number of daily time steps
+        t0: First time step
+        seed: Seed for the random generator
+
+    Returns:
+        Sample dataset with temperature and pressure variables
+    """
+    rng = np.random.default_rng(seed)
+    data = rng.random((periods, 3, 4), dtype=np.float32)
+    pressure = np.multiply(data, np.float32(1000))
+    ds = xr.Dataset(
+        {
+            "temperature": (("time", "lat", "lon"), data),
+            "pressure": (("time", "lat", "lon"), pressure),
+        },
+        coords={
+            "time": pd.date_range(t0, periods=periods),
+            "lat": [-10, 0, 10],
+            "lon": [20, 30, 40, 50],
+        },
+    )
+
+    # Add valid range attributes for packing
+    ds["temperature"].attrs["valid_min"] = 0.0
+    ds["temperature"].attrs["valid_max"] = 1.0
+    ds["pressure"].attrs["valid_min"] = 0.0
+    ds["pressure"].attrs["valid_max"] = 1000.0
+
+    # Add some attributes
+    ds.attrs["title"] = "Sample dataset for retry logic demo"
+    ds["temperature"].attrs["units"] = "K"
+    ds["pressure"].attrs["units"] = "hPa"
+
+    return ds
+
+
+def write_sample(path: str, **kw) -> str:
+    """
+    Write a sample dataset to NetCDF.
+
+    Args:
+        path: Output NetCDF path
+        **kw: Passed through to make_sample
+
+    Returns:
+        The output path
+    """
+    ds = make_sample(**kw)
+    encoding = {var: {"dtype": "float32"} for var in ds.data_vars}
+    ds.to_netcdf(path, encoding=encoding)
+    return path
+
+
+def store_summary(zarr_path: str, var: str = "temperature") -> tuple:
+    """
+    Summarize a variable of a Zarr store from a single read.
+
+    Fill values are left out of the range, and scale/offset attributes are
+    only applied to the resulting min and max.
+
+    Args:
+        zarr_path: Path to the Zarr store
+        var: Name of the variable
+
+    Returns:
+        Tuple of (time steps, min, max) of the variable
+    """
+    group = zarr.open(zarr_path, mode="r")
+    arr = group[var]
+    values = arr[:]
+    if arr.fill_value is not None:
+        values = values[values != arr.fill_value]
+    vmin, vmax = float(np.nanmin(values)), float(np.nanmax(values))
+    scale = arr.attrs.get("scale_factor", 1.0)
+    offset = arr.attrs.get("add_offset", 0.0)
+    return group["time"].shape[0], vmin * scale + offset, vmax * scale + offset
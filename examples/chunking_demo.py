@@ -11,6 +11,9 @@ import os
 from zarrio import ZarrConverter, convert_to_zarr, append_to_zarr
 from zarrio.models import ZarrConverterConfig, ChunkingConfig, PackingConfig
 
+# Shared generator; seeded once so each run of the script is reproducible
+_RNG = np.random.default_rng(42)
+
 
 def create_sample_climate_data(tmpdir: str) -> str:
     """Create sample climate data for demonstration."""
@@ -20,11 +23,10 @@ def create_sample_climate_data(tmpdir: str) -> str:
     lons = np.linspace(-180, 180, 60)  # 60 lon points instead of 360
     
     # Create realistic climate data
-    np.random.seed(42)  # For reproducible results
     temperature = 20 + 15 * np.sin(2 * np.pi * np.arange(100) / 365)  # Seasonal cycle
-    temperature = temperature[:, np.newaxis, np.newaxis] + 10 * np.random.random([100, 30, 60])
+    temperature = temperature[:, np.newaxis, np.newaxis] + 10 * _RNG.random((100, 30, 60), dtype=np.float32)
     
-    pressure = 1013 + 50 * np.random.random([100, 30, 60])
+    pressure = 1013 + 50 * _RNG.random((100, 30, 60), dtype=np.float32)
     
     # Create dataset
     ds = xr.Dataset(
@@ -18,6 +18,9 @@ from zarrio import ZarrConverter, convert_to_zarr
 from zarrio.models import ZarrConverterConfig
 from zarrio.chunking import get_chunk_recommendation
 
+# Shared generator; seeded once so each run of the script is reproducible
+_RNG = np.random.default_rng(42)
+
 
 def create_sample_data(time_steps=365, lat_points=181, lon_points=361):
     """Create sample climate data."""
@@ -25,18 +28,15 @@ def create_sample_data(time_steps=365, lat_points=181, lon_points=361):
     lats = np.linspace(-90, 90, lat_points)
     lons = np.linspace(-180, 180, lon_points)
     
-    # Create realistic climate data
-    np.random.seed(42)
-    
     # Temperature (degC) - varies with latitude and season
     lat_factor = np.cos(np.radians(lats))  # Warmer at equator
     temp_base = 15 + 20 * lat_factor[:, np.newaxis]  # Base temperature by latitude
     seasonal = 10 * np.sin(2 * np.pi * np.arange(time_steps) / 365)  # Seasonal variation
     temperature = temp_base[np.newaxis, :, :] + seasonal[:, np.newaxis, np.newaxis] + \
-                  5 * np.random.random((time_steps, lat_points, lon_points))  # Noise
+                  5 * _RNG.random((time_steps, lat_points, lon_points), dtype=np.float32)  # Noise
     
     # Pressure (hPa) - varies with temperature and altitude
-    pressure = 1013 + 0.5 * temperature + 20 * np.random.random((time_steps, lat_points, lon_points))
+    pressure = 1013 + 0.5 * temperature + 20 * _RNG.random((time_steps, lat_points, lon_points), dtype=np.float32)
     
     ds = xr.Dataset(
         {
@@ -10,6 +10,9 @@ import os
 
 from zarrio import convert_to_zarr, append_to_zarr, ZarrConverter
 
+# Shared generator; seeded once so each run of the script is reproducible
+_RNG = np.random.default_rng(42)
+
 
 def create_sample_data():
     """Create sample NetCDF data for demonstration."""
@@ -19,9 +22,8 @@ def create_sample_data():
     lons = np.linspace(-180, 180, 361)
     
     # Create random data
-    np.random.seed(42)
-    temperature = 20 + 10 * np.random.random((100, 181, 361))
-    pressure = 1013 + 50 * np.random.random((100, 181, 361))
+    temperature = 20 + 10 * _RNG.random((100, 181, 361), dtype=np.float32)
+    pressure = 1013 + 50 * _RNG.random((100, 181, 361), dtype=np.float32)
     
     # Create dataset
     ds = xr.Dataset(
@@ -123,8 +125,8 @@ def main():
         times2 = pd.date_range("2023-04-11", periods=50, freq="D")
         lats = np.linspace(-90, 90, 181)
         lons = np.linspace(-180, 180, 361)
-        temperature2 = 20 + 10 * np.random.random((50, 181, 361))
-        pressure2 = 1013 + 50 * np.random.random((50, 181, 361))
+        temperature2 = 20 + 10 * _RNG.random((50, 181, 361), dtype=np.float32)
+        pressure2 = 1013 + 50 * _RNG.random((50, 181, 361), dtype=np.float32)
         
         ds2 = xr.Dataset(
             {
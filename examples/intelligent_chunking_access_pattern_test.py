@@ -16,6 +16,9 @@ from zarrio import ZarrConverter
 from zarrio.models import ZarrConverterConfig
 from zarrio.chunking import get_chunk_recommendation
 
+# Shared generator; seeded once so each run of the script is reproducible
+_RNG = np.random.default_rng(42)
+
 
 def create_sample_data():
     """Create sample climate data."""
@@ -24,9 +27,8 @@ def create_sample_data():
     lons = np.linspace(-180, 180, 361)
     
     # Create random data with some structure
-    np.random.seed(42)
-    temperature = 20 + 10 * np.random.random((365, 181, 361))
-    pressure = 1013 + 50 * np.random.random((365, 181, 361))
+    temperature = 20 + 10 * _RNG.random((365, 181, 361), dtype=np.float32)
+    pressure = 1013 + 50 * _RNG.random((365, 181, 361), dtype=np.float32)
     
     ds = xr.Dataset(
         {
@@ -13,6 +13,7 @@ import tempfile
 import os
 from pathlib import Path
 
+from _sample_data import store_summary
 from zarrio import ZarrConverter
 
 
@@ -107,7 +108,8 @@ def demonstrate_parallel_writing():
         first_file_ds = xr.open_dataset(data_files[0])
         print(f"\n6. Data integrity check:")
         print(f"   Original temperature range: {first_file_ds.temperature.min().values:.3f} to {first_file_ds.temperature.max().values:.3f}")
-        print(f"   Archive temperature range: {final_ds.temperature.min().values:.3f} to {final_ds.temperature.max().values:.3f}")
+        _, archive_min, archive_max = store_summary(zarr_archive)
+        print(f"   Archive temperature range: {archive_min:.3f} to {archive_max:.3f}")
         
         print("\n=== Demo completed successfully! ===")
 
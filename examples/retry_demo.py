@@ -8,9 +8,13 @@ import pandas as pd
 import xarray as xr
 import os
 
+from _sample_data import store_summary
 from zarrio import ZarrConverter, convert_to_zarr, append_to_zarr
 from zarrio.models import ZarrConverterConfig, MissingDataConfig
 
+# Shared generator; seeded once so each run of the script is reproducible
+_RNG = np.random.default_rng(42)
+
 
 def create_test_dataset_with_missing_values(
     filename: str,
@@ -20,8 +24,7 @@ def create_test_dataset_with_missing_values(
 ) -> str:
     """Create a test dataset with missing values for testing retry functionality."""
     # Create test data
-    np.random.seed(42)  # For reproducible tests
-    data = np.random.random([periods, 3, 4])
+    data = _RNG.random((periods, 3, 4), dtype=np.float32)
     
     # Apply missing data pattern
     if missing_pattern == "start":
@@ -35,7 +38,7 @@ def create_test_dataset_with_missing_values(
         data[-2:, :, :] = np.nan
     elif missing_pattern == "random":
         # Random missing data
-        mask = np.random.random(data.shape) < 0.1  # 10% missing
+        mask = _RNG.random(data.shape) < 0.1  # 10% missing
         data = np.where(mask, np.nan, data)
     
     ds = xr.Dataset(
@@ -95,7 +98,8 @@ def demonstrate_retry_logic():
         config = ZarrConverterConfig(
             missing_data=MissingDataConfig(
                 retries_on_missing=3,  # Enable 3 retries
-                missing_check_vars="all"
+                # Check only the primary variable; derived variables inherit the same missing mask
+                missing_check_vars=["temperature"]
             )
         )
         
@@ -124,7 +128,8 @@ def demonstrate_retry_logic():
             config=ZarrConverterConfig(
                 missing_data=MissingDataConfig(
                     retries_on_missing=2,  # Enable 2 retries
-                    missing_check_vars="all"
+                    # Check only the primary variable; derived variables inherit the same missing mask
+                    missing_check_vars=["temperature"]
                 )
             )
         )
@@ -135,15 +140,16 @@ def demonstrate_retry_logic():
         print("\n5. Parallel writing with retry logic...")
         zarrfile4 = os.path.join(tmpdir, "parallel_retry.zarr")
         
-        # Create template dataset
-        template_ds = xr.open_dataset(ncfile1)
+        # Open the template lazily; only coords and schema are needed
+        template_ds = xr.open_dataset(ncfile1, chunks={"time": 1})
         
         # Create converter with retry logic for parallel writing
         converter_parallel = ZarrConverter(
             config=ZarrConverterConfig(
                 missing_data=MissingDataConfig(
                     retries_on_missing=2,  # Enable 2 retries
-                    missing_check_vars="all"
+                    # Check only the primary variable; derived variables inherit the same missing mask
+                    missing_check_vars=["temperature"]
                 )
             )
         )
@@ -156,6 +162,7 @@ def demonstrate_retry_logic():
             global_end="2000-01-10",
             compute=False  # Metadata only
         )
+        template_ds.close()
         print(f"   ✓ Created template for parallel writing: {os.path.basename(zarrfile4)}")
         
         # Write regions with retry logic
@@ -165,21 +172,15 @@ def demonstrate_retry_logic():
         
         # 6. Verify results
         print("\n6. Verifying results...")
-        ds1 = xr.open_zarr(zarrfile1)
-        ds2 = xr.open_zarr(zarrfile2)
-        ds3 = xr.open_zarr(zarrfile3)
-        ds4 = xr.open_zarr(zarrfile4)
-        
-        print(f"   No retry Zarr: {len(ds1.time)} time steps")
-        print(f"   With retry Zarr: {len(ds2.time)} time steps")
-        print(f"   Append retry Zarr: {len(ds3.time)} time steps")
-        print(f"   Parallel retry Zarr: {len(ds4.time)} time steps")
-        
-        # Check that data was written correctly despite missing values
-        print(f"   Temperature range in no retry Zarr: {float(ds1.temperature.min()):.3f} to {float(ds1.temperature.max()):.3f}")
-        print(f"   Temperature range in with retry Zarr: {float(ds2.temperature.min()):.3f} to {float(ds2.temperature.max()):.3f}")
-        print(f"   Temperature range in append retry Zarr: {float(ds3.temperature.min()):.3f} to {float(ds3.temperature.max()):.3f}")
-        print(f"   Temperature range in parallel retry Zarr: {float(ds4.temperature.min()):.3f} to {float(ds4.temperature.max()):.3f}")
+        # One read per store feeds the time count and the temperature range
+        for label, path in [
+            ("no retry", zarrfile1),
+            ("with retry", zarrfile2),
+            ("append retry", zarrfile3),
+            ("parallel retry", zarrfile4),
+        ]:
+            ntime, tmin, tmax = store_summary(path)
+            print(f"   {label.capitalize()} Zarr: {ntime} time steps, temperature {tmin:.3f} to {tmax:.3f}")
         
         print("\n=== Demo completed successfully! ===")
 
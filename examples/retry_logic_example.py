@@ -5,46 +5,14 @@ Example demonstrating retry logic for handling missing data in zarrio.
 
 import tempfile
 import numpy as np
-import pandas as pd
 import xarray as xr
 import os
 
+from _sample_data import store_summary, write_sample
 from zarrio import ZarrConverter, convert_to_zarr, append_to_zarr
 from zarrio.models import ZarrConverterConfig, MissingDataConfig
 
 
-def create_sample_dataset(filename: str, t0: str = "2000-01-01", periods: int = 10) -> str:
-    """Create a sample dataset for testing."""
-    # Create sample data
-    np.random.seed(42)  # For reproducible tests
-    data = np.random.random([periods, 3, 4])
-    ds = xr.Dataset(
-        {
-            "temperature": (("time", "lat", "lon"), data),
-            "pressure": (("time", "lat", "lon"), data * 1000),
-        },
-        coords={
-            "time": pd.date_range(t0, periods=periods),
-            "lat": [-10, 0, 10],
-            "lon": [20, 30, 40, 50],
-        },
-    )
-    
-    # Add valid range attributes for packing
-    ds["temperature"].attrs["valid_min"] = 0.0
-    ds["temperature"].attrs["valid_max"] = 1.0
-    ds["pressure"].attrs["valid_min"] = 0.0
-    ds["pressure"].attrs["valid_max"] = 1000.0
-    
-    # Add some attributes
-    ds.attrs["title"] = "Sample dataset"
-    ds["temperature"].attrs["units"] = "K"
-    ds["pressure"].attrs["units"] = "hPa"
-    
-    ds.to_netcdf(filename)
-    return filename
-
-
 def demonstrate_retry_logic():
     """Demonstrate retry logic for handling missing data."""
     print("=== zarrio Retry Logic Demo ===\n")
@@ -53,7 +21,7 @@ def demonstrate_retry_logic():
         # 1. Create sample data
         print("1. Creating sample data...")
         ncfile = os.path.join(tmpdir, "sample.nc")
-        create_sample_dataset(ncfile, t0="2000-01-01", periods=10)
+        write_sample(ncfile, t0="2000-01-01", periods=10)
         print(f"   Created {os.path.basename(ncfile)}")
         
         # 2. Demonstrate conversion with retry logic disabled (default)
@@ -75,7 +43,8 @@ def demonstrate_retry_logic():
         config = ZarrConverterConfig(
             missing_data=MissingDataConfig(
                 retries_on_missing=3,  # Enable 3 retries
-                missing_check_vars="all"
+                # Check only the primary variable; derived variables inherit the same missing mask
+                missing_check_vars=["temperature"]
             )
         )
         
@@ -89,11 +58,11 @@ def demonstrate_retry_logic():
         
         # Create initial dataset
         ncfile1 = os.path.join(tmpdir, "initial.nc")
-        create_sample_dataset(ncfile1, t0="2000-01-01", periods=5)
+        write_sample(ncfile1, t0="2000-01-01", periods=5)
         
         # Create additional dataset to append
         ncfile2 = os.path.join(tmpdir, "append.nc")
-        create_sample_dataset(ncfile2, t0="2000-01-06", periods=5)
+        write_sample(ncfile2, t0="2000-01-06", periods=5)
         
         # Convert initial dataset
         convert_to_zarr(ncfile1, zarrfile3)
@@ -104,7 +73,8 @@ def demonstrate_retry_logic():
             config=ZarrConverterConfig(
                 missing_data=MissingDataConfig(
                     retries_on_missing=2,  # Enable 2 retries
-                    missing_check_vars="all"
+                    # Check only the primary variable; derived variables inherit the same missing mask
+                    missing_check_vars=["temperature"]
                 )
             )
         )
@@ -115,15 +85,16 @@ def demonstrate_retry_logic():
         print("\n5. Parallel writing with retry logic...")
         zarrfile4 = os.path.join(tmpdir, "parallel_retry.zarr")
         
-        # Create template dataset
-        template_ds = xr.open_dataset(ncfile1)
+        # Open the template lazily; only coords and schema are needed
+        template_ds = xr.open_dataset(ncfile1, chunks={"time": 1})
         
         # Create converter with retry logic for parallel writing
         converter_parallel = ZarrConverter(
             config=ZarrConverterConfig(
                 missing_data=MissingDataConfig(
                     retries_on_missing=2,  # Enable 2 retries
-                    missing_check_vars="all"
+                    # Check only the primary variable; derived variables inherit the same missing mask
+                    missing_check_vars=["temperature"]
                 )
             )
         )
@@ -136,6 +107,7 @@ def demonstrate_retry_logic():
             global_end="2000-01-10",
             compute=False  # Metadata only
         )
+        template_ds.close()
         print(f"   ✓ Created template for parallel writing: {os.path.basename(zarrfile4)}")
         
         # Write regions with retry logic
@@ -145,21 +117,15 @@ def demonstrate_retry_logic():
         
         # 6. Verify results
         print("\n6. Verifying results...")
-        ds1 = xr.open_zarr(zarrfile1)
-        ds2 = xr.open_zarr(zarrfile2)
-        ds3 = xr.open_zarr(zarrfile3)
-        ds4 = xr.open_zarr(zarrfile4)
-        
-        print(f"   No retry Zarr: {len(ds1.time)} time steps")
-        print(f"   With retry Zarr: {len(ds2.time)} time steps")
-        print(f"   Append retry Zarr: {len(ds3.time)} time steps")
-        print(f"   Parallel retry Zarr: {len(ds4.time)} time steps")
-        
-        # Check that data was written correctly
-        print(f"   Temperature range in no retry Zarr: {float(ds1.temperature.min()):.3f} to {float(ds1.temperature.max()):.3f}")
-        print(f"   Temperature range in with retry Zarr: {float(ds2.temperature.min()):.3f} to {float(ds2.temperature.max()):.3f}")
-        print(f"   Temperature range in append retry Zarr: {float(ds3.temperature.min()):.3f} to {float(ds3.temperature.max()):.3f}")
-        print(f"   Temperature range in parallel retry Zarr: {float(ds4.temperature.min()):.3f} to {float(ds4.temperature.max()):.3f}")
+        # One read per store feeds the time count and the temperature range
+        for label, path in [
+            ("no retry", zarrfile1),
+            ("with retry", zarrfile2),
+            ("append retry", zarrfile3),
+            ("parallel retry", zarrfile4),
+        ]:
+            ntime, tmin, tmax = store_summary(path)
+            print(f"   {label.capitalize()} Zarr: {ntime} time steps, temperature {tmin:.3f} to {tmax:.3f}")
         
         print("\n=== Demo completed successfully! ===")
 
@@ -8,12 +8,21 @@ for different data access patterns.
 import numpy as np
 import pandas as pd
 import xarray as xr
+import dask.array as dsa
 import tempfile
 import os
+import gc
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 from zarrio import ZarrConverter
-from zarrio.models import ZarrConverterConfig, ChunkingConfig
+from zarrio.models import ZarrConverterConfig, ChunkingConfig, CompressionConfig
+
+# Shared generator; seeded once so each run of the script is reproducible
+_RNG = np.random.default_rng(42)
+
+# Threads for chunk reads; blosc releases the GIL while decoding
+_NUM_WORKERS = min(4, os.cpu_count() or 1)
 
 
 def create_sample_data():
@@ -22,10 +31,14 @@ def create_sample_data():
     lats = np.linspace(-90, 90, 181)
     lons = np.linspace(-180, 180, 361)
     
-    # Create random data with some structure
-    np.random.seed(42)
-    temperature = 20 + 10 * np.random.random((365, 181, 361))
-    pressure = 1013 + 50 * np.random.random((365, 181, 361))
+    # Create random float32 data in place (no float64 temporaries)
+    shape = (365, 181, 361)
+    temperature = _RNG.random(shape, dtype=np.float32)
+    np.multiply(temperature, np.float32(10), out=temperature)
+    np.add(temperature, np.float32(20), out=temperature)
+    pressure = _RNG.random(shape, dtype=np.float32)
+    np.multiply(pressure, np.float32(50), out=pressure)
+    np.add(pressure, np.float32(1013), out=pressure)
     
     ds = xr.Dataset(
         {
@@ -38,43 +51,59 @@ def create_sample_data():
             "lon": lons,
         },
     )
+    for var in ds.data_vars:
+        ds[var].encoding["dtype"] = "float32"
     
     return ds
 
 
-def time_series_access(ds):
+def time_series_access(arr):
     """Access time series at a fixed location."""
     # Extract time series for a fixed location
-    return ds.temperature[:, 90, 180].values
+    return arr[:, 90, 180]
 
 
-def spatial_slice_access(ds):
+def spatial_slice_access(arr):
     """Access spatial slice at a fixed time."""
     # Extract spatial slice for a fixed time
-    return ds.temperature[182, :, :].values
+    return arr[182, :, :]
+
+
+def build_zarr(input_path, output_path, chunking_config):
+    """Convert the input file to a Zarr store with a specific chunking."""
+    # lz4 keeps timings about access patterns rather than zstd decode cost
+    config = ZarrConverterConfig(
+        chunking=chunking_config,
+        compression=CompressionConfig(method="blosc:lz4"),
+    )
+    converter = ZarrConverter(config=config)
+    converter.convert(input_path, output_path)
+    return output_path
 
 
-def test_chunking_strategy(input_path, output_path, chunking_config, access_func, access_name):
+def time_access(output_path, access_func, n=5):
     """
-    Test a specific chunking strategy with an access pattern.
+    Time an access pattern against an existing Zarr store.
     
     Returns:
-        Time taken for access in seconds
+        Best time taken for access in seconds over ``n`` warm runs
     """
-    # Create Zarr with specific chunking
-    config = ZarrConverterConfig(chunking=chunking_config)
-    converter = ZarrConverter(config=config)
-    converter.convert(input_path, output_path)
+    # Wrap the raw zarr array (one dask chunk per zarr chunk) so only chunk
+    # fetch and decode is timed, spread over a thread pool
+    arr = dsa.from_zarr(output_path, component="temperature")
     
-    # Time the access pattern
-    ds = xr.open_zarr(output_path)
-    start = time.perf_counter()
-    result = access_func(ds)
-    end = time.perf_counter()
-    ds.close()
+    def run():
+        access_func(arr).compute(scheduler="threads", num_workers=_NUM_WORKERS)
     
-    return end - start
-
+    # Warm the page cache so timings reflect chunking rather than cold disk reads
+    run()
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    
+    return min(times)
 
 def main():
     """Run the speed comparison."""
@@ -85,24 +114,47 @@ def main():
         # Create and save sample data
         ds = create_sample_data()
         nc_file = os.path.join(tmpdir, "sample.nc")
-        ds.to_netcdf(nc_file)
+        # Chunk the NetCDF like the balanced Zarr layout and skip zlib so
+        # conversion reads whole, uncompressed HDF5 chunks
+        nc_encoding = {
+            var: {"dtype": "float32", "chunksizes": (30, 60, 90), "zlib": False}
+            for var in ds.data_vars
+        }
+        ds.to_netcdf(nc_file, encoding=nc_encoding)
+        # The in-memory source is no longer needed; free it before converting
+        del ds
+        gc.collect()
         
         # Define chunking strategies
         temporal_chunking = ChunkingConfig(time=100, lat=30, lon=60)
         spatial_chunking = ChunkingConfig(time=10, lat=90, lon=180)
         balanced_chunking = ChunkingConfig(time=30, lat=60, lon=90)
         
-        # Test temporal access pattern
-        print("\nTesting Temporal Access Pattern (time series at fixed location):")
-        print("-" * 60)
-        
         temporal_zarr = os.path.join(tmpdir, "temporal.zarr")
         spatial_zarr = os.path.join(tmpdir, "spatial.zarr")
         balanced_zarr = os.path.join(tmpdir, "balanced.zarr")
         
-        time_temporal = test_chunking_strategy(nc_file, temporal_zarr, temporal_chunking, time_series_access, "temporal")
-        time_spatial = test_chunking_strategy(nc_file, spatial_zarr, spatial_chunking, time_series_access, "temporal")
-        time_balanced = test_chunking_strategy(nc_file, balanced_zarr, balanced_chunking, time_series_access, "temporal")
+        # Convert once per chunking strategy, in parallel since the stores are
+        # independent; the timing runs below stay in this process and only read
+        with ProcessPoolExecutor(max_workers=3) as executor:
+            futures = {
+                name: executor.submit(build_zarr, nc_file, path, chunking)
+                for name, path, chunking in [
+                    ("temporal", temporal_zarr, temporal_chunking),
+                    ("spatial", spatial_zarr, spatial_chunking),
+                    ("balanced", balanced_zarr, balanced_chunking),
+                ]
+            }
+            for future in futures.values():
+                future.result()
+        
+        # Test temporal access pattern
+        print("\nTesting Temporal Access Pattern (time series at fixed location):")
+        print("-" * 60)
+        
+        time_temporal = time_access(temporal_zarr, time_series_access)
+        time_spatial = time_access(spatial_zarr, time_series_access)
+        time_balanced = time_access(balanced_zarr, time_series_access)
         
         print(f"Temporal chunking (time=100):     {time_temporal:.4f}s")
         print(f"Spatial chunking (time=10):       {time_spatial:.4f}s")
@@ -112,9 +164,9 @@ def main():
         print("\nTesting Spatial Access Pattern (spatial slice at fixed time):")
         print("-" * 60)
         
-        time_temporal = test_chunking_strategy(nc_file, temporal_zarr, temporal_chunking, spatial_slice_access, "spatial")
-        time_spatial = test_chunking_strategy(nc_file, spatial_zarr, spatial_chunking, spatial_slice_access, "spatial")
-        time_balanced = test_chunking_strategy(nc_file, balanced_zarr, balanced_chunking, spatial_slice_access, "spatial")
+        time_temporal = time_access(temporal_zarr, spatial_slice_access)
+        time_spatial = time_access(spatial_zarr, spatial_slice_access)
+        time_balanced = time_access(balanced_zarr, spatial_slice_access)
         
         print(f"Temporal chunking (lat=30, lon=60):  {time_temporal:.4f}s")
         print(f"Spatial chunking (lat=90, lon=180):  {time_spatial:.4f}s")
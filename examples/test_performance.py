@@ -8,6 +8,21 @@ import pandas as pd
 import tempfile
 import os
 
+from zarrio.cli import main as cli_main
+
+try:
+    import h5netcdf  # noqa: F401
+
+    NC_ENGINE = "h5netcdf"
+except ImportError:
+    NC_ENGINE = None
+
+# Keep scratch files in RAM when a tmpfs is available
+TMPDIR_BASE = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Shared generator; seeded once so each run of the script is reproducible
+_RNG = np.random.default_rng(42)
+
 
 def create_sample_dataset():
     """Create a sample dataset for testing."""
@@ -17,8 +32,13 @@ def create_sample_dataset():
     lon = np.linspace(-180, 180, 72)
 
     # Create temperature data with known range
-    temperature = 20 + 10 * np.random.randn(20, 36, 72)  # Mean 20°C, std 10°C
-    pressure = 101325 + 5000 * np.random.randn(20, 36, 72)  # Mean ~101325 Pa
+    # Build float32 fields in place to avoid float64 temporaries
+    temperature = _RNG.standard_normal((20, 36, 72), dtype=np.float32)
+    np.multiply(temperature, np.float32(10), out=temperature)  # std 10°C
+    np.add(temperature, np.float32(20), out=temperature)  # Mean 20°C
+    pressure = _RNG.standard_normal((20, 36, 72), dtype=np.float32)
+    np.multiply(pressure, np.float32(5000), out=pressure)
+    np.add(pressure, np.float32(101325), out=pressure)  # Mean ~101325 Pa
 
     # Create dataset
     ds = xr.Dataset(
@@ -37,6 +57,8 @@ def create_sample_dataset():
     ds["temperature"].attrs["valid_min"] = -50.0
     ds["temperature"].attrs["valid_max"] = 50.0
     ds["pressure"].attrs["units"] = "Pa"
+    for var in ds.data_vars:
+        ds[var].encoding["dtype"] = "float32"
 
     return ds
 
@@ -47,18 +69,19 @@ def main():
     ds = create_sample_dataset()
 
     # Save as NetCDF
-    with tempfile.NamedTemporaryFile(suffix=".nc", delete=False) as tmp_nc:
-        nc_path = tmp_nc.name
-
-    ds.to_netcdf(nc_path)
-    print(f"Saved sample dataset to {nc_path}")
-
-    # Test the analyze command with performance testing
-    print("\nTesting analyze command with performance testing...")
-    os.system(f"python -m zarrio.cli analyze {nc_path} --test-performance")
+    with tempfile.TemporaryDirectory(dir=TMPDIR_BASE) as tmpdir:
+        nc_path = os.path.join(tmpdir, "sample.nc")
+        ds.to_netcdf(nc_path, engine=NC_ENGINE)
+        print(f"Saved sample dataset to {nc_path}")
+
+        # Test the analyze command with performance testing
+        print("\nTesting analyze command with performance testing...")
+        # Run the CLI in-process to reuse the already imported modules
+        try:
+            cli_main(["analyze", nc_path, "--test-performance"])
+        except SystemExit as e:
+            print(f"Analyze command exited with status {e.code}")
 
-    # Clean up
-    os.unlink(nc_path)
     print("\nTest completed!")
 
 
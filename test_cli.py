@@ -2,6 +2,8 @@
 Example demonstrating CLI functionality of zarrio.
 """
 
+import contextlib
+import io
 import sys
 import os
 import tempfile
@@ -13,6 +15,8 @@ import xarray as xr
 # Add the zarrio directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
 
+from zarrio.cli import main as cli_main
+
 
 def create_sample_data(filename: str) -> str:
     """Create sample NetCDF data."""
@@ -34,6 +38,15 @@ def create_sample_data(filename: str) -> str:
     return filename
 
 
+def run_cli(argv: list) -> int:
+    """Run the CLI in-process and return its exit status."""
+    try:
+        cli_main(argv)
+    except SystemExit as e:
+        return e.code or 0
+    return 0
+
+
 def test_cli_functionality():
     """Test CLI functionality."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -43,7 +56,7 @@ def test_cli_functionality():
         
         print(f"Created sample data: {ncfile}")
         
-        # Test help command
+        # Test help command through the module entry point
         print("\n1. Testing help command:")
         result = subprocess.run([
             sys.executable, "-m", "zarrio.cli", "--help"
@@ -58,12 +71,9 @@ def test_cli_functionality():
         # Test convert command
         print("\n2. Testing convert command:")
         zarrfile = os.path.join(tmpdir, "output.zarr")
-        result = subprocess.run([
-            sys.executable, "-m", "zarrio.cli", "convert",
-            ncfile, zarrfile
-        ], capture_output=True, text=True)
+        returncode = run_cli(["convert", ncfile, zarrfile])
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✓ Convert command works")
             if os.path.exists(zarrfile):
                 print("✓ Zarr file created successfully")
@@ -71,19 +81,15 @@ def test_cli_functionality():
                 print("✗ Zarr file not created")
                 return False
         else:
-            print(f"✗ Convert command failed: {result.stderr}")
+            print(f"✗ Convert command failed with status {returncode}")
             return False
         
         # Test convert with chunking
         print("\n3. Testing convert with chunking:")
         zarrfile2 = os.path.join(tmpdir, "output2.zarr")
-        result = subprocess.run([
-            sys.executable, "-m", "zarrio.cli", "convert",
-            ncfile, zarrfile2,
-            "--chunking", "time:5,lat:3"
-        ], capture_output=True, text=True)
+        returncode = run_cli(["convert", ncfile, zarrfile2, "--chunking", "time:5,lat:3"])
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✓ Convert with chunking works")
             if os.path.exists(zarrfile2):
                 print("✓ Zarr file created successfully")
@@ -91,20 +97,20 @@ def test_cli_functionality():
                 print("✗ Zarr file not created")
                 return False
         else:
-            print(f"✗ Convert with chunking failed: {result.stderr}")
+            print(f"✗ Convert with chunking failed with status {returncode}")
             return False
         
         # Test version command
         print("\n4. Testing version command:")
-        result = subprocess.run([
-            sys.executable, "-m", "zarrio.cli", "--version"
-        ], capture_output=True, text=True)
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            returncode = run_cli(["--version"])
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✓ Version command works")
-            print(f"  Version: {result.stdout.strip()}")
+            print(f"  Version: {stdout.getvalue().strip()}")
         else:
-            print(f"✗ Version command failed: {result.stderr}")
+            print(f"✗ Version command failed with status {returncode}")
             return False
         
         return True
@@ -8,6 +8,7 @@ import xarray as xr
 import pandas as pd
 import tempfile
 import os
+import math
 
 from zarrio.chunking import ChunkAnalyzer, get_chunk_recommendation, validate_chunking
 from zarrio.core import ZarrConverter
@@ -102,6 +103,27 @@ def test_chunk_recommendation_balanced():
     assert recommendation.strategy == "balanced"
 
 
+def test_chunk_recommendation_even_chunks():
+    """Test that recommended chunks split dimensions into near-equal pieces."""
+    dimensions = {"time": 365, "lat": 181, "lon": 361}
+    
+    for access_pattern in ["temporal", "spatial", "balanced"]:
+        recommendation = get_chunk_recommendation(
+            dimensions=dimensions,
+            access_pattern=access_pattern,
+            target_chunk_size_mb=1
+        )
+        for dim, chunk in recommendation.chunks.items():
+            size = dimensions[dim]
+            if 1 < chunk < size:
+                # A smaller chunk would need more chunks along the dimension
+                assert math.ceil(size / (chunk - 1)) > math.ceil(size / chunk), (access_pattern, dim, chunk)
+    
+    analyzer = ChunkAnalyzer()
+    assert analyzer._even_out_chunks({"lat": 90}, {"lat": 181}) == {"lat": 91}
+    assert analyzer._even_out_chunks({"lat": 200}, {"lat": 181}) == {"lat": 200}
+
+
 def test_chunk_validation():
     """Test chunk validation."""
     # Define dimensions
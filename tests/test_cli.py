@@ -2,6 +2,7 @@
 Tests for zarrio CLI functionality.
 """
 
+import argparse
 import pytest
 import tempfile
 import os
@@ -9,7 +10,16 @@ import subprocess
 import sys
 from pathlib import Path
 
-from zarrio.cli import parse_chunking
+from zarrio.cli import main as cli_main, parse_chunking, parse_region, _build_config_dict
+
+
+def run_cli(argv: list) -> int:
+    """Run the CLI in-process and return its exit status."""
+    try:
+        cli_main(argv)
+    except SystemExit as e:
+        return e.code or 0
+    return 0
 
 
 def test_parse_chunking():
@@ -29,6 +39,49 @@ def test_parse_chunking():
     assert parse_chunking("time: 100, lat: 50") == {"time": 100, "lat": 50}
 
 
+@pytest.mark.parametrize("chunking_str", ["time:5,lat:abc", "time:-1", "time", "time=5"])
+def test_parse_chunking_invalid(chunking_str):
+    """Test that malformed chunking entries are rejected."""
+    with pytest.raises(ValueError, match="Invalid chunking entry"):
+        parse_chunking(chunking_str)
+
+
+def test_parse_region():
+    """Test parsing region strings."""
+    assert parse_region("time=0:100") == {"time": slice(0, 100)}
+    assert parse_region("time=0:100, lat = 10:50") == {
+        "time": slice(0, 100), "lat": slice(10, 50)
+    }
+
+
+@pytest.mark.parametrize("region_str", ["time=0-10", "time=0:100,lat", "time:0:10"])
+def test_parse_region_invalid(region_str):
+    """Test that malformed region entries are rejected."""
+    with pytest.raises(ValueError, match="Invalid region entry"):
+        parse_region(region_str)
+
+
+def test_build_config_dict():
+    """Test building config overrides from parsed arguments."""
+    # Options a subcommand doesn't define are skipped
+    args = argparse.Namespace(
+        config=None, chunking="time:10", compression="blosc:zstd:1",
+        packing=True, packing_bits=12, keepbits=0, packing_store_as_int=True, time_dim="t",
+        attrs='{"title": "Test"}', datamesh_datasource=None,
+    )
+    assert _build_config_dict(args) == {
+        "chunking": {"time": 10},
+        "compression": {"method": "blosc:zstd:1"},
+        "packing": {"enabled": True, "bits": 12, "keepbits": 0, "store_as_int": True},
+        "time": {"dim": "t"},
+        "attrs": '{"title": "Test"}',
+    }
+    
+    # Unset options don't override anything
+    args = argparse.Namespace(config=None, chunking=None, append_dim=None)
+    assert _build_config_dict(args) == {}
+
+
 def create_test_dataset(filename: str, output: str = "netcdf"):
     """Create a simple test dataset."""
     import numpy as np
@@ -65,13 +118,10 @@ def test_cli_convert():
         create_test_dataset(ncfile)
         
         # Run convert command
-        result = subprocess.run([
-            sys.executable, "-m", "zarrio.cli", "convert",
-            ncfile, zarrfile
-        ], capture_output=True, text=True)
+        returncode = run_cli(["convert", ncfile, zarrfile])
         
         # Check that command succeeded
-        assert result.returncode == 0
+        assert returncode == 0
         
         # Check that output file was created
         assert os.path.exists(zarrfile)
@@ -86,14 +136,10 @@ def test_cli_convert_with_chunking():
         create_test_dataset(ncfile)
         
         # Run convert command with chunking
-        result = subprocess.run([
-            sys.executable, "-m", "zarrio.cli", "convert",
-            ncfile, zarrfile,
-            "--chunking", "time:3,lat:2"
-        ], capture_output=True, text=True)
+        returncode = run_cli(["convert", ncfile, zarrfile, "--chunking", "time:3,lat:2"])
         
         # Check that command succeeded
-        assert result.returncode == 0
+        assert returncode == 0
         
         # Check that output file was created
         assert os.path.exists(zarrfile)
@@ -132,22 +178,18 @@ def test_cli_convert_with_packing():
         ds.to_netcdf(ncfile)
         
         # Run convert command with packing
-        result = subprocess.run([
-            sys.executable, "-m", "zarrio.cli", "convert",
-            ncfile, zarrfile,
-            "--packing", "--packing-bits", "16"
-        ], capture_output=True, text=True)
+        returncode = run_cli(["convert", ncfile, zarrfile, "--packing", "--packing-bits", "16"])
         
         # Check that command succeeded
-        assert result.returncode == 0
+        assert returncode == 0
         
         # Check that output file was created
         assert os.path.exists(zarrfile)
 
 
 def test_cli_help():
-    """Test CLI help command."""
-    # Run help command
+    """Test CLI help command through the module entry point."""
+    # Run help command in a subprocess to check the `python -m` wiring
     result = subprocess.run([
         sys.executable, "-m", "zarrio.cli", "--help"
     ], capture_output=True, text=True)
@@ -161,19 +203,42 @@ def test_cli_help():
     assert "append" in result.stdout
 
 
-def test_cli_version():
+def test_cli_version(capsys):
     """Test CLI version command."""
     # Run version command
-    result = subprocess.run([
-        sys.executable, "-m", "zarrio.cli", "--version"
-    ], capture_output=True, text=True)
+    returncode = run_cli(["--version"])
     
     # Check that command succeeded
-    assert result.returncode == 0
+    assert returncode == 0
     
     # Check that version is in output
-    assert "zarrio" in result.stdout
+    assert "zarrio" in capsys.readouterr().out
+
+
+def test_cli_version_skips_heavy_imports():
+    """Test that the CLI answers --version without importing xarray."""
+    code = (
+        "import sys\n"
+        "from zarrio.cli import main\n"
+        "try:\n"
+        "    main(['--version'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'xarray' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_public_api_names():
+    """Test that the lazily imported package API matches zarrio.api."""
+    import zarrio
+    import zarrio.api
 
+    assert set(zarrio.__all__) == set(zarrio.api.__all__)
+    assert zarrio.ZarrConverter is zarrio.api.ZarrConverter
+    with pytest.raises(AttributeError):
+        zarrio.not_a_name
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -137,6 +137,47 @@ def test_convert_with_chunking():
         # Note: Actual chunk verification would require checking dask arrays
 
 
+def test_convert_chunked_netcdf_layout():
+    """Test that unconfigured dimensions are not split by the source's chunks."""
+    import warnings
+    import zarr
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ncfile = os.path.join(tmpdir, "chunked.nc")
+        zarrfile = os.path.join(tmpdir, "test.zarr")
+        ds = xr.Dataset(
+            {"temperature": (("time", "lat", "lon"), np.random.random((10, 40, 50)))},
+            coords={"time": pd.date_range("2000-01-01", periods=10)},
+        )
+        ds.to_netcdf(ncfile, encoding={"temperature": {"chunksizes": (1, 10, 10)}})
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UserWarning)
+            convert_to_zarr(ncfile, zarrfile, chunking={"time": 5})
+        
+        assert zarr.open(zarrfile, mode="r")["temperature"].chunks == (5, 40, 50)
+
+
+def test_compressor_blocksize_follows_zarr_chunks():
+    """Test that the Blosc block size is set from the chunks written, not the input's."""
+    import zarr
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ncfile = os.path.join(tmpdir, "chunked.nc")
+        zarrfile = os.path.join(tmpdir, "test.zarr")
+        ds = xr.Dataset(
+            {"temperature": (("time", "lat", "lon"), np.random.random((10, 40, 50)))},
+            coords={"time": pd.date_range("2000-01-01", periods=10)},
+        )
+        ds.to_netcdf(ncfile, encoding={"temperature": {"chunksizes": (1, 10, 10)}})
+        
+        convert_to_zarr(ncfile, zarrfile, chunking={"time": 5}, compression="blosc:zstd:3")
+        
+        arr = zarr.open(zarrfile, mode="r")["temperature"]
+        assert arr.chunks == (5, 40, 50)
+        assert arr.compressor.blocksize == 5 * 40 * 50 * 8
+
+
 def test_convert_with_variables():
     """Test conversion with variable selection."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -218,6 +259,81 @@ def test_append_to_zarr():
         assert ds_zarr["time"].values[-1] == ds_combined["time"].values[-1]
 
 
+def test_append_multiple_files():
+    """Test appending several files in order in one call."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        zarrfile = os.path.join(tmpdir, "test.zarr")
+        ncfiles = []
+        for i, t0 in enumerate(["2000-01-01", "2000-01-06", "2000-01-11", "2000-01-16"]):
+            ncfiles.append(os.path.join(tmpdir, f"test{i}.nc"))
+            create_test_dataset(ncfiles[-1], t0=t0, periods=5)
+        
+        convert_to_zarr(ncfiles[0], zarrfile)
+        append_to_zarr(ncfiles[1:], zarrfile)
+        
+        expected = xr.concat([xr.load_dataset(f) for f in ncfiles], dim="time")
+        ds_zarr = xr.open_zarr(zarrfile)
+        np.testing.assert_array_equal(ds_zarr["time"].values, expected["time"].values)
+        np.testing.assert_allclose(ds_zarr["temperature"].values, expected["temperature"].values)
+
+
+def test_append_failed_prefetch():
+    """Test that an input failing to prefetch is opened again when appended."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        zarrfile = os.path.join(tmpdir, "test.zarr")
+        ncfiles = []
+        for i, t0 in enumerate(["2000-01-01", "2000-01-06", "2000-01-11"]):
+            ncfiles.append(os.path.join(tmpdir, f"test{i}.nc"))
+            create_test_dataset(ncfiles[-1], t0=t0, periods=5)
+        
+        converter = ZarrConverter()
+        converter.convert(ncfiles[0], zarrfile)
+        
+        open_input = converter._open_input
+        failed = []
+        
+        def flaky_open_input(path, *args):
+            if path == ncfiles[2] and not failed:
+                failed.append(path)
+                raise OSError("temporarily unavailable")
+            return open_input(path, *args)
+        
+        converter._open_input = flaky_open_input
+        converter.append(ncfiles[1:], zarrfile)
+        
+        assert failed == [ncfiles[2]]
+        with xr.open_zarr(zarrfile) as ds_zarr:
+            assert ds_zarr.sizes["time"] == 15
+
+
+def test_append_failure_closes_prefetched_input():
+    """Test that the prefetched next input is closed when an append fails."""
+    import threading
+    from unittest.mock import Mock
+    
+    converter = ZarrConverter()
+    prefetched = Mock()
+    opened = threading.Event()
+    
+    def open_input(*args):
+        opened.set()
+        return prefetched
+    
+    def append_with_retry(*args):
+        # Fail once the next input has been prefetched
+        opened.wait(5)
+        raise OSError("store unavailable")
+    
+    converter._open_input = Mock(side_effect=open_input)
+    converter._append_with_retry = Mock(side_effect=append_with_retry)
+    
+    with pytest.raises(ConversionError):
+        converter.append(["first.nc", "second.nc"], "archive.zarr")
+    
+    converter._open_input.assert_called_once_with("second.nc", None, None)
+    prefetched.close.assert_called_once_with()
+
+
 def test_converter_with_packing():
     """Test ZarrConverter with data packing."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -261,6 +377,102 @@ def test_converter_with_packing():
         assert os.path.exists(zarrfile)
 
 
+@pytest.mark.parametrize("bits", [2, 3])
+def test_converter_packing_low_widths(bits):
+    """Test that data packed into few bits is read back without spurious missing values."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ncfile = os.path.join(tmpdir, "test.nc")
+        zarrfile = os.path.join(tmpdir, "test.zarr")
+        
+        data = np.array([[0.0, 0.5], [1.0, np.nan]])
+        ds = xr.Dataset(
+            {"temperature": (("time", "lon"), data)},
+            coords={"time": pd.date_range("2000-01-01", periods=2), "lon": [20, 30]},
+        )
+        ds["temperature"].attrs.update(valid_min=0.0, valid_max=1.0)
+        ds.to_netcdf(ncfile)
+        
+        ZarrConverter(packing=True, packing_bits=bits).convert(ncfile, zarrfile)
+        
+        with xr.open_zarr(zarrfile) as result:
+            values = result["temperature"].values
+        assert np.isnan(values[1, 1])
+        assert np.isnan(values).sum() == 1
+        np.testing.assert_allclose(values, data, atol=1 / (2**bits - 2))
+
+
+def test_converter_packing_rejects_one_bit():
+    """Test that one-bit packing, which leaves no room beside the fill value, is rejected."""
+    with pytest.raises(ValueError):
+        ZarrConverter(packing=True, packing_bits=1)
+
+
+def test_packed_variables_keep_compressor():
+    """Test that packed variables are compressed as configured for their stored dtype."""
+    import zarr
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ncfile = create_test_dataset(os.path.join(tmpdir, "test.nc"))
+        zarrfile = os.path.join(tmpdir, "test.zarr")
+
+        converter = ZarrConverter(
+            compression="blosc:zstd:3", packing=True, packing_bits=16
+        )
+        converter.convert(ncfile, zarrfile)
+
+        compressor = zarr.open(zarrfile, mode="r")["temperature"].compressor
+        assert compressor.cname == "zstd"
+        assert compressor.clevel == 3
+        # The int16 container is bit-shuffled, unlike float64 source data
+        assert "BITSHUFFLE" in repr(compressor)
+
+
+def test_compressor_shuffle_defaults():
+    """Test that the Blosc shuffle defaults to bitshuffle for narrow dtypes."""
+    converter = ZarrConverter(compression="blosc:zstd:3")
+    narrow = converter._create_compressor(np.dtype("float32"))
+    wide = converter._create_compressor(np.dtype("float64"))
+    assert "BITSHUFFLE" in repr(narrow)
+    assert "BITSHUFFLE" not in repr(wide)
+
+    # Explicit shuffle field takes precedence
+    converter = ZarrConverter(compression="blosc:lz4:5:noshuffle")
+    compressor = converter._create_compressor(np.dtype("float32"))
+    assert compressor.cname == "lz4"
+    assert compressor.clevel == 5
+    
+    # Bitshuffle shorthand
+    converter = ZarrConverter(compression="bitshuffle")
+    compressor = converter._create_compressor(np.dtype("float64"))
+    assert compressor.cname == "lz4"
+    assert compressor.clevel == 1
+    assert "BITSHUFFLE" in repr(compressor)
+
+
+def test_compressor_blocksize():
+    """Test that Blosc blocks cover the chunk up to the configured limit."""
+    converter = ZarrConverter(compression="blosc:zstd:3")
+    assert converter._create_compressor(np.dtype("float32"), 4000).blocksize == 4000
+    assert converter._create_compressor(np.dtype("float32"), 2**30).blocksize == 256 * 1024
+
+    converter = ZarrConverter(compression="blosc:zstd:9")
+    assert converter._create_compressor(np.dtype("float32"), 2**30).blocksize == 1024 * 1024
+
+    config = ZarrConverterConfig(
+        compression=CompressionConfig(method="blosc:zstd:3", blocksize=0)
+    )
+    converter = ZarrConverter(config=config)
+    assert converter._create_compressor(np.dtype("float32"), 4000).blocksize == 0
+
+
+def test_compressor_shared():
+    """Test that compressors with the same settings are shared."""
+    first = ZarrConverter(compression="blosc:zstd:3")._create_compressor(np.dtype("float32"), 4000)
+    second = ZarrConverter(compression="blosc:zstd:3")._create_compressor(np.dtype("int32"), 4000)
+    assert first is second
+    assert ZarrConverter(compression="blosc:zstd:4")._create_compressor(np.dtype("float32"), 4000) is not first
+
+
 def test_conversion_error_handling():
     """Test error handling in conversion."""
     with tempfile.TemporaryDirectory() as tmpdir:
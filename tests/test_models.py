@@ -2,6 +2,7 @@
 Tests for Pydantic models in zarrio.
 """
 
+import os
 import pytest
 import tempfile
 import json
@@ -16,6 +17,7 @@ from zarrio.models import (
     TimeConfig,
     VariableConfig,
     MissingDataConfig,
+    IOConfig,
     load_config_from_file
 )
 
@@ -48,7 +50,14 @@ def test_packing_config():
     
     # Test bit validation
     with pytest.raises(ValueError):
-        PackingConfig(bits=12)  # Invalid bits
+        PackingConfig(bits=64)  # Invalid bits
+    with pytest.raises(ValueError):
+        PackingConfig(bits=1)  # No codes left beside the fill value
+    
+    # Test float dtype validation
+    assert PackingConfig(float_dtype="float16").float_dtype == "float16"
+    with pytest.raises(ValueError):
+        PackingConfig(float_dtype="bfloat16")
 
 
 def test_compression_config():
@@ -67,6 +76,16 @@ def test_compression_config():
     assert config.clevel == 1
     assert config.shuffle == "shuffle"
 
+    # Test shuffle field in method
+    config = CompressionConfig(method="blosc:zstd:3:bitshuffle")
+    assert config.method == "blosc:zstd:3:bitshuffle"
+
+    # Test method validation
+    with pytest.raises(ValueError):
+        CompressionConfig(method="blosc:zstd:10")
+    with pytest.raises(ValueError):
+        CompressionConfig(method="blosc:zstd:3:byteshuffle")
+
 
 def test_time_config():
     """Test TimeConfig model."""
@@ -98,6 +117,15 @@ def test_variable_config():
     assert config.exclude is None
 
 
+def test_io_config():
+    """Test IOConfig model."""
+    assert IOConfig().concurrency is None
+    assert IOConfig(concurrency=8).concurrency == 8
+    
+    with pytest.raises(ValueError):
+        IOConfig(concurrency=0)
+
+
 def test_zarr_converter_config():
     """Test ZarrConverterConfig model."""
     # Test valid configuration
@@ -148,6 +176,13 @@ def test_nested_config_creation():
     assert config.variables.exclude == ["humidity"]
     assert config.attrs["title"] == "Test dataset"
 
+    # Attributes given as a JSON string (as on the command line) are parsed
+    config = ZarrConverterConfig(attrs='{"title": "Test dataset", "version": 2}')
+    assert config.attrs == {"title": "Test dataset", "version": 2}
+    
+    with pytest.raises(ValueError):
+        ZarrConverterConfig(attrs="{not json")
+
 
 def test_config_from_yaml_file():
     """Test loading configuration from YAML file."""
@@ -215,6 +250,29 @@ def test_config_from_json_file():
         assert config.attrs["title"] == "Test dataset"
 
 
+def test_config_from_file_reloads_on_change():
+    """Test that cached configurations are refreshed when the file changes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_file = Path(tmpdir) / "config.yaml"
+        with open(config_file, "w") as f:
+            yaml.dump({"chunking": {"time": 100}}, f)
+        
+        config = load_config_from_file(config_file)
+        assert config.chunking.time == 100
+        
+        # Mutating a loaded config must not leak into later loads
+        config.chunking.time = 1
+        assert load_config_from_file(config_file).chunking.time == 100
+        
+        # Rewrite with a newer modification time
+        with open(config_file, "w") as f:
+            yaml.dump({"chunking": {"time": 50}}, f)
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        assert load_config_from_file(config_file).chunking.time == 50
+
+
 def test_invalid_config_file():
     """Test handling of invalid configuration files."""
     with tempfile.TemporaryDirectory() as tmpdir:
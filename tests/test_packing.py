@@ -3,11 +3,27 @@ Tests for zarrio packing functionality.
 """
 
 import pytest
+import tempfile
+import os
+import subprocess
+import sys
 import numpy as np
 import xarray as xr
 import pandas as pd
+import dask.array as dsa
 
-from zarrio.packing import Packer, FixedScaleOffset
+from zarrio.packing import (
+    Packer, FixedScaleOffset, FusedScaleOffset, BitPack, BitRound, _RANGE_BLOCK, _data_range,
+    _data_ranges,
+)
+
+_RNG = np.random.default_rng(0)
+
+
+@pytest.fixture(scope="module")
+def random_3d():
+    """Shared (time, lat, lon) sample data in [0, 100); treat as read-only."""
+    return _RNG.uniform(0, 100, (5, 3, 4))
 
 
 def test_packer_initialization():
@@ -22,9 +38,15 @@ def test_packer_initialization():
     packer = Packer(nbits=32)
     assert packer.nbits == 32
     
+    # Test non-native widths
+    packer = Packer(nbits=10)
+    assert packer.container_dtype == "int16"
+    
     # Test invalid nbits
     with pytest.raises(ValueError):
-        Packer(nbits=10)
+        Packer(nbits=1)
+    with pytest.raises(ValueError):
+        Packer(nbits=33)
 
 
 def test_compute_scale_and_offset():
@@ -33,21 +55,161 @@ def test_compute_scale_and_offset():
     
     # Test normal case
     scale, offset = packer.compute_scale_and_offset(0.0, 100.0)
-    expected_scale = 100.0 / (2**16 - 1)
-    expected_offset = 0.0 + 2**15 * expected_scale
+    expected_scale = 100.0 / (2**16 - 2)
+    expected_offset = 50.0
     assert abs(scale - expected_scale) < 1e-10
     assert abs(offset - expected_offset) < 1e-10
     
     # Test equal min and max
     scale, offset = packer.compute_scale_and_offset(50.0, 50.0)
     assert scale == 1.0
-    assert offset == 50.0 + 2**15 * 1.0
+    assert offset == 50.0
+    
+    # Test array input matches scalar input
+    scales, offsets = packer.compute_scale_and_offset(
+        np.array([0.0, 50.0, -5.0]), np.array([100.0, 50.0, 40.0])
+    )
+    for i, (vmin, vmax) in enumerate([(0.0, 100.0), (50.0, 50.0), (-5.0, 40.0)]):
+        assert (scales[i], offsets[i]) == packer.compute_scale_and_offset(vmin, vmax)
+    
+    # Test inverse scale matches the scale
+    inv_scales, inv_offsets = packer.compute_inv_scale_and_offset(
+        np.array([0.0, 50.0, -5.0]), np.array([100.0, 50.0, 40.0])
+    )
+    np.testing.assert_allclose(inv_scales, 1 / scales, rtol=1e-12)
+    np.testing.assert_allclose(inv_offsets, offsets, rtol=1e-12)
+    assert packer.compute_inv_scale_and_offset(50.0, 50.0) == (1.0, 50.0)
+
+
+def test_fused_scale_offset_matches_fixed_scale_offset():
+    """Test that the fused filter encodes exactly like FixedScaleOffset."""
+    if FusedScaleOffset is None:
+        pytest.skip("zarr not available")
+    
+    packer = Packer(nbits=16)
+    scale_factor, offset = packer.compute_scale_and_offset(-5.0, 40.0)
+    kwargs = dict(offset=offset, scale=1 / scale_factor, dtype="float32", astype="int16")
+    fused = FusedScaleOffset(**kwargs)
+    fixed = FixedScaleOffset(**kwargs)
+    
+    data = (_RNG.random(1000) * 45 - 5).astype("float32")
+    encoded = fused.encode(data)
+    np.testing.assert_array_equal(encoded, fixed.encode(data))
+    assert encoded.dtype == np.int16
+    
+    # Config is the stock codec's, so any reader can decode it
+    assert fused.get_config() == fixed.get_config()
+    np.testing.assert_allclose(fixed.decode(encoded), data, atol=scale_factor)
 
 
-def test_add_valid_range_attributes():
+@pytest.mark.parametrize("nbits", [1, 3, 7, 12, 24])
+def test_bitpack_roundtrip(nbits):
+    """Test that BitPack stores exactly nbits per element and round-trips."""
+    if BitPack is None:
+        pytest.skip("zarr not available")
+    
+    container = "int8" if nbits <= 8 else "int16" if nbits <= 16 else "int32"
+    lo, hi = -(2 ** (nbits - 1)), 2 ** (nbits - 1) - 1
+    data = _RNG.integers(lo, hi + 1, size=1001).astype(container)
+    data[:2] = [lo, hi]
+    
+    codec = BitPack(nbits=nbits, dtype=container)
+    encoded = codec.encode(data)
+    assert encoded.nbytes == 4 + (data.size * nbits + 7) // 8
+    
+    # Layout is a plain big-endian bit stream of the offset values
+    words = (data.astype("<i8") - lo).astype(">u4")
+    bits = np.unpackbits(words.view(np.uint8).reshape(-1, 4), axis=1)[:, 32 - nbits:]
+    np.testing.assert_array_equal(encoded[4:], np.packbits(bits))
+    np.testing.assert_array_equal(codec.decode(encoded), data)
+
+
+def test_setup_encoding_bitpacked(random_3d):
+    """Test that non-native widths add a BitPack filter and round-trip through zarr."""
+    if BitPack is None:
+        pytest.skip("zarr not available")
+    
+    data = random_3d
+    ds = xr.Dataset({"temperature": (("time", "lat", "lon"), data)})
+    ds["temperature"].attrs["valid_min"] = 0.0
+    ds["temperature"].attrs["valid_max"] = 100.0
+    
+    packer = Packer(nbits=12)
+    encoding = packer.setup_encoding(ds)
+    filters = encoding["temperature"]["filters"]
+    assert isinstance(filters[0], FixedScaleOffset)
+    assert isinstance(filters[1], BitPack) and filters[1].nbits == 12
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "packed.zarr")
+        ds.to_zarr(path, encoding=encoding)
+        result = xr.open_zarr(path)["temperature"].values
+    scale_factor, _ = packer.compute_scale_and_offset(0.0, 100.0)
+    np.testing.assert_allclose(result, data, atol=scale_factor)
+
+
+def test_bitpacked_store_readable_after_import(random_3d):
+    """Test that a bit-packed store opens in a new interpreter after only importing zarrio."""
+    if BitPack is None:
+        pytest.skip("zarr not available")
+    
+    ds = xr.Dataset({"temperature": (("time", "lat", "lon"), random_3d)})
+    encoding = Packer(nbits=12).setup_encoding(
+        ds, manual_ranges={"temperature": {"min": 0, "max": 100}}
+    )
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "packed.zarr")
+        ds.to_zarr(path, encoding=encoding)
+        code = (
+            "import sys\n"
+            "import xarray as xr\n"
+            "import zarrio\n"
+            "xr.open_zarr(sys.argv[1])['temperature'].values\n"
+            "assert zarrio.packing.Packer is zarrio.Packer\n"
+            "assert zarrio.core.ZarrConverter is zarrio.ZarrConverter\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code, path], capture_output=True, text=True
+        )
+    assert result.returncode == 0, result.stderr
+
+
+def test_setup_encoding_bitround(random_3d):
+    """Test that keepbits adds a BitRound filter ahead of packing."""
+    if BitRound is None:
+        pytest.skip("zarr not available")
+    
+    data = random_3d
+    ds = xr.Dataset({"temperature": (("time", "lat", "lon"), data)})
+    ds["temperature"].attrs["valid_min"] = 0.0
+    ds["temperature"].attrs["valid_max"] = 100.0
+    
+    filters = Packer(nbits=16, keepbits=10).setup_encoding(ds)["temperature"]["filters"]
+    assert isinstance(filters[0], BitRound) and filters[0].keepbits == 10
+    assert isinstance(filters[1], FixedScaleOffset)
+    
+    # Bit-rounding on its own keeps the dtype and zeros trailing mantissa bits
+    encoding = Packer(keepbits=7).setup_bitround_encoding(ds.astype("float32"))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "rounded.zarr")
+        ds.astype("float32").to_zarr(path, encoding=encoding)
+        result = xr.open_zarr(path)["temperature"].values
+    assert result.dtype == np.float32
+    assert not np.any(result.view(np.uint32) & np.uint32((1 << 16) - 1))
+    np.testing.assert_allclose(result, data, rtol=2.0**-7)
+    
+    # Keeping every mantissa bit adds no filter
+    assert Packer(keepbits=23)._bitround_filters("float32") == []
+    
+    with pytest.raises(ValueError):
+        Packer(keepbits=53)
+
+
+def test_add_valid_range_attributes(random_3d):
     """Test adding valid range attributes."""
     # Create test dataset
-    data = np.random.random([5, 3, 4]) * 100
+    data = random_3d
     ds = xr.Dataset(
         {
             "temperature": (("time", "lat", "lon"), data),
@@ -80,12 +242,88 @@ def test_add_valid_range_attributes():
     pressure_max = ds_with_attrs["pressure"].attrs["valid_max"]
     assert pressure_min <= (data * 10).min()
     assert pressure_max >= (data * 10).max()
+    
+    # The input is left untouched unless updated in place
+    assert "valid_min" not in ds["temperature"].attrs
+    assert ds_with_attrs["temperature"].data is ds["temperature"].data
+    assert packer.add_valid_range_attributes(ds, inplace=True) is ds
+    assert "valid_min" in ds["temperature"].attrs
+
+
+def test_add_valid_range_attributes_lazy(random_3d):
+    """Test adding valid range attributes to dask-backed and NaN-containing data."""
+    data = random_3d.copy()
+    data[0, 0, 0] = np.nan
+    ds = xr.Dataset(
+        {
+            "temperature": (("time", "lat", "lon"), data),
+            "pressure": (("time", "lat", "lon"), data * 10),
+        },
+        coords={
+            "time": pd.date_range("2000-01-01", periods=5),
+            "lat": [-10, 0, 10],
+            "lon": [20, 30, 40, 50],
+        },
+    )
+    
+    packer = Packer()
+    eager = packer.add_valid_range_attributes(ds)
+    lazy = packer.add_valid_range_attributes(ds.chunk({"time": 2}))
+    
+    # NaNs are skipped and both paths agree
+    for var in ds.data_vars:
+        assert np.isfinite(eager[var].attrs["valid_min"])
+        assert eager[var].attrs["valid_min"] == pytest.approx(lazy[var].attrs["valid_min"])
+        assert eager[var].attrs["valid_max"] == pytest.approx(lazy[var].attrs["valid_max"])
+    
+    # Lazy data is not loaded
+    assert lazy["temperature"].chunks is not None
+
+
+def test_data_range():
+    """Test the single-pass range reduction over several blocks."""
+    data = _RNG.standard_normal(3 * _RANGE_BLOCK + 5).astype("float32")
+    data[:_RANGE_BLOCK] = np.nan
+    data[-1] = np.nan
+    vmin, vmax = _data_range(data.reshape(-1, 1))
+    assert vmin == np.nanmin(data)
+    assert vmax == np.nanmax(data)
+    assert _data_range(dsa.from_array(data, chunks=1000)) == (vmin, vmax)
+    assert _data_range(np.arange(10)) == (0.0, 9.0)
+    assert _data_range(dsa.arange(10, chunks=3)) == (0.0, 9.0)
 
 
-def test_setup_encoding():
+def test_fused_range():
+    """Test the compiled range kernel against NumPy."""
+    pytest.importorskip("numba")
+    
+    data = _RNG.standard_normal(1000).astype("float32")
+    data[::7] = np.nan
+    assert _data_range(data) == (float(np.nanmin(data)), float(np.nanmax(data)))
+    assert _data_range(np.arange(-5, 10, dtype="int16")) == (-5.0, 9.0)
+    assert all(np.isnan(_data_range(np.full(10, np.nan))))
+
+
+def test_data_ranges():
+    """Test that batched ranges match per-variable ranges."""
+    data = _RNG.standard_normal((4, _RANGE_BLOCK // 2))
+    ds = xr.Dataset(
+        {
+            "a": (("x", "y"), data),
+            "b": (("x", "y"), data * 2),
+            "c": (("x", "z"), data[:, :10]),
+            "d": (("x", "y"), dsa.from_array(data - 1, chunks=(2, 1000))),
+        }
+    )
+    ranges = _data_ranges(ds, ["a", "b", "c", "d"])
+    for var in ds.data_vars:
+        assert ranges[var] == _data_range(ds[var].values)
+
+
+def test_setup_encoding(random_3d):
     """Test encoding setup."""
     # Create test dataset with valid range attributes
-    data = np.random.random([5, 3]) * 100
+    data = random_3d[..., 0]
     ds = xr.Dataset(
         {
             "temperature": (("time", "lat"), data),
@@ -114,6 +352,118 @@ def test_setup_encoding():
         assert isinstance(encoding["temperature"]["filters"][0], FixedScaleOffset)
 
 
+@pytest.mark.parametrize("nbits", [8, 12])
+def test_setup_encoding_store_as_int(random_3d, nbits):
+    """Test CF integer packing, which xarray unpacks on read."""
+    if FixedScaleOffset is None:
+        pytest.skip("zarr not available")
+    
+    ds = xr.Dataset(
+        {"temperature": (("time", "lat", "lon"), random_3d)},
+        coords={"time": pd.date_range("2000-01-01", periods=5)},
+    )
+    ds["temperature"].attrs["valid_min"] = 0.0
+    ds["temperature"].attrs["valid_max"] = 100.0
+    
+    packer = Packer(nbits=nbits, store_as_int=True)
+    encoding = packer.setup_encoding(ds)
+    assert encoding["temperature"]["dtype"] == packer.container_dtype
+    assert "scale_factor" in encoding["temperature"]
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "packed.zarr")
+        ds.to_zarr(path, encoding=encoding)
+        
+        raw = xr.open_zarr(path, mask_and_scale=False)
+        assert raw["temperature"].dtype == np.dtype(packer.container_dtype)
+        
+        result = xr.open_zarr(path)["temperature"].values
+        scale_factor = encoding["temperature"]["scale_factor"]
+        np.testing.assert_allclose(result, ds["temperature"].values, atol=scale_factor)
+
+
+@pytest.mark.parametrize("store_as_int", [False, True])
+@pytest.mark.parametrize("nbits", [8, 12, 16])
+def test_packing_fill_value_roundtrip(nbits, store_as_int):
+    """Test that NaN round-trips through the fill value and vmin/vmax do not."""
+    if FixedScaleOffset is None:
+        pytest.skip("zarr not available")
+    
+    data = np.linspace(0.0, 100.0, 24).reshape(2, 3, 4)
+    data[1, 1, 1] = np.nan
+    ds = xr.Dataset({"temperature": (("time", "lat", "lon"), data)})
+    
+    packer = Packer(nbits=nbits, store_as_int=store_as_int)
+    encoding = packer.setup_encoding(ds, manual_ranges={"temperature": {"min": 0, "max": 100}})
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "packed.zarr")
+        ds.to_zarr(path, encoding=encoding)
+        
+        raw = xr.open_zarr(path, mask_and_scale=False)["temperature"]
+        if store_as_int:
+            assert raw.values[1, 1, 1] == packer.fill_int
+            assert raw.values.min() == packer.fill_int
+            assert np.delete(raw.values.ravel(), 17).min() == packer.fill_int + 1
+        
+        result = xr.open_zarr(path)["temperature"].values
+        assert np.isnan(result[1, 1, 1])
+        assert np.isnan(result).sum() == 1
+        np.testing.assert_allclose(result, data, atol=100 / 2 ** (nbits - 1))
+
+
+@pytest.mark.parametrize("store_as_int", [False, True])
+def test_packing_keeps_valid_max(store_as_int):
+    """Test that data at or just above valid_max is not read back as missing."""
+    if FixedScaleOffset is None:
+        pytest.skip("zarr not available")
+    
+    data = np.array([0.0, 50.0, 100.0, 100.0 + 1e-6])
+    ds = xr.Dataset({"temperature": (("x",), data)})
+    ds["temperature"].attrs.update(valid_min=0.0, valid_max=100.0)
+    
+    encoding = Packer(nbits=8, store_as_int=store_as_int).setup_encoding(ds)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "packed.zarr")
+        ds.to_zarr(path, encoding=encoding)
+        result = xr.open_zarr(path)["temperature"].values
+    
+    assert not np.isnan(result).any()
+    np.testing.assert_allclose(result, data, atol=1.0)
+
+
+def test_packing_float16():
+    """Test decoding packed variables to float16."""
+    if FixedScaleOffset is None:
+        pytest.skip("zarr not available")
+    
+    data = np.linspace(0.0, 100.0, 24)
+    data[5] = np.nan
+    ds = xr.Dataset({"temperature": (("x",), data)})
+    manual_ranges = {"temperature": {"min": 0, "max": 100}}
+    
+    encoding = Packer(nbits=8, float_dtype="float16").setup_encoding(
+        ds, manual_ranges=manual_ranges
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "packed.zarr")
+        ds.to_zarr(path, encoding=encoding)
+        result = xr.open_zarr(path)["temperature"].values
+    
+    assert result.dtype == np.float16
+    assert np.isnan(result[5]) and np.isnan(result).sum() == 1
+    np.testing.assert_allclose(result, data, atol=100 / 254)
+    
+    # float16 cannot resolve a 16-bit step over this range
+    with pytest.raises(ValueError):
+        Packer(nbits=16, float_dtype="float16").setup_encoding(
+            ds, manual_ranges=manual_ranges
+        )
+    
+    with pytest.raises(ValueError):
+        Packer(float_dtype="bfloat16")
+
+
 def test_setup_encoding_no_valid_range():
     """Test encoding setup with no valid range attributes."""
     # Create test dataset without valid range attributes
@@ -216,6 +566,28 @@ def test_setup_encoding_auto_calculation():
     assert len(encoding["temperature"]["filters"]) == 1
 
 
+def test_setup_encoding_batches_data_ranges(random_3d):
+    """Test that lazy data ranges are computed in a single dask graph."""
+    from dask.callbacks import Callback
+    
+    ds = xr.Dataset(
+        {
+            "temperature": (("time", "lat", "lon"), random_3d),
+            "pressure": (("time", "lat", "lon"), random_3d * 10),
+            "salinity": (("time", "lat", "lon"), random_3d / 2),
+        },
+        coords={"time": pd.date_range("2000-01-01", periods=5)},
+    ).chunk({"time": 2})
+    ds["salinity"].attrs.update(valid_min=0.0, valid_max=50.0)
+    
+    computes = []
+    with Callback(start=lambda dsk: computes.append(dsk)):
+        encoding = Packer(nbits=16).setup_encoding(ds, range_exceeded_action="error")
+    
+    assert set(encoding) == {"temperature", "pressure", "salinity"}
+    assert len(computes) == 1
+
+
 def test_range_exceeded_check():
     """Test range exceeded checking."""
     # Create test dataset with data exceeding specified range
@@ -187,6 +187,154 @@ def test_automatic_region_determination():
         # Check that data was written to indices 2, 3, 4 (2000-01-03, 2000-01-04, 2000-01-05)
         written_slice = final_ds.isel(time=slice(2, 5))
         compare_datasets(data_ds, written_slice)
+        
+        # The store's time index is cached for later region writes
+        assert zarr_archive in converter._time_index_cache
+        region = converter._determine_region(
+            data_ds.isel(time=slice(1, None)), zarr_archive
+        )
+        assert region["time"] == slice(3, 5)
+        assert region["lat"] == slice(None) and region["lon"] == slice(None)
+
+
+def test_write_concurrency():
+    """Test that the configured write concurrency applies to writes."""
+    import dask
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_file = os.path.join(tmpdir, "data.nc")
+        create_test_dataset(data_file, periods=4)
+        
+        converter = ZarrConverter(
+            config=ZarrConverterConfig(
+                chunking=ChunkingConfig(time=1), io={"concurrency": 2}
+            )
+        )
+        with converter._write_context():
+            assert dask.config.get("num_workers") == 2
+        
+        zarr_archive = os.path.join(tmpdir, "archive.zarr")
+        converter.convert(data_file, zarr_archive)
+        compare_datasets(xr.open_dataset(data_file), xr.open_zarr(zarr_archive))
+
+
+def test_write_blosc_threads():
+    """Test that Blosc threading applies to writes and is restored after."""
+    from numcodecs import blosc
+    
+    converter = ZarrConverter(
+        config=ZarrConverterConfig(
+            compression={"method": "blosc:zstd:1", "nthreads": 3, "use_threads": False}
+        )
+    )
+    nthreads = blosc.set_nthreads(1)
+    use_threads = blosc.use_threads
+    with converter._write_context():
+        assert blosc.set_nthreads(3) == 3
+        assert blosc.use_threads is False
+    assert blosc.set_nthreads(nthreads) == 1
+    assert blosc.use_threads is use_threads
+
+
+def test_write_blosc_threads_overlapping():
+    """Test that overlapping writes restore the Blosc threading from before the first."""
+    from numcodecs import blosc
+    
+    converter = ZarrConverter(
+        config=ZarrConverterConfig(compression={"method": "blosc:zstd:1", "nthreads": 3})
+    )
+    nthreads = blosc.set_nthreads(1)
+    first, second = converter._write_context(), converter._write_context()
+    first.__enter__()
+    second.__enter__()
+    first.__exit__(None, None, None)
+    # The second write is still running with its settings
+    assert blosc.get_nthreads() == 3
+    second.__exit__(None, None, None)
+    assert blosc.set_nthreads(nthreads) == 1
+
+
+def test_hindcast_template_infers_calendar_freq():
+    """Test that the template's time step is inferred as a frequency alias."""
+    times = pd.date_range("2000-01-01", periods=3, freq="MS")
+    template_ds = xr.Dataset(
+        {"temperature": (("time",), np.zeros(3))}, coords={"time": times}
+    )
+    
+    converter = ZarrConverter()
+    archive = converter._create_hindcast_template(template_ds, global_end="2000-12-01")
+    expected = pd.date_range("2000-01-01", "2000-12-01", freq="MS")
+    np.testing.assert_array_equal(archive.time.values, expected.values)
+    
+    # Two time steps fall back to their difference (31 days here)
+    archive = converter._create_hindcast_template(
+        template_ds.isel(time=slice(2)), global_end="2000-03-03"
+    )
+    assert archive.sizes["time"] == 3
+
+
+def test_determine_region_even_time_steps():
+    """Test that region indices on evenly spaced times match searchsorted."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        zarr_archive = os.path.join(tmpdir, "archive.zarr")
+        times = pd.date_range("2000-01-01", periods=40, freq="6h")
+        xr.Dataset(
+            {"temperature": (("time",), np.zeros(40))}, coords={"time": times}
+        ).to_zarr(zarr_archive)
+        
+        converter = ZarrConverter()
+        for start, end in [
+            ("2000-01-02", "2000-01-03"),
+            ("2000-01-02T03", "2000-01-03T21"),
+            ("1999-12-31", "2000-01-01"),
+            ("1999-12-01", "1999-12-02"),
+            ("2000-01-10", "2000-02-01"),
+        ]:
+            ds = xr.Dataset(coords={"time": pd.DatetimeIndex([start, end])})
+            region = converter._determine_region(ds, zarr_archive)
+            expected = slice(
+                int(np.searchsorted(times.values, ds.time.values[0], side="left")),
+                int(np.searchsorted(times.values, ds.time.values[-1], side="right")),
+            )
+            assert region["time"] == expected, (start, end)
+        
+        assert converter._time_index_cache[zarr_archive][-1] is not None
+
+
+def test_apply_chunking_skips_matching_chunks():
+    """Test that datasets already chunked as configured aren't rechunked."""
+    ds = xr.Dataset({"temperature": (("time", "lat"), np.zeros((10, 3)))})
+    converter = ZarrConverter()
+    
+    chunked = converter._apply_chunking(ds, {"time": 4, "lon": 2})
+    assert chunked["temperature"].chunks == ((4, 4, 2), (3,))
+    assert converter._apply_chunking(chunked, {"time": 4, "lon": 2}) is chunked
+    
+    rechunked = converter._apply_chunking(chunked, {"time": 5})
+    assert rechunked["temperature"].chunks == ((5, 5), (3,))
+
+
+def test_create_template_from_lazy_dataset():
+    """Test creating a template from a dask-backed dataset."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Open the template lazily with chunks that don't span the archive
+        template_file = os.path.join(tmpdir, "template.nc")
+        create_test_dataset(template_file, t0="2000-01-01", periods=5)
+        
+        converter = ZarrConverter()
+        zarr_archive = os.path.join(tmpdir, "archive.zarr")
+        with xr.open_dataset(template_file, chunks={"time": 1}) as template_ds:
+            converter.create_template(
+                template_dataset=template_ds,
+                output_path=zarr_archive,
+                global_start="2000-01-01",
+                global_end="2000-01-10",
+                compute=False
+            )
+        
+        final_ds = xr.open_zarr(zarr_archive)
+        assert len(final_ds.time) == 10
+        assert final_ds.temperature.chunks[0] == (1,) * 10
 
 
 def test_retry_logic_on_missing_data():
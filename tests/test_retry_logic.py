@@ -188,9 +188,93 @@ def test_missing_data_detection():
         has_missing = converter._has_missing(zarrfile, ds_orig)
         assert has_missing is False  # No missing data detected
         
+        # A missing-value pattern that differs from the store is detected
+        ds_gappy = ds_orig.load().copy(deep=True)
+        ds_gappy["temperature"][0, 0, 0] = np.nan
+        assert converter._has_missing(zarrfile, ds_gappy) is True
+        
+        # A written region is read back directly with zarr
+        region = {"time": slice(0, 5)}
+        assert converter._missing_mismatch_raw(zarrfile, ds_orig, region) == {
+            "temperature": False, "pressure": False
+        }
+        assert converter._has_missing(zarrfile, ds_orig, region) is False
+        assert converter._has_missing(zarrfile, ds_gappy, region) is True
+        
         print("✓ Test passed: Missing data detection working correctly")
 
 
+def test_missing_data_detection_input_mode():
+    """Test missing data detection on the input dataset only."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ncfile = os.path.join(tmpdir, "test.nc")
+        create_test_dataset_with_missing_data(ncfile, t0="2000-01-01", periods=5)
+        ds_orig = xr.open_dataset(ncfile).load()
+        
+        converter = ZarrConverter(
+            config=ZarrConverterConfig(
+                missing_data=MissingDataConfig(
+                    missing_check_vars=["temperature"],
+                    check_mode="input"
+                )
+            )
+        )
+        
+        # The store isn't read, so it doesn't need to exist
+        missing_store = os.path.join(tmpdir, "missing.zarr")
+        assert converter._has_missing(missing_store, ds_orig) is False
+        
+        ds_orig["temperature"][0, 0, 0] = np.nan
+        assert converter._has_missing(missing_store, ds_orig) is True
+        
+        with pytest.raises(ValueError):
+            MissingDataConfig(check_mode="bogus")
+
+
+def test_retry_reuses_opened_dataset(monkeypatch):
+    """Test that retries on missing store data don't reopen the input."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ncfile = os.path.join(tmpdir, "test.nc")
+        zarrfile = os.path.join(tmpdir, "test.zarr")
+        create_test_dataset_with_missing_data(ncfile, t0="2000-01-01", periods=5)
+        
+        converter = ZarrConverter(
+            config=ZarrConverterConfig(
+                missing_data=MissingDataConfig(retries_on_missing=2)
+            )
+        )
+        
+        opened = []
+        open_dataset = converter._open_dataset
+        monkeypatch.setattr(
+            converter, "_open_dataset", lambda path: opened.append(path) or open_dataset(path)
+        )
+        checks = iter([True, False])
+        monkeypatch.setattr(converter, "_has_missing", lambda *args: next(checks))
+        
+        converter.convert(ncfile, zarrfile)
+        assert len(opened) == 1
+        assert converter.retried_on_missing == 1
+
+
+def test_retry_backoff(monkeypatch):
+    """Test that retry delays grow exponentially up to the cap, with jitter."""
+    import zarrio.core
+    
+    delays = []
+    monkeypatch.setattr(zarrio.core.time, "sleep", delays.append)
+    monkeypatch.setattr(zarrio.core.random, "uniform", lambda lo, hi: hi)
+    
+    converter = ZarrConverter(
+        config=ZarrConverterConfig(
+            missing_data=MissingDataConfig(base_s=0.25, cap_s=1.0)
+        )
+    )
+    for attempt in range(1, 5):
+        converter._sleep_backoff(attempt)
+    assert delays == [0.375, 0.75, 1.5, 1.5]
+
+
 def test_retry_counter_reset():
     """Test that retry counter is properly reset between operations."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -6,5 +6,65 @@ __version__ = "0.1.3"
 __author__ = "Oceanum Developers"
 __email__ = "developers@oceanum.science"
 
-# Import public API
-from .api import *
\ No newline at end of file
+import importlib
+
+# Registers the zarrio codecs, needed to read packed stores
+from . import codecs
+
+# Public API, imported from .api on first access so that the command-line
+# interface can answer --help and --version without loading xarray and dask
+__all__ = [
+    # Core classes
+    "ZarrConverter",
+    "Packer",
+    "TimeManager",
+    "Config",
+    # Configuration classes
+    "ZarrConverterConfig",
+    "ChunkingConfig",
+    "PackingConfig",
+    "CompressionConfig",
+    "TimeConfig",
+    "VariableConfig",
+    "MissingDataConfig",
+    "RemoteFileConfig",
+    "IOConfig",
+    # Core functions
+    "convert_to_zarr",
+    "append_to_zarr",
+    # Exceptions
+    "OnzarrError",
+    "ConversionError",
+    "PackingError",
+    "TimeAlignmentError",
+    "ConfigurationError",
+    # Metadata
+    "__version__",
+    "__author__",
+    "__email__",
+]
+
+
+def __getattr__(name: str):
+    """Import a public API name or submodule on first access."""
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name not in __all__:
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    from . import api
+
+    value = getattr(api, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -15,6 +15,7 @@ from .models import (
     VariableConfig,
     MissingDataConfig,
     RemoteFileConfig,
+    IOConfig,
 )
 from .exceptions import (
     OnzarrError,
@@ -23,7 +24,7 @@ from .exceptions import (
     TimeAlignmentError,
     ConfigurationError,
 )
-from .__init__ import __version__, __author__, __email__
+from . import __version__, __author__, __email__
 
 __all__ = [
     # Core classes
@@ -40,6 +41,7 @@ __all__ = [
     "VariableConfig",
     "MissingDataConfig",
     "RemoteFileConfig",
+    "IOConfig",
     # Core functions
     "convert_to_zarr",
     "append_to_zarr",
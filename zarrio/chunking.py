@@ -121,6 +121,10 @@ class ChunkAnalyzer:
             strategy = "balanced"
             notes.append("Balanced for mixed access patterns")
         
+        # Spread each dimension over equal-sized chunks
+        chunks = self._even_out_chunks(chunks, dimensions)
+        chunk_size_mb = self._calculate_chunk_size_mb(chunks, dimensions, dtype_size_bytes)
+
         # Check for warnings
         if chunk_size_mb < self.SMALL_CHUNK_WARNING_MB:
             warnings.append(
@@ -324,6 +328,29 @@ class ChunkAnalyzer:
         
         return chunks
     
+    def _even_out_chunks(
+        self,
+        chunks: Dict[str, int],
+        dimensions: Dict[str, int]
+    ) -> Dict[str, int]:
+        """
+        Adjust chunk sizes so each dimension splits into near-equal chunks.
+
+        The number of chunks along a dimension is the nearest whole number to
+        size / chunk, and the chunk size is then the dimension size divided by
+        that count, rounded up. This avoids a small trailing chunk (e.g. 181
+        points in chunks of 90 becomes 2 chunks of 91 rather than 90, 90, 1).
+        """
+        evened = {}
+        for dim, chunk_size in chunks.items():
+            size = dimensions.get(dim)
+            if not size or chunk_size >= size:
+                evened[dim] = chunk_size
+                continue
+            nchunks = max(1, int(size / chunk_size + 0.5))
+            evened[dim] = math.ceil(size / nchunks)
+        return evened
+
     def _calculate_chunk_size_mb(
         self,
         chunks: Dict[str, int],
@@ -5,20 +5,35 @@ Command-line interface for zarrio with Pydantic configuration support.
 import argparse
 import json
 import logging
+import re
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
-import xarray as xr
-import yaml
+try:
+    import orjson
 
-from .__init__ import __version__
-from .core import ZarrConverter
-from .models import ZarrConverterConfig, load_config_from_file
-from .packing import Packer
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+_CHUNK_RE = re.compile(r"([A-Za-z_]\w*)\s*:\s*(\d+)")
+_REGION_RE = re.compile(r"([A-Za-z_]\w*)\s*=\s*(\d+)\s*:\s*(\d+)")
+
+
+def get_version() -> str:
+    """Return the installed zarrio version without importing the library."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("zarrio")
+    except PackageNotFoundError:
+        from . import __version__
+
+        return __version__
+
 
 def setup_logging(verbosity: int = 0) -> None:
     """Setup logging based on verbosity level."""
@@ -35,64 +50,86 @@ def parse_chunking(chunking_str: str) -> Dict[str, int]:
         return {}
 
     chunking = {}
-    for part in chunking_str.split(","):
-        if ":" in part:
-            dim, size = part.split(":")
-            chunking[dim.strip()] = int(size.strip())
+    for token in filter(None, (part.strip() for part in chunking_str.split(","))):
+        match = _CHUNK_RE.fullmatch(token)
+        if match is None:
+            raise ValueError(f"Invalid chunking entry {token!r}, expected 'dim:size'")
+        chunking[match.group(1)] = int(match.group(2))
     return chunking
 
 
-def convert_command(args: argparse.Namespace) -> None:
-    """Handle convert command."""
-    # Parse chunking
-    chunking = parse_chunking(args.chunking)
+def parse_region(region_str: str) -> Dict[str, slice]:
+    """Parse region string (e.g. 'time=0:100,lat=0:50') to dictionary of slices."""
+    region = {}
+    for token in filter(None, (part.strip() for part in region_str.split(","))):
+        match = _REGION_RE.fullmatch(token)
+        if match is None:
+            raise ValueError(
+                f"Invalid region entry {token!r}, expected 'dim=start:stop'"
+            )
+        region[match.group(1)] = slice(int(match.group(2)), int(match.group(3)))
+    return region
+
+
+# Command-line options that map directly onto a config field, as
+# (argument name, path in the config dict, transform). An option is applied
+# when the subcommand defines it and it is set.
+_CONFIG_ARGS = (
+    ("compression", ("compression", "method"), None),
+    ("packing", ("packing", "enabled"), None),
+    ("packing_bits", ("packing", "bits"), None),
+    ("packing_manual_ranges", ("packing", "manual_ranges"), _json_loads),
+    ("packing_auto_buffer_factor", ("packing", "auto_buffer_factor"), None),
+    ("packing_range_exceeded_action", ("packing", "range_exceeded_action"), None),
+    ("packing_store_as_int", ("packing", "store_as_int"), None),
+    ("packing_float_dtype", ("packing", "float_dtype"), None),
+    ("append_dim", ("time", "append_dim"), None),
+    ("time_dim", ("time", "dim"), None),
+    ("target_chunk_size_mb", ("target_chunk_size_mb",), None),
+    # JSON strings parsed by the config model itself
+    ("attrs", ("attrs",), None),
+)
+
+
+def _build_config_dict(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Build a converter config dictionary from a config file and CLI overrides.
+
+    Args:
+        args: Parsed arguments of any subcommand; options the subcommand does
+            not define are skipped
+
+    Returns:
+        Dictionary suitable for ZarrConverterConfig(**config_dict)
+    """
+    from .models import load_config_from_file
 
     # Load config if provided
-    config = None
+    config_dict = {}
     if args.config:
-        config = load_config_from_file(args.config)
+        config_dict = load_config_from_file(args.config).model_dump()
 
     # Override config with command line arguments
-    config_dict = {}
-    if config:
-        config_dict = config.model_dump()
-
+    chunking = parse_chunking(getattr(args, "chunking", None))
     if chunking:
         config_dict.setdefault("chunking", {}).update(chunking)
-    if args.compression:
-        config_dict.setdefault("compression", {})["method"] = args.compression
-    if args.packing:
-        config_dict.setdefault("packing", {})["enabled"] = True
-    if args.packing_bits:
-        config_dict.setdefault("packing", {})["bits"] = args.packing_bits
-    if args.packing_manual_ranges:
-        import json
-
-        config_dict.setdefault("packing", {})["manual_ranges"] = json.loads(
-            args.packing_manual_ranges
-        )
-    if args.packing_auto_buffer_factor:
-        config_dict.setdefault("packing", {})["auto_buffer_factor"] = (
-            args.packing_auto_buffer_factor
-        )
-    if not args.packing_check_range_exceeded:
+
+    for name, path, transform in _CONFIG_ARGS:
+        value = getattr(args, name, None)
+        if not value:
+            continue
+        section = config_dict
+        for key in path[:-1]:
+            section = section.setdefault(key, {})
+        section[path[-1]] = transform(value) if transform else value
+
+    # keepbits=0 is valid, so it cannot go through the truthiness check above
+    if getattr(args, "keepbits", None) is not None:
+        config_dict.setdefault("packing", {})["keepbits"] = args.keepbits
+
+    if getattr(args, "packing_check_range_exceeded", True) is False:
         config_dict.setdefault("packing", {})["check_range_exceeded"] = False
-    if args.packing_range_exceeded_action:
-        config_dict.setdefault("packing", {})["range_exceeded_action"] = (
-            args.packing_range_exceeded_action
-        )
-    if args.time_dim:
-        config_dict.setdefault("time", {})["dim"] = args.time_dim
-    if getattr(args, "rolling_archive_hours", None) is not None:
-        from datetime import timedelta
 
-        config_dict.setdefault("rolling_archive", {})
-        config_dict["rolling_archive"]["enabled"] = True
-        config_dict["rolling_archive"]["retention_window"] = timedelta(
-            hours=args.rolling_archive_hours
-        )
-    if args.target_chunk_size_mb:
-        config_dict["target_chunk_size_mb"] = args.target_chunk_size_mb
     if getattr(args, "rolling_archive_hours", None) is not None:
         from datetime import timedelta
 
@@ -103,14 +140,24 @@ def convert_command(args: argparse.Namespace) -> None:
         )
 
     # Add datamesh config if provided
-    if args.datamesh_datasource:
+    if getattr(args, "datamesh_datasource", None):
         config_dict.setdefault("datamesh", {})
-        config_dict["datamesh"]["datasource"] = json.loads(args.datamesh_datasource)
+        config_dict["datamesh"]["datasource"] = args.datamesh_datasource
         if args.datamesh_token:
             config_dict["datamesh"]["token"] = args.datamesh_token
         if args.datamesh_service:
             config_dict["datamesh"]["service"] = args.datamesh_service
 
+    return config_dict
+
+
+def convert_command(args: argparse.Namespace) -> None:
+    """Handle convert command."""
+    from .core import ZarrConverter
+    from .models import ZarrConverterConfig
+
+    config_dict = _build_config_dict(args)
+
     # Validate that either output is provided or datamesh is configured
     if not args.output and not config_dict.get("datamesh"):
         print("error: output is required when not using datamesh", file=sys.stderr)
@@ -140,34 +187,10 @@ def convert_command(args: argparse.Namespace) -> None:
 
 def append_command(args: argparse.Namespace) -> None:
     """Handle append command."""
-    # Parse chunking
-    chunking = parse_chunking(args.chunking)
+    from .core import ZarrConverter
+    from .models import ZarrConverterConfig
 
-    # Load config if provided
-    config = None
-    if args.config:
-        config = load_config_from_file(args.config)
-
-    # Override config with command line arguments
-    config_dict = {}
-    if config:
-        config_dict = config.model_dump()
-
-    if chunking:
-        config_dict.setdefault("chunking", {}).update(chunking)
-    if args.append_dim:
-        config_dict.setdefault("time", {})["append_dim"] = args.append_dim
-    if args.time_dim:
-        config_dict.setdefault("time", {})["dim"] = args.time_dim
-
-    # Add datamesh config if provided
-    if args.datamesh_datasource:
-        config_dict.setdefault("datamesh", {})
-        config_dict["datamesh"]["datasource"] = json.loads(args.datamesh_datasource)
-        if args.datamesh_token:
-            config_dict["datamesh"]["token"] = args.datamesh_token
-        if args.datamesh_service:
-            config_dict["datamesh"]["service"] = args.datamesh_service
+    config_dict = _build_config_dict(args)
 
     # Create converter with config
     converter_config = ZarrConverterConfig(**config_dict)
@@ -179,7 +202,7 @@ def append_command(args: argparse.Namespace) -> None:
 
     # Perform append
     converter.append(
-        input_path=args.input,
+        input_path=args.input if len(args.input) > 1 else args.input[0],
         zarr_path=args.zarr,
         variables=variables,
         drop_variables=drop_variables,
@@ -190,56 +213,10 @@ def append_command(args: argparse.Namespace) -> None:
 
 def create_template_command(args: argparse.Namespace) -> None:
     """Handle create-template command."""
-    # Parse chunking
-    chunking = parse_chunking(args.chunking)
+    from .core import ZarrConverter
+    from .models import ZarrConverterConfig
 
-    # Load config if provided
-    config = None
-    if args.config:
-        config = load_config_from_file(args.config)
-
-    # Override config with command line arguments
-    config_dict = {}
-    if config:
-        config_dict = config.model_dump()
-
-    if chunking:
-        config_dict.setdefault("chunking", {}).update(chunking)
-    if args.compression:
-        config_dict.setdefault("compression", {})["method"] = args.compression
-    if args.packing:
-        config_dict.setdefault("packing", {})["enabled"] = True
-    if args.packing_bits:
-        config_dict.setdefault("packing", {})["bits"] = args.packing_bits
-    if args.packing_manual_ranges:
-        import json
-
-        config_dict.setdefault("packing", {})["manual_ranges"] = json.loads(
-            args.packing_manual_ranges
-        )
-    if args.packing_auto_buffer_factor:
-        config_dict.setdefault("packing", {})["auto_buffer_factor"] = (
-            args.packing_auto_buffer_factor
-        )
-    if not args.packing_check_range_exceeded:
-        config_dict.setdefault("packing", {})["check_range_exceeded"] = False
-    if args.packing_range_exceeded_action:
-        config_dict.setdefault("packing", {})["range_exceeded_action"] = (
-            args.packing_range_exceeded_action
-        )
-    if args.time_dim:
-        config_dict.setdefault("time", {})["dim"] = args.time_dim
-    if args.target_chunk_size_mb:
-        config_dict["target_chunk_size_mb"] = args.target_chunk_size_mb
-
-    # Add datamesh config if provided
-    if args.datamesh_datasource:
-        config_dict.setdefault("datamesh", {})
-        config_dict["datamesh"]["datasource"] = json.loads(args.datamesh_datasource)
-        if args.datamesh_token:
-            config_dict["datamesh"]["token"] = args.datamesh_token
-        if args.datamesh_service:
-            config_dict["datamesh"]["service"] = args.datamesh_service
+    config_dict = _build_config_dict(args)
 
     # Create converter with config
     converter_config = ZarrConverterConfig(**config_dict)
@@ -265,53 +242,17 @@ def create_template_command(args: argparse.Namespace) -> None:
 
 def write_region_command(args: argparse.Namespace) -> None:
     """Handle write-region command."""
-    # Parse chunking
-    chunking = parse_chunking(args.chunking)
-
-    # Load config if provided
-    config = None
-    if args.config:
-        config = load_config_from_file(args.config)
-
-    # Override config with command line arguments
-    config_dict = {}
-    if config:
-        config_dict = config.model_dump()
+    from .core import ZarrConverter
+    from .models import ZarrConverterConfig
 
-    if chunking:
-        config_dict.setdefault("chunking", {}).update(chunking)
-    if args.time_dim:
-        config_dict.setdefault("time", {})["dim"] = args.time_dim
-    if getattr(args, "rolling_archive_hours", None) is not None:
-        from datetime import timedelta
-
-        config_dict.setdefault("rolling_archive", {})
-        config_dict["rolling_archive"]["enabled"] = True
-        config_dict["rolling_archive"]["retention_window"] = timedelta(
-            hours=args.rolling_archive_hours
-        )
-
-    # Add datamesh config if provided
-    if args.datamesh_datasource:
-        config_dict.setdefault("datamesh", {})
-        config_dict["datamesh"]["datasource"] = json.loads(args.datamesh_datasource)
-        if args.datamesh_token:
-            config_dict["datamesh"]["token"] = args.datamesh_token
-        if args.datamesh_service:
-            config_dict["datamesh"]["service"] = args.datamesh_service
+    config_dict = _build_config_dict(args)
 
     # Create converter with config
     converter_config = ZarrConverterConfig(**config_dict)
     converter = ZarrConverter(config=converter_config)
 
     # Parse region if provided
-    region = None
-    if args.region:
-        region = {}
-        for part in args.region.split(","):
-            dim, slice_str = part.split("=")
-            start, end = slice_str.split(":")
-            region[dim.strip()] = slice(int(start), int(end))
+    region = parse_region(args.region) if args.region else None
 
     # Parse variables
     variables = args.variables.split(",") if args.variables else None
@@ -866,77 +807,8 @@ def analyze_command(args: argparse.Namespace) -> None:
         raise
 
 
-def main() -> None:
-    """Main entry point for CLI."""
-    parser = argparse.ArgumentParser(
-        description="zarrio - Convert scientific data to Zarr format",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-examples:
-  # Convert NetCDF to Zarr
-  zarrio convert input.nc output.zarr
-
-  # Convert with chunking
-  zarrio convert input.nc output.zarr --chunking "time:100,lat:50,lon:100"
-
-  # Convert with compression
-  zarrio convert input.nc output.zarr --compression "blosc:zstd:3"
-
-  # Convert with data packing
-  zarrio convert input.nc output.zarr --packing --packing-bits 16
-
-  # Convert with manual packing ranges
-  zarrio convert input.nc output.zarr --packing
-      --packing-manual-ranges '{"temperature": {"min": 0, "max": 100}}'
-
-  # Convert with intelligent chunking
-  zarrio convert input.nc output.zarr --intelligent-chunking --access-pattern temporal
-
-  # Convert with intelligent chunking and custom target chunk size
-  zarrio convert input.nc output.zarr --intelligent-chunking --access-pattern spatial --target-chunk-size-mb 100
-
-  # Analyze NetCDF file for optimization recommendations
-  zarrio analyze input.nc
-
-  # Analyze with theoretical performance benefits
-  zarrio analyze input.nc --test-performance
-
-  # Analyze with actual performance tests
-  zarrio analyze input.nc --run-tests
-
-  # Analyze with interactive configuration setup
-  zarrio analyze input.nc --interactive
-
-  # Create template for parallel writing
-  zarrio create-template template.nc archive.zarr --global-start 2023-01-01 --global-end 2023-12-31
-
-  # Create template with intelligent chunking
-  zarrio create-template template.nc archive.zarr --global-start 2023-01-01 --global-end 2023-12-31 --intelligent-chunking --access-pattern temporal
-
-  # Write region to existing archive
-  zarrio write-region data.nc archive.zarr
-
-  # Append to existing Zarr store
-  zarrio append new_data.nc existing.zarr
-
-  # Convert to datamesh datasource
-  zarrio convert input.nc --datamesh-datasource '{"id":"my_datasource","name":"My Data","coordinates":{"x":"longitude","y":"latitude","t":"time"}}' --datamesh-token $DATAMESH_TOKEN
-        """,
-    )
-
-    parser.add_argument("--version", action="version", version=f"zarrio {__version__}")
-
-    parser.add_argument(
-        "-v",
-        "--verbose",
-        action="count",
-        default=0,
-        help="Increase verbosity (use -v, -vv, or -vvv)",
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # Convert command
+def _add_convert_parser(subparsers: Any) -> None:
+    """Add the convert subcommand."""
     convert_parser = subparsers.add_parser(
         "convert", help="Convert data to Zarr format"
     )
@@ -953,7 +825,9 @@ examples:
         "Can be combined with --intelligent-chunking (manual values take precedence).",
     )
     convert_parser.add_argument(
-        "--compression", help="Compression specification (e.g., 'blosc:zstd:3')"
+        "--compression",
+        help="Compression specification (e.g., 'blosc:zstd:3' or "
+        "'blosc:zstd:3:bitshuffle')",
     )
     convert_parser.add_argument(
         "--packing", action="store_true", help="Enable data packing"
@@ -962,7 +836,8 @@ examples:
         "--packing-bits",
         type=int,
         default=16,
-        choices=[8, 16, 32],
+        choices=range(2, 33),
+        metavar="{2..32}",
         help="Number of bits for packing (default: 16)",
     )
     convert_parser.add_argument(
@@ -987,6 +862,25 @@ examples:
         default="warn",
         help="Action when data exceeds range (default: warn)",
     )
+    convert_parser.add_argument(
+        "--packing-store-as-int",
+        action="store_true",
+        help="Store packed variables as CF-scaled integers instead of "
+        "decoding them through a filter",
+    )
+    convert_parser.add_argument(
+        "--packing-float-dtype",
+        choices=["float16", "float32", "float64"],
+        help="Float dtype packed variables decode to (default: float32)",
+    )
+    convert_parser.add_argument(
+        "--keepbits",
+        type=int,
+        choices=range(0, 53),
+        metavar="{0..52}",
+        help="Round floats to this many mantissa bits before packing and "
+        "compression (e.g. 10 for float32)",
+    )
     convert_parser.add_argument(
         "--variables", help="Comma-separated list of variables to include"
     )
@@ -1039,11 +933,15 @@ examples:
     convert_parser.add_argument("--config", help="Configuration file (YAML or JSON)")
     convert_parser.set_defaults(func=convert_command)
 
-    # Append command
+
+def _add_append_parser(subparsers: Any) -> None:
+    """Add the append subcommand."""
     append_parser = subparsers.add_parser(
         "append", help="Append data to existing Zarr store"
     )
-    append_parser.add_argument("input", help="Input file path")
+    append_parser.add_argument(
+        "input", nargs="+", help="Input file path(s), appended in order"
+    )
     append_parser.add_argument("zarr", help="Existing Zarr store path")
     append_parser.add_argument(
         "--chunking", help="Chunking specification (e.g., 'time:100,lat:50,lon:100')"
@@ -1074,7 +972,9 @@ examples:
     append_parser.add_argument("--config", help="Configuration file (YAML or JSON)")
     append_parser.set_defaults(func=append_command)
 
-    # Create template command
+
+def _add_create_template_parser(subparsers: Any) -> None:
+    """Add the create-template subcommand."""
     template_parser = subparsers.add_parser(
         "create-template", help="Create template Zarr archive for parallel writing"
     )
@@ -1084,7 +984,9 @@ examples:
         "--chunking", help="Chunking specification (e.g., 'time:100,lat:50,lon:100')"
     )
     template_parser.add_argument(
-        "--compression", help="Compression specification (e.g., 'blosc:zstd:3')"
+        "--compression",
+        help="Compression specification (e.g., 'blosc:zstd:3' or "
+        "'blosc:zstd:3:bitshuffle')",
     )
     template_parser.add_argument(
         "--packing", action="store_true", help="Enable data packing"
@@ -1093,7 +995,8 @@ examples:
         "--packing-bits",
         type=int,
         default=16,
-        choices=[8, 16, 32],
+        choices=range(2, 33),
+        metavar="{2..32}",
         help="Number of bits for packing (default: 16)",
     )
     template_parser.add_argument(
@@ -1118,6 +1021,25 @@ examples:
         default="warn",
         help="Action when data exceeds range (default: warn)",
     )
+    template_parser.add_argument(
+        "--packing-store-as-int",
+        action="store_true",
+        help="Store packed variables as CF-scaled integers instead of "
+        "decoding them through a filter",
+    )
+    template_parser.add_argument(
+        "--packing-float-dtype",
+        choices=["float16", "float32", "float64"],
+        help="Float dtype packed variables decode to (default: float32)",
+    )
+    template_parser.add_argument(
+        "--keepbits",
+        type=int,
+        choices=range(0, 53),
+        metavar="{0..52}",
+        help="Round floats to this many mantissa bits before packing and "
+        "compression (e.g. 10 for float32)",
+    )
     template_parser.add_argument(
         "--global-start", help="Start time for full archive (e.g., '2023-01-01')"
     )
@@ -1165,7 +1087,9 @@ examples:
     template_parser.add_argument("--config", help="Configuration file (YAML or JSON)")
     template_parser.set_defaults(func=create_template_command)
 
-    # Write region command
+
+def _add_write_region_parser(subparsers: Any) -> None:
+    """Add the write-region subcommand."""
     region_parser = subparsers.add_parser(
         "write-region", help="Write data to specific region of Zarr archive"
     )
@@ -1200,7 +1124,9 @@ examples:
     region_parser.add_argument("--config", help="Configuration file (YAML or JSON)")
     region_parser.set_defaults(func=write_region_command)
 
-    # Analyze command
+
+def _add_analyze_parser(subparsers: Any) -> None:
+    """Add the analyze subcommand."""
     analyze_parser = subparsers.add_parser(
         "analyze", help="Analyze NetCDF file and recommend optimization options"
     )
@@ -1228,8 +1154,92 @@ examples:
     )
     analyze_parser.set_defaults(func=analyze_command)
 
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv[1:]``)
+    """
+    parser = argparse.ArgumentParser(
+        description="zarrio - Convert scientific data to Zarr format",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+examples:
+  # Convert NetCDF to Zarr
+  zarrio convert input.nc output.zarr
+
+  # Convert with chunking
+  zarrio convert input.nc output.zarr --chunking "time:100,lat:50,lon:100"
+
+  # Convert with compression
+  zarrio convert input.nc output.zarr --compression "blosc:zstd:3"
+
+  # Convert with data packing
+  zarrio convert input.nc output.zarr --packing --packing-bits 16
+
+  # Convert with manual packing ranges
+  zarrio convert input.nc output.zarr --packing
+      --packing-manual-ranges '{"temperature": {"min": 0, "max": 100}}'
+
+  # Convert with intelligent chunking
+  zarrio convert input.nc output.zarr --intelligent-chunking --access-pattern temporal
+
+  # Convert with intelligent chunking and custom target chunk size
+  zarrio convert input.nc output.zarr --intelligent-chunking --access-pattern spatial --target-chunk-size-mb 100
+
+  # Analyze NetCDF file for optimization recommendations
+  zarrio analyze input.nc
+
+  # Analyze with theoretical performance benefits
+  zarrio analyze input.nc --test-performance
+
+  # Analyze with actual performance tests
+  zarrio analyze input.nc --run-tests
+
+  # Analyze with interactive configuration setup
+  zarrio analyze input.nc --interactive
+
+  # Create template for parallel writing
+  zarrio create-template template.nc archive.zarr --global-start 2023-01-01 --global-end 2023-12-31
+
+  # Create template with intelligent chunking
+  zarrio create-template template.nc archive.zarr --global-start 2023-01-01 --global-end 2023-12-31 --intelligent-chunking --access-pattern temporal
+
+  # Write region to existing archive
+  zarrio write-region data.nc archive.zarr
+
+  # Append to existing Zarr store
+  zarrio append new_data.nc existing.zarr
+
+  # Convert to datamesh datasource
+  zarrio convert input.nc --datamesh-datasource '{"id":"my_datasource","name":"My Data","coordinates":{"x":"longitude","y":"latitude","t":"time"}}' --datamesh-token $DATAMESH_TOKEN
+        """,
+    )
+
+    parser.add_argument(
+        "--version", action="version", version=f"zarrio {get_version()}"
+    )
+
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="Increase verbosity (use -v, -vv, or -vvv)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    _add_convert_parser(subparsers)
+    _add_append_parser(subparsers)
+    _add_create_template_parser(subparsers)
+    _add_write_region_parser(subparsers)
+    _add_analyze_parser(subparsers)
+
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Setup logging
     setup_logging(args.verbose)
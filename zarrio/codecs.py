@@ -0,0 +1,90 @@
+"""
+Numcodecs codecs for zarrio stores.
+
+Importing zarrio imports this module, which registers the codecs so that
+stores written with them can be read back.
+"""
+
+import numpy as np
+
+try:
+    from numcodecs import register_codec
+    from numcodecs.abc import Codec
+    from numcodecs.compat import ensure_ndarray, ndarray_copy
+
+    NUMCODECS_AVAILABLE = True
+except ImportError:
+    NUMCODECS_AVAILABLE = False
+
+
+if NUMCODECS_AVAILABLE:
+
+    class BitPack(Codec):
+        """
+        Filter storing signed integers in exactly ``nbits`` bits each.
+
+        Input values must lie in ``[-2**(nbits-1), 2**(nbits-1) - 1]``, which is
+        what FixedScaleOffset produces with the scale and offset from
+        Packer.compute_scale_and_offset. The encoded buffer holds the element
+        count as a little-endian uint32 followed by the packed bits. Reading
+        stores that use this filter requires zarrio to be imported so the codec
+        is registered.
+        """
+
+        codec_id = "zarrio.bitpack"
+
+        def __init__(self, nbits: int, dtype: str):
+            if not 1 <= nbits <= 32:
+                raise ValueError("nbits must be between 1 and 32")
+            self.nbits = int(nbits)
+            self.dtype = np.dtype(dtype)
+
+        def encode(self, buf):
+            arr = ensure_ndarray(buf).view(self.dtype).reshape(-1)
+            nbits, size = self.nbits, arr.size
+            # Every 8 elements fill exactly nbits bytes, so element r of each
+            # group always starts at the same bit within a stride of nbits bytes
+            groups = -(-size // 8)
+            values = np.zeros(groups * 8, dtype=np.uint64)
+            values[:size] = arr.astype("<i8") + (1 << (nbits - 1))
+            values = values.reshape(groups, 8)
+            packed = np.zeros(groups * nbits + 8, dtype=np.uint8)
+            for r in range(8):
+                bit0 = r * nbits
+                # Left-align the value in a 64-bit window starting at its first byte
+                window = values[:, r] << np.uint64(64 - nbits - (bit0 & 7))
+                for j in range((nbits + 14) // 8):
+                    byte = (window >> np.uint64(56 - 8 * j)).astype(np.uint8)
+                    packed[(bit0 >> 3) + j :: nbits][:groups] |= byte
+            header = np.array([size], dtype="<u4").view(np.uint8)
+            return np.concatenate([header, packed[: (size * nbits + 7) // 8]])
+
+        def decode(self, buf, out=None):
+            raw = ensure_ndarray(buf).view(np.uint8).reshape(-1)
+            nbits, size = self.nbits, int(raw[:4].view("<u4")[0])
+            groups = -(-size // 8)
+            packed = np.zeros(groups * nbits + 8, dtype=np.uint8)
+            packed[: raw.size - 4] = raw[4:]
+            values = np.empty((groups, 8), dtype=np.uint64)
+            mask = np.uint64((1 << nbits) - 1)
+            for r in range(8):
+                bit0 = r * nbits
+                window = np.zeros(groups, dtype=np.uint64)
+                for j in range((nbits + 14) // 8):
+                    byte = packed[(bit0 >> 3) + j :: nbits][:groups].astype(np.uint64)
+                    window |= byte << np.uint64(56 - 8 * j)
+                values[:, r] = (window >> np.uint64(64 - nbits - (bit0 & 7))) & mask
+            dec = values.reshape(-1)[:size].astype("<i8") - (1 << (nbits - 1))
+            return ndarray_copy(dec.astype(self.dtype), out)
+
+        def get_config(self):
+            return dict(id=self.codec_id, nbits=self.nbits, dtype=self.dtype.str)
+
+        def __repr__(self):
+            return (
+                f"{type(self).__name__}(nbits={self.nbits}, dtype={self.dtype.str!r})"
+            )
+
+    register_codec(BitPack)
+else:
+    BitPack = None
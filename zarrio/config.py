@@ -7,6 +7,8 @@ from pathlib import Path
 import yaml
 import json
 
+from .models import YamlLoader
+
 
 class Config:
     """Configuration management class."""
@@ -37,7 +39,7 @@ class Config:
         
         with open(path, "r") as f:
             if path.suffix.lower() in [".yml", ".yaml"]:
-                config_dict = yaml.safe_load(f)
+                config_dict = yaml.load(f, Loader=YamlLoader)
             elif path.suffix.lower() == ".json":
                 config_dict = json.load(f)
             else:
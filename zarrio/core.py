@@ -3,18 +3,23 @@ Enhanced core functionality for zarrio with retry logic for missing data and dat
 """
 
 import logging
+import random
 import time
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from typing import Dict, Optional, Union, Any, List
 from pathlib import Path
-from functools import cached_property
+from functools import cached_property, lru_cache
 
 import xarray as xr
 import numpy as np
+import dask
 import dask.array as da
 import zarr
 
-from .packing import Packer
+from .packing import NUMERIC_KINDS, Packer
 from .time import TimeManager
 from .exceptions import ConversionError, RetryLimitExceededError
 from .models import (
@@ -37,6 +42,27 @@ try:
 except ImportError:
     FSSPEC_AVAILABLE = False
 
+# Blosc compressor: zarr 3 provides BloscCodec, while zarr 2 uses the
+# numcodecs Blosc compressor
+try:
+    from zarr.codecs import BloscCodec
+except ImportError:
+    BloscCodec = None
+
+try:
+    from numcodecs import Blosc, blosc
+except ImportError:
+    Blosc = None
+    blosc = None
+
+BLOSC_AVAILABLE = BloscCodec is not None or Blosc is not None
+
+# Chunk shape zarr chooses for arrays written without chunks
+try:
+    from zarr.util import guess_chunks
+except ImportError:
+    guess_chunks = None
+
 if DATAMESH_AVAILABLE:
     from oceanum.datamesh.datasource import Datasource
     from oceanum.datamesh import Connector
@@ -52,6 +78,33 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# numcodecs Blosc shuffle constants by name
+_BLOSC_SHUFFLE = {"noshuffle": 0, "shuffle": 1, "bitshuffle": 2}
+
+# Default upper bounds for the Blosc block size, sized for the L2 cache and
+# raised for high compression levels where Zstd gains from a longer window
+_BLOSC_BLOCKSIZE = 256 * 1024
+_BLOSC_BLOCKSIZE_HIGH = 1024 * 1024
+
+# Names of the xarray openers for local datasets by file suffix; anything
+# else is opened with xr.open_dataset and its engine detection
+_OPENERS = {
+    ".nc": "open_dataset",
+    ".nc4": "open_dataset",
+    ".zarr": "open_zarr",
+}
+
+# Blosc threading is process-wide, so concurrent writes share it: the
+# settings from before the first write are restored after the last one ends
+_BLOSC_LOCK = threading.Lock()
+_blosc_writes = 0
+_blosc_saved = None
+
+# Lock for the netCDF library calls on appended local inputs, which are not
+# thread-safe, shared by the prefetch of the next input and the reads of the
+# one being written; reentrant as opening a file reads coordinate data
+_INPUT_LOCK = threading.RLock()
+
 
 class ZarrConverter:
     """Main class for converting data to Zarr format with retry logic."""
@@ -102,9 +155,20 @@ class ZarrConverter:
 
         self.config = config
 
+        # Chunking from the config, built once and shared by every write;
+        # treat as read-only
+        self._chunking_dict = self._chunking_config_to_dict()
+
         # Initialize components
         self.packer = (
-            Packer(nbits=config.packing.bits) if config.packing.enabled else None
+            Packer(
+                nbits=config.packing.bits,
+                keepbits=config.packing.keepbits,
+                store_as_int=config.packing.store_as_int,
+                float_dtype=config.packing.float_dtype,
+            )
+            if config.packing.enabled or config.packing.keepbits is not None
+            else None
         )
         self.time_manager = TimeManager(time_dim=config.time.dim)
 
@@ -114,6 +178,9 @@ class ZarrConverter:
         # Internal state
         self._current_dataset = None
         self._region = None
+        # Time coordinate and dims of local stores, keyed by path, as
+        # (metadata mtime, time values, dims, time step)
+        self._time_index_cache = {}
 
         # Datamesh session state
         self._session = None
@@ -398,11 +465,8 @@ class ZarrConverter:
                 template_dataset, global_start, global_end, freq
             )
 
-            # Setup encoding
-            encoding = self._setup_encoding(archive_ds)
-
             # Apply chunking
-            chunking_dict = self._chunking_config_to_dict()
+            chunking_dict = self._chunking_dict
 
             # If intelligent chunking is requested and we have global time range info,
             # calculate optimal chunking based on the full archive dimensions
@@ -459,12 +523,13 @@ class ZarrConverter:
                         logger.warning(warning)
             else:
                 # Use existing chunking configuration
-                if chunking_dict:
-                    archive_ds = archive_ds.chunk(chunking_dict)
+                archive_ds = self._apply_chunking(archive_ds, chunking_dict)
 
             # Apply chunking if we have chunking configuration
-            if chunking_dict:
-                archive_ds = archive_ds.chunk(chunking_dict)
+            archive_ds = self._apply_chunking(archive_ds, chunking_dict)
+
+            # Setup encoding for the chunks written
+            encoding = self._setup_encoding(archive_ds)
 
             # Get store (could be file path or datamesh client)
             store = (
@@ -474,9 +539,10 @@ class ZarrConverter:
             )
 
             # Write template (compute=False means metadata only)
-            archive_ds.to_zarr(
-                store, mode="w", encoding=encoding, compute=compute, group=group
-            )
+            with self._write_context():
+                archive_ds.to_zarr(
+                    store, mode="w", encoding=encoding, compute=compute, group=group
+                )
 
             logger.info(f"Created template Zarr archive at {output_path}")
 
@@ -489,6 +555,30 @@ class ZarrConverter:
             self._close_session()
             raise ConversionError(f"Failed to create template: {e}") from e
 
+    @contextmanager
+    def _write_context(self):
+        """
+        Apply the configured write concurrency and Blosc threading.
+
+        Chunks are written by dask tasks, so the number of concurrent writes
+        is the number of workers of dask's local threaded scheduler. Blosc
+        threading is process-wide, so it is restored once no write is left
+        running.
+
+        Yields:
+            None, wrap ``to_zarr`` calls in the context
+        """
+        with ExitStack() as stack:
+            concurrency = self.config.io.concurrency
+            if concurrency is not None:
+                stack.enter_context(dask.config.set(num_workers=concurrency))
+            compression = self.config.compression
+            if compression and blosc is not None:
+                nthreads, use_threads = compression.nthreads, compression.use_threads
+                if nthreads is not None or use_threads is not None:
+                    stack.enter_context(_blosc_threading(nthreads, use_threads))
+            yield
+
     def _chunking_config_to_dict(self) -> Dict[str, int]:
         """Convert ChunkingConfig to dictionary."""
         chunking_dict = {}
@@ -500,6 +590,44 @@ class ZarrConverter:
             chunking_dict["lon"] = self.config.chunking.lon
         return chunking_dict
 
+    def _apply_chunking(
+        self, ds: xr.Dataset, chunking_dict: Dict[str, int]
+    ) -> xr.Dataset:
+        """
+        Rechunk a dataset, skipping the rechunk when it is already chunked so.
+
+        Templates built with the configured chunks, or datasets already
+        rechunked, match, and rechunking them again would only add a layer
+        to every dask graph. Dimensions that are not configured keep their
+        chunks, or their full extent for data that is not chunked yet.
+
+        Args:
+            ds: Dataset to rechunk
+            chunking_dict: Target chunk size per dimension
+
+        Returns:
+            Dataset with the requested chunking
+        """
+        # Dimensions the dataset lacks are ignored
+        sizes = ds.sizes
+        target = {dim: size for dim, size in chunking_dict.items() if dim in sizes}
+        if not target:
+            return ds
+
+        for var in ds.data_vars.values():
+            if var.chunks is None:
+                return ds.chunk(target)
+            for dim, chunks in zip(var.dims, var.chunks):
+                size = target.get(dim)
+                if size is None:
+                    continue
+                # Chunks of the target size, with a smaller last chunk
+                if any(c != size for c in chunks[:-1]) or chunks[-1] > size:
+                    return ds.chunk(target)
+
+        logger.debug(f"Dataset already chunked as {target}, skipping rechunk")
+        return ds
+
     def _create_hindcast_template(
         self,
         template_ds: xr.Dataset,
@@ -519,80 +647,63 @@ class ZarrConverter:
         Returns:
             Template dataset with full time range
         """
-        # Determine time range
+        import pandas as pd
+
+        # Determine time range from the template's time values, read once
+        time_dim = self.config.time.dim
+        times = template_ds[time_dim].values
+        ntime = len(times)
         if global_start is None:
-            global_start = template_ds[self.config.time.dim].to_index()[0]
+            global_start = times[0]
         if global_end is None:
-            global_end = template_ds[self.config.time.dim].to_index()[-1]
+            global_end = times[-1]
         if freq is None:
-            if len(template_ds[self.config.time.dim]) >= 2:
-                times = template_ds[self.config.time.dim].to_index()
-                freq = times[1] - times[0]
+            if ntime >= 3:
+                # A frequency alias also handles calendar steps such as months;
+                # the first three times are enough to infer it
+                freq = pd.infer_freq(pd.DatetimeIndex(times[:3]))
+            if ntime >= 2:
+                freq = freq or pd.Timedelta(times[1] - times[0])
             else:
                 # Default to daily if we can't infer
                 freq = "1D"
 
         # Create full time coordinate
-        import pandas as pd
-
         full_time = pd.date_range(start=global_start, end=global_end, freq=freq)
 
-        # Create template dataset with dask arrays
-        template_archive = xr.Dataset()
-
-        # Copy global attributes
-        template_archive.attrs.update(template_ds.attrs)
+        # Target size and configured chunk size of every dimension
+        sizes = dict(template_ds.sizes)
+        sizes[time_dim] = len(full_time)
+        chunking_dict = self._chunking_dict
 
-        # First, copy coordinate variables
-        for coord_name in template_ds.coords:
-            if coord_name == self.config.time.dim:
-                # Replace time coordinate with full range
-                template_archive.coords[coord_name] = full_time
-            else:
-                # Keep other coordinates as they are
-                template_archive.coords[coord_name] = template_ds.coords[coord_name]
+        # Copy coordinate variables, replacing time with the full range
+        coords = {
+            name: full_time if name == time_dim else coord
+            for name, coord in template_ds.coords.items()
+        }
 
-        # Then create variables with full time dimension
+        # Create variables with full time dimension as empty dask arrays
+        data_vars = {}
         for var_name, var in template_ds.data_vars.items():
-            # Get dimensions and coordinates
-            dims = var.dims
-            coords = {}
-            shape = []
-            chunks = []
-
-            # Process each dimension
-            for i, dim in enumerate(dims):
-                if dim == self.config.time.dim:
-                    # Use full time range
-                    coords[dim] = full_time
-                    shape.append(len(full_time))
-                else:
-                    # Use original coordinate
-                    coords[dim] = var.coords[dim]
-                    shape.append(len(var.coords[dim]))
-
-                # Determine chunking
-                chunking_dict = self._chunking_config_to_dict()
-                if dim in chunking_dict:
-                    chunks.append(chunking_dict[dim])
-                else:
-                    # Use variable's original chunking or full dimension size
-                    if (
-                        hasattr(var.data, "chunks")
-                        and var.data.chunks
-                        and i < len(var.data.chunks)
-                    ):
-                        chunks.append(var.data.chunks[i])
-                    else:
-                        chunks.append(shape[-1])
-
-            # Create empty dask array
+            # Use configured chunking, else the variable's original chunk size
+            # or the full dimension size; the original chunk tuple itself only
+            # covers the template's extent
+            var_chunks = var.chunks
+            chunks = tuple(
+                (
+                    chunking_dict[dim]
+                    if dim in chunking_dict
+                    else var_chunks[i][0] if var_chunks else sizes[dim]
+                )
+                for i, dim in enumerate(var.dims)
+            )
+            shape = tuple(sizes[dim] for dim in var.dims)
             data = da.zeros(shape, chunks=chunks, dtype=var.dtype)
+            data_vars[var_name] = (var.dims, data, dict(var.attrs))
 
-            # Add variable to template
-            template_archive[var_name] = xr.DataArray(
-                data=data, coords=coords, dims=dims, attrs=var.attrs
-            )
+        template_archive = xr.Dataset(
+            data_vars, coords=coords, attrs=dict(template_ds.attrs)
+        )
 
         return template_archive
 
@@ -667,57 +778,65 @@ class ZarrConverter:
             drop_variables: List of variables to exclude
             group: Optional datamesh group to write into
         """
+        # Settings used on every attempt
         max_retries = self.config.missing_data.retries_on_missing
+        check_vars = self.config.missing_data.missing_check_vars
+        reopen_on_missing = self.config.missing_data.check_mode == "input"
+
+        # Opened and prepared dataset, kept across retries caused by missing
+        # data in the store so only the write is repeated
+        ds = None
 
         while True:
             try:
-                # Open dataset
-                ds = self._open_dataset(input_path)
+                if ds is None:
+                    # Open dataset
+                    ds = self._open_dataset(input_path)
+
+                    # Process dataset
+                    ds = self._process_dataset(ds, variables, drop_variables)
 
-                # Process dataset
-                ds = self._process_dataset(ds, variables, drop_variables)
+                    # Store current dataset for missing data check
+                    self._current_dataset = ds
 
-                # Store current dataset for missing data check
-                self._current_dataset = ds
+                    # If no region specified, determine automatically
+                    if region is None:
+                        region = self._determine_region(ds, zarr_path)
 
-                # If no region specified, determine automatically
-                if region is None:
-                    region = self._determine_region(ds, zarr_path)
+                    # Store region for missing data check
+                    self._region = region
 
-                # Store region for missing data check
-                self._region = region
+                    # Apply chunking
+                    ds = self._apply_chunking(ds, self._chunking_dict)
 
                 # Setup encoding (minimal for region writing)
                 encoding = {}
 
-                # Apply chunking
-                chunking_dict = self._chunking_config_to_dict()
-                if chunking_dict:
-                    ds = ds.chunk(chunking_dict)
-
                 # Write to region
-                ds.to_zarr(
-                    zarr_path,
-                    region=region,
-                    encoding=encoding,
-                    safe_chunks=False,
-                    group=group,
-                )
+                with self._write_context():
+                    ds.to_zarr(
+                        zarr_path,
+                        region=region,
+                        encoding=encoding,
+                        safe_chunks=False,
+                        group=group,
+                    )
 
                 logger.info(
                     f"Successfully wrote region {region} from {input_path} to {zarr_path}"
                 )
 
                 # Check for missing data if configured
-                if self.config.missing_data.missing_check_vars and self._has_missing(
-                    zarr_path, ds, region
-                ):
+                if check_vars and self._has_missing(zarr_path, ds, region):
                     logger.info("Missing data detected - rewriting region")
                     if self.retried_on_missing < max_retries:
                         self.retried_on_missing += 1
                         logger.info(f"Retry {self.retried_on_missing}/{max_retries}")
+                        if reopen_on_missing:
+                            # Missing data came from the source, so reopen it
+                            ds = None
                         # Wait a bit before retry to allow system to stabilize
-                        time.sleep(0.1 * self.retried_on_missing)
+                        self._sleep_backoff(self.retried_on_missing)
                         continue
                     else:
                         raise RetryLimitExceededError(
@@ -735,14 +854,31 @@ class ZarrConverter:
                 if self.retried_on_missing < max_retries:
                     self.retried_on_missing += 1
                     logger.info(f"Retry {self.retried_on_missing}/{max_retries}")
+                    # The failure may come from the source, so start over
+                    ds = None
                     # Wait a bit before retry
-                    time.sleep(0.1 * self.retried_on_missing)
+                    self._sleep_backoff(self.retried_on_missing)
                     continue
                 else:
                     raise ConversionError(
                         f"Region writing failed after {self.retried_on_missing} retries: {e}"
                     ) from e
 
+    def _sleep_backoff(self, attempt: int) -> None:
+        """
+        Sleep before a retry using exponential backoff with jitter.
+
+        The delay doubles with each attempt up to ``missing_data.cap_s``, and
+        is scaled by a random factor in [0.5, 1.5) so that concurrent writers
+        retrying the same store don't do so in lockstep.
+
+        Args:
+            attempt: Retry number, starting at 1
+        """
+        missing_data = self.config.missing_data
+        delay = min(missing_data.cap_s, missing_data.base_s * 2 ** (attempt - 1))
+        time.sleep(delay * random.uniform(0.5, 1.5))
+
     def _has_missing(
         self,
         zarr_path: Union[str, Path],
@@ -752,6 +888,10 @@ class ZarrConverter:
         """
         Check data just written for missing values.
 
+        Depending on ``missing_data.check_mode`` this either compares the
+        region read back from the store against the input ("roundtrip") or
+        only looks for missing values in the input itself ("input").
+
         Args:
             zarr_path: Path to Zarr store
             input_dataset: Input dataset that was written
@@ -760,55 +900,212 @@ class ZarrConverter:
         Returns:
             True if missing data is detected, False otherwise
         """
-        if not self.config.missing_data.missing_check_vars:
+        missing_data = self.config.missing_data
+        if not missing_data.missing_check_vars:
             logger.warning("No vars specified for checking for missing values")
             return False
 
         try:
-            # Open existing Zarr store
-            with xr.open_zarr(zarr_path, consolidated=True) as store_dset:
-                # Determine variables to check
-                missing_check_vars = self.config.missing_data.missing_check_vars
-                if missing_check_vars == "all":
-                    missing_check_vars = list(store_dset.data_vars.keys())
-                elif not isinstance(missing_check_vars, (list, tuple)):
-                    logger.warning(
-                        "`missing_check_vars` must be one of 'all', None or a list of data"
-                        f" vars to check for missing values, got {missing_check_vars}"
-                    )
-                    return False
-
-                # Datasets to compare
-                dset_out = store_dset[missing_check_vars]
-                dset_in = input_dataset[missing_check_vars]
-
-                # Missing values from input and output datasets
-                if region is not None:
-                    region_filtered = {
-                        k: v for k, v in region.items() if k in dset_in.dims
-                    }
-                    dsmiss_in = dset_in.isnull()
-                    dsmiss_out = dset_out.isel(region_filtered).isnull()
-                else:
-                    dsmiss_in = dset_in.isnull()
-                    dsmiss_out = dset_out.isnull()
-
-                # Check missing values are equal for each variable
-                _has_missing = False
-                for var in dsmiss_out.data_vars:
-                    if not (dsmiss_out[var] == dsmiss_in[var]).all():
-                        logger.warning(
-                            f"Variable '{var}' has missing values in store {zarr_path} "
-                            f"that are not present in input dataset {input_dataset.encoding.get('source', 'unknown')}"
-                        )
-                        _has_missing = True
-
-                return _has_missing
-
+            if missing_data.check_mode == "input":
+                return self._has_missing_input(input_dataset)
+            return self._has_missing_roundtrip(zarr_path, input_dataset, region)
         except Exception as e:
             logger.warning(f"Could not check for missing data: {e}")
             return False
 
+    def _resolve_missing_check_vars(self, dset: xr.Dataset) -> Optional[List[str]]:
+        """
+        Get the variables to check for missing values.
+
+        Args:
+            dset: Dataset whose variables "all" refers to
+
+        Returns:
+            List of variable names, or None if the setting is invalid
+        """
+        missing_check_vars = self.config.missing_data.missing_check_vars
+        if missing_check_vars == "all":
+            return list(dset.data_vars.keys())
+        if not isinstance(missing_check_vars, (list, tuple)):
+            logger.warning(
+                "`missing_check_vars` must be one of 'all', None or a list of data"
+                f" vars to check for missing values, got {missing_check_vars}"
+            )
+            return None
+        return list(missing_check_vars)
+
+    def _has_missing_input(self, input_dataset: xr.Dataset) -> bool:
+        """
+        Check the input dataset for missing values without reading the store.
+
+        Args:
+            input_dataset: Input dataset that was written
+
+        Returns:
+            True if any checked variable has missing values, False otherwise
+        """
+        missing_check_vars = self._resolve_missing_check_vars(input_dataset)
+        if missing_check_vars is None:
+            return False
+
+        # Integer and boolean data cannot hold missing values
+        dset_in = input_dataset[missing_check_vars]
+        missing = {
+            var: dset_in[var].isnull().any().data
+            for var in dset_in.data_vars
+            if dset_in[var].dtype.kind not in "biu"
+        }
+        flags = dict(zip(missing, dask.compute(*missing.values())))
+
+        _has_missing = False
+        for var, has_missing in flags.items():
+            if has_missing:
+                logger.warning(
+                    f"Variable '{var}' has missing values in input dataset "
+                    f"{input_dataset.encoding.get('source', 'unknown')}"
+                )
+                _has_missing = True
+
+        return _has_missing
+
+    def _has_missing_roundtrip(
+        self,
+        zarr_path: Union[str, Path],
+        input_dataset: xr.Dataset,
+        region: Optional[Dict[str, slice]] = None,
+    ) -> bool:
+        """
+        Compare missing values in the store region against the input dataset.
+
+        Args:
+            zarr_path: Path to Zarr store
+            input_dataset: Input dataset that was written
+            region: Region that was written to
+
+        Returns:
+            True if the store has a different missing-value pattern, False otherwise
+        """
+        # Read a written region straight from the zarr arrays, falling back
+        # to xarray when that isn't possible
+        flags = None
+        if region is not None:
+            flags = self._missing_mismatch_raw(zarr_path, input_dataset, region)
+        if flags is None:
+            flags = self._missing_mismatch_xarray(zarr_path, input_dataset, region)
+
+        _has_missing = False
+        for var, mismatch in flags.items():
+            if mismatch:
+                logger.warning(
+                    f"Variable '{var}' has missing values in store {zarr_path} "
+                    f"that are not present in input dataset {input_dataset.encoding.get('source', 'unknown')}"
+                )
+                _has_missing = True
+
+        return _has_missing
+
+    def _missing_mismatch_raw(
+        self,
+        zarr_path: Union[str, Path],
+        input_dataset: xr.Dataset,
+        region: Dict[str, slice],
+    ) -> Optional[Dict[str, bool]]:
+        """
+        Compare missing values of a written region read directly with zarr.
+
+        This skips building an xarray dataset of the store. Store values are
+        missing when they are NaN or equal to the array's fill value (which is
+        also what unwritten chunks read as).
+
+        Args:
+            zarr_path: Path to Zarr store
+            input_dataset: Input dataset that was written
+            region: Region that was written to
+
+        Returns:
+            Mismatch flag per variable, or None if a variable can't be read
+            this way (missing dimension names, time data, extra CF masking)
+        """
+        missing_check_vars = self._resolve_missing_check_vars(input_dataset)
+        if missing_check_vars is None:
+            return {}
+
+        group = zarr.open_group(zarr_path, mode="r")
+        flags = {}
+        for var in missing_check_vars:
+            arr = group[var]
+            in_var = input_dataset[var]
+            dims = arr.attrs.get("_ARRAY_DIMENSIONS")
+            if (
+                dims is None
+                or set(dims) != set(in_var.dims)
+                or "missing_value" in arr.attrs
+                or in_var.dtype.kind in "mM"
+            ):
+                return None
+
+            # Integer data without a fill value cannot hold missing values
+            fill_value = arr.fill_value
+            if arr.dtype.kind in "biu" and fill_value is None:
+                continue
+
+            out = arr[tuple(region.get(dim, slice(None)) for dim in dims)]
+            miss_out = np.zeros(out.shape, dtype=bool)
+            if arr.dtype.kind in "fc":
+                miss_out |= np.isnan(out)
+            if fill_value is not None:
+                miss_out |= out == fill_value
+
+            miss_in = in_var.isnull().transpose(*dims).values
+            flags[var] = bool(np.any(miss_out != miss_in))
+
+        return flags
+
+    def _missing_mismatch_xarray(
+        self,
+        zarr_path: Union[str, Path],
+        input_dataset: xr.Dataset,
+        region: Optional[Dict[str, slice]] = None,
+    ) -> Dict[str, bool]:
+        """
+        Compare missing values of the store, opened with xarray, and the input.
+
+        Args:
+            zarr_path: Path to Zarr store
+            input_dataset: Input dataset that was written
+            region: Region that was written to
+
+        Returns:
+            Mismatch flag per variable
+        """
+        # Open existing Zarr store
+        with xr.open_zarr(zarr_path, consolidated=True) as store_dset:
+            # Determine variables to check
+            missing_check_vars = self._resolve_missing_check_vars(store_dset)
+            if missing_check_vars is None:
+                return {}
+
+            # Datasets to compare
+            dset_out = store_dset[missing_check_vars]
+            dset_in = input_dataset[missing_check_vars]
+
+            # Missing values from input and output datasets
+            if region is not None:
+                region_filtered = {k: v for k, v in region.items() if k in dset_in.dims}
+                dset_out = dset_out.isel(region_filtered)
+
+            # Build one lazy mismatch flag per variable and evaluate them
+            # together, so the store is read in a single pass
+            mismatches = {}
+            for var in dset_out.data_vars:
+                # Integer and boolean data cannot hold missing values
+                if dset_out[var].dtype.kind in "biu":
+                    continue
+                mismatches[var] = (
+                    (dset_out[var].isnull() != dset_in[var].isnull()).any().data
+                )
+            return dict(zip(mismatches, dask.compute(*mismatches.values())))
+
     def _determine_region(
         self, ds: xr.Dataset, zarr_path: Union[str, Path]
     ) -> Dict[str, slice]:
@@ -822,28 +1119,84 @@ class ZarrConverter:
         Returns:
             Dictionary specifying the region to write to
         """
-        # Open existing Zarr store
-        existing_ds = xr.open_zarr(zarr_path)
+        time_dim = self.config.time.dim
+        existing_times, existing_dims, stride = self._get_store_time_index(zarr_path)
 
         # Get time ranges
-        ds_start = ds[self.config.time.dim].to_index()[0]
-        ds_end = ds[self.config.time.dim].to_index()[-1]
-        existing_times = existing_ds[self.config.time.dim].to_index()
+        ds_times = ds[time_dim].values
+        ds_start = ds_times[0]
+        ds_end = ds_times[-1]
 
         # Find indices in existing dataset
-        start_idx = np.searchsorted(existing_times, ds_start, side="left")
-        end_idx = np.searchsorted(existing_times, ds_end, side="right")
+        if stride is not None and ds_times.dtype == existing_times.dtype:
+            # Evenly spaced store times: the same indices as searchsorted
+            # below, by integer arithmetic
+            t0 = existing_times[0].astype(np.int64)
+            start_offset = int(ds_start.astype(np.int64) - t0)
+            end_offset = int(ds_end.astype(np.int64) - t0)
+            ntime = len(existing_times)
+            start_idx = min(max(-(-start_offset // stride), 0), ntime)
+            end_idx = min(max(end_offset // stride + 1, 0), ntime)
+        else:
+            start_idx = int(np.searchsorted(existing_times, ds_start, side="left"))
+            end_idx = int(np.searchsorted(existing_times, ds_end, side="right"))
 
         # Create region dictionary
-        region = {self.config.time.dim: slice(start_idx, end_idx)}
+        region = {time_dim: slice(start_idx, end_idx)}
 
         # Add full slices for other dimensions
-        for dim in existing_ds.dims:
-            if dim != self.config.time.dim:
+        for dim in existing_dims:
+            if dim != time_dim:
                 region[dim] = slice(None)
 
         return region
 
+    def _get_store_time_index(self, zarr_path: Union[str, Path]) -> tuple:
+        """
+        Get the time coordinate values and dimensions of an existing store.
+
+        Results for local stores are cached until the time coordinate's
+        metadata changes (e.g. the store is extended), so repeated region
+        writes to the same archive don't re-read the coordinate.
+
+        Args:
+            zarr_path: Path to existing Zarr store
+
+        Returns:
+            Tuple of (time values as a numpy array, tuple of dimension names,
+            time step as an integer if the times are datetimes evenly spaced
+            in increasing order, else None)
+        """
+        time_dim = self.config.time.dim
+        mtime = None
+        if isinstance(zarr_path, (str, Path)):
+            for name in (".zarray", "zarr.json"):
+                try:
+                    mtime = os.stat(os.path.join(zarr_path, time_dim, name)).st_mtime_ns
+                    break
+                except OSError:
+                    continue
+
+        key = str(zarr_path)
+        cached = self._time_index_cache.get(key)
+        if mtime is not None and cached is not None and cached[0] == mtime:
+            return cached[1:]
+
+        with xr.open_zarr(zarr_path) as existing_ds:
+            existing_times = existing_ds[time_dim].values
+            existing_dims = tuple(existing_ds.dims)
+
+        # Check once whether the times have a constant step
+        stride = None
+        if existing_times.dtype.kind == "M" and len(existing_times) >= 2:
+            steps = np.diff(existing_times.astype(np.int64))
+            if steps[0] > 0 and (steps == steps[0]).all():
+                stride = int(steps[0])
+
+        if mtime is not None:
+            self._time_index_cache[key] = (mtime, existing_times, existing_dims, stride)
+        return existing_times, existing_dims, stride
+
     def convert(
         self,
         input_path: Union[str, Path],
@@ -940,79 +1293,40 @@ class ZarrConverter:
             intelligent_chunking: Whether to use intelligent chunking based on dataset dimensions
             access_pattern: Access pattern for intelligent chunking ("temporal", "spatial", "balanced")
         """
+        # Settings used on every attempt
         max_retries = self.config.missing_data.retries_on_missing
+        check_vars = self.config.missing_data.missing_check_vars
+        reopen_on_missing = self.config.missing_data.check_mode == "input"
+
+        # Opened and prepared dataset, kept across retries caused by missing
+        # data in the store so only the write is repeated
+        ds = None
 
         while True:
             try:
-                # Open dataset
-                ds = self._open_dataset(input_path)
-
-                # Process dataset
-                ds = self._process_dataset(ds, variables, drop_variables, attrs)
-
-                # Store current dataset for missing data check
-                self._current_dataset = ds
-
-                # Setup encoding
-                encoding = self._setup_encoding(ds)
-
-                # Apply chunking
-                chunking_dict = self._chunking_config_to_dict()
-
-                # If intelligent chunking is requested, calculate optimal chunking
-                if intelligent_chunking:
-                    logger.info(
-                        f"Performing intelligent chunking with access pattern: {access_pattern}"
-                    )
-
-                    # Get dimensions from dataset
-                    dimensions = dict(ds.sizes)
+                if ds is None:
+                    # Open dataset
+                    ds = self._open_dataset(input_path)
 
-                    # Get data type size (assume float32 if not specified)
-                    dtype_size_bytes = 4
-                    if ds.data_vars:
-                        first_var = next(iter(ds.data_vars.values()))
-                        dtype_size_bytes = first_var.dtype.itemsize
+                    # Process dataset
+                    ds = self._process_dataset(ds, variables, drop_variables, attrs)
 
-                    # Get target chunk size from config or default
-                    target_chunk_size_mb = self.config.target_chunk_size_mb or 50
+                    # Store current dataset for missing data check
+                    self._current_dataset = ds
 
-                    # Perform chunking analysis
-                    from .chunking import get_chunk_recommendation
-
-                    recommendation = get_chunk_recommendation(
-                        dimensions=dimensions,
-                        dtype_size_bytes=dtype_size_bytes,
-                        access_pattern=access_pattern,
-                        target_chunk_size_mb=target_chunk_size_mb,
+                    ds, encoding = self._prepare_for_convert(
+                        ds, intelligent_chunking, access_pattern
                     )
 
-                    # Merge with any user-specified chunking (user takes precedence)
-                    chunking_dict = recommendation.chunks.copy()
-                    manual_chunks = self._chunking_config_to_dict()
-                    if manual_chunks:
-                        chunking_dict.update(manual_chunks)
-
-                    logger.info(f"Applied intelligent chunking: {chunking_dict}")
-                    logger.info(
-                        f"Estimated chunk size: {recommendation.estimated_chunk_size_mb:.2f} MB"
-                    )
-
-                    if recommendation.warnings:
-                        for warning in recommendation.warnings:
-                            logger.warning(warning)
-
-                if chunking_dict:
-                    ds = ds.chunk(chunking_dict)
-
                 # Write to Zarr
-                ds.to_zarr(store, mode="w", encoding=encoding, group=group)
+                with self._write_context():
+                    ds.to_zarr(store, mode="w", encoding=encoding, group=group)
 
                 logger.info(f"Successfully converted {input_path} to store")
 
                 # Check for missing data if configured
                 # For datamesh, we need to check differently
-                if self.config.missing_data.missing_check_vars:
+                if check_vars:
                     if self.use_datamesh_zarr_client:
                         # For datamesh, we'll skip the missing data check for now
                         # A more sophisticated implementation would check the written data
@@ -1024,8 +1338,11 @@ class ZarrConverter:
                             logger.info(
                                 f"Retry {self.retried_on_missing}/{max_retries}"
                             )
+                            if reopen_on_missing:
+                                # Missing data came from the source, so reopen it
+                                ds = None
                             # Wait a bit before retry to allow system to stabilize
-                            time.sleep(0.1 * self.retried_on_missing)
+                            self._sleep_backoff(self.retried_on_missing)
                             continue
                         else:
                             raise RetryLimitExceededError(
@@ -1043,17 +1360,89 @@ class ZarrConverter:
                 if self.retried_on_missing < max_retries:
                     self.retried_on_missing += 1
                     logger.info(f"Retry {self.retried_on_missing}/{max_retries}")
+                    # The failure may come from the source, so start over
+                    ds = None
                     # Wait a bit before retry
-                    time.sleep(0.1 * self.retried_on_missing)
+                    self._sleep_backoff(self.retried_on_missing)
                     continue
                 else:
                     raise ConversionError(
                         f"Conversion failed after {self.retried_on_missing} retries: {e}"
                     ) from e
 
+    def _prepare_for_convert(
+        self,
+        ds: xr.Dataset,
+        intelligent_chunking: bool = False,
+        access_pattern: str = "balanced",
+    ) -> tuple:
+        """
+        Set up encoding and chunking of a processed dataset for conversion.
+
+        Args:
+            ds: Processed dataset
+            intelligent_chunking: Whether to use intelligent chunking based on dataset dimensions
+            access_pattern: Access pattern for intelligent chunking ("temporal", "spatial", "balanced")
+
+        Returns:
+            Tuple of (chunked dataset, encoding)
+        """
+        # Apply chunking
+        chunking_dict = self._chunking_dict
+
+        # If intelligent chunking is requested, calculate optimal chunking
+        if intelligent_chunking:
+            logger.info(
+                f"Performing intelligent chunking with access pattern: {access_pattern}"
+            )
+
+            # Get dimensions from dataset
+            dimensions = dict(ds.sizes)
+
+            # Get data type size (assume float32 if not specified)
+            dtype_size_bytes = 4
+            if ds.data_vars:
+                first_var = next(iter(ds.data_vars.values()))
+                dtype_size_bytes = first_var.dtype.itemsize
+
+            # Get target chunk size from config or default
+            target_chunk_size_mb = self.config.target_chunk_size_mb or 50
+
+            # Perform chunking analysis
+            from .chunking import get_chunk_recommendation
+
+            recommendation = get_chunk_recommendation(
+                dimensions=dimensions,
+                dtype_size_bytes=dtype_size_bytes,
+                access_pattern=access_pattern,
+                target_chunk_size_mb=target_chunk_size_mb,
+            )
+
+            # Merge with any user-specified chunking (user takes precedence)
+            chunking_dict = recommendation.chunks.copy()
+            manual_chunks = self._chunking_dict
+            if manual_chunks:
+                chunking_dict.update(manual_chunks)
+
+            logger.info(f"Applied intelligent chunking: {chunking_dict}")
+            logger.info(
+                f"Estimated chunk size: {recommendation.estimated_chunk_size_mb:.2f} MB"
+            )
+
+            if recommendation.warnings:
+                for warning in recommendation.warnings:
+                    logger.warning(warning)
+
+        ds = self._apply_chunking(ds, chunking_dict)
+
+        # Setup encoding for the chunks written
+        encoding = self._setup_encoding(ds)
+
+        return ds, encoding
+
     def append(
         self,
-        input_path: Union[str, Path],
+        input_path: Union[str, Path, List[Union[str, Path]]],
         zarr_path: Union[str, Path],
         variables: Optional[list] = None,
         drop_variables: Optional[list] = None,
@@ -1063,22 +1452,72 @@ class ZarrConverter:
         """
         Append data to an existing Zarr store with retry logic.
 
+        Several input files are appended in the given order. While one file
+        is written, the next one is opened and processed in the background.
+
         Args:
-            input_path: Path to input file
+            input_path: Path to input file, or list of paths
             zarr_path: Path to existing Zarr store
             variables: List of variables to include (None for all)
             drop_variables: List of variables to exclude
             group: Optional datamesh group to write into
             skip_cleanup: Skip rolling archive cleanup even if enabled
         """
+        input_paths = (
+            list(input_path) if isinstance(input_path, (list, tuple)) else [input_path]
+        )
         try:
-            # Reset retry counter for new operation
-            self.retried_on_missing = 0
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Prefetched input of the next file, if any
+                pending = None
+                try:
+                    for i, path in enumerate(input_paths):
+                        input_ds = None
+                        if pending is not None:
+                            try:
+                                input_ds = pending.result()
+                            except Exception as e:
+                                # Leave it to the retry logic to open it again
+                                logger.warning(f"Prefetching {path} failed: {e}")
+                        pending = None
+                        if i + 1 < len(input_paths):
+                            pending = executor.submit(
+                                self._open_input,
+                                input_paths[i + 1],
+                                variables,
+                                drop_variables,
+                            )
 
-            # Perform append with retry logic
-            self._append_with_retry(
-                input_path, zarr_path, variables, drop_variables, group
-            )
+                        # Reset retry counter for each file
+                        self.retried_on_missing = 0
+
+                        # Perform append with retry logic, then close the input
+                        # rather than leaving it to the garbage collector, which
+                        # closes files without taking the input lock
+                        try:
+                            self._append_with_retry(
+                                path,
+                                zarr_path,
+                                variables,
+                                drop_variables,
+                                group,
+                                input_ds,
+                            )
+                        finally:
+                            if self._current_dataset is not None:
+                                with _INPUT_LOCK:
+                                    self._current_dataset.close()
+                finally:
+                    # Close the next input if an append failed after it was
+                    # prefetched
+                    if pending is not None and not pending.cancel():
+                        try:
+                            next_ds = pending.result()
+                        except Exception:
+                            pass
+                        else:
+                            with _INPUT_LOCK:
+                                next_ds.close()
 
             self._cleanup_if_enabled(zarr_path, skip_cleanup=skip_cleanup)
 
@@ -1100,6 +1539,7 @@ class ZarrConverter:
         variables: Optional[list] = None,
         drop_variables: Optional[list] = None,
         group: Optional[str] = None,
+        input_ds: Optional[xr.Dataset] = None,
     ) -> None:
         """
         Append data to an existing Zarr store with retry logic.
@@ -1110,52 +1550,62 @@ class ZarrConverter:
             variables: List of variables to include (None for all)
             drop_variables: List of variables to exclude
             group: Optional datamesh group to write into
+            input_ds: Input already opened and processed with _open_input,
+                used for the first attempt
         """
+        # Settings used on every attempt
         max_retries = self.config.missing_data.retries_on_missing
+        check_vars = self.config.missing_data.missing_check_vars
+        reopen_on_missing = self.config.missing_data.check_mode == "input"
+        append_dim = self.config.time.append_dim
+
+        # Opened and processed input, kept across retries caused by missing
+        # data in the store; alignment is redone as the store may have changed
+        if input_ds is not None:
+            self._current_dataset = input_ds
 
         while True:
             try:
-                # Open datasets
-                new_ds = self._open_dataset(input_path)
-                existing_ds = xr.open_zarr(zarr_path)
+                if input_ds is None:
+                    # Open and process new dataset
+                    input_ds = self._open_input(input_path, variables, drop_variables)
 
-                # Process new dataset
-                new_ds = self._process_dataset(new_ds, variables, drop_variables)
+                    # Store current dataset for missing data check
+                    self._current_dataset = input_ds
 
-                # Store current dataset for missing data check
-                self._current_dataset = new_ds
+                existing_ds = xr.open_zarr(zarr_path)
 
                 # Align time dimensions
-                new_ds = self.time_manager.align_for_append(existing_ds, new_ds)
+                new_ds = self.time_manager.align_for_append(existing_ds, input_ds)
 
                 # Setup encoding (minimal for append)
                 encoding = {}
 
                 # Apply chunking
-                chunking_dict = self._chunking_config_to_dict()
-                if chunking_dict:
-                    new_ds = new_ds.chunk(chunking_dict)
+                new_ds = self._apply_chunking(new_ds, self._chunking_dict)
 
                 # Append to Zarr
-                new_ds.to_zarr(
-                    zarr_path,
-                    append_dim=self.config.time.append_dim,
-                    encoding=encoding,
-                    group=group,
-                )
+                with self._write_context():
+                    new_ds.to_zarr(
+                        zarr_path,
+                        append_dim=append_dim,
+                        encoding=encoding,
+                        group=group,
+                    )
 
                 logger.info(f"Successfully appended {input_path} to {zarr_path}")
 
                 # Check for missing data if configured
-                if self.config.missing_data.missing_check_vars and self._has_missing(
-                    zarr_path, new_ds
-                ):
+                if check_vars and self._has_missing(zarr_path, new_ds):
                     logger.info("Missing data detected - rewriting")
                     if self.retried_on_missing < max_retries:
                         self.retried_on_missing += 1
                         logger.info(f"Retry {self.retried_on_missing}/{max_retries}")
+                        if reopen_on_missing:
+                            # Missing data came from the source, so reopen it
+                            input_ds = None
                         # Wait a bit before retry to allow system to stabilize
-                        time.sleep(0.1 * self.retried_on_missing)
+                        self._sleep_backoff(self.retried_on_missing)
                         continue
                     else:
                         raise RetryLimitExceededError(
@@ -1173,14 +1623,37 @@ class ZarrConverter:
                 if self.retried_on_missing < max_retries:
                     self.retried_on_missing += 1
                     logger.info(f"Retry {self.retried_on_missing}/{max_retries}")
+                    # The failure may come from the source, so start over
+                    input_ds = None
                     # Wait a bit before retry
-                    time.sleep(0.1 * self.retried_on_missing)
+                    self._sleep_backoff(self.retried_on_missing)
                     continue
                 else:
                     raise ConversionError(
                         f"Append failed after {self.retried_on_missing} retries: {e}"
                     ) from e
 
+    def _open_input(
+        self,
+        input_path: Union[str, Path],
+        variables: Optional[list] = None,
+        drop_variables: Optional[list] = None,
+    ) -> xr.Dataset:
+        """
+        Open and process an input dataset.
+
+        Args:
+            input_path: Path to input file
+            variables: List of variables to include (None for all)
+            drop_variables: List of variables to exclude
+
+        Returns:
+            Processed dataset
+        """
+        with _INPUT_LOCK:
+            ds = self._open_dataset(input_path, lock=_INPUT_LOCK)
+            return self._process_dataset(ds, variables, drop_variables)
+
     def _is_remote_url(self, path: str) -> bool:
         """Check if path is a remote URL (e.g., gs://, s3://, https://)."""
         return "://" in path and not path.startswith("file://")
@@ -1221,8 +1694,20 @@ class ZarrConverter:
         else:
             return xr.open_dataset(url, engine=engine)
 
-    def _open_dataset(self, path: Union[str, Path]) -> xr.Dataset:
-        """Open dataset from file or remote URL."""
+    def _open_dataset(
+        self, path: Union[str, Path], lock: Optional[Any] = None
+    ) -> xr.Dataset:
+        """
+        Open dataset from file or remote URL.
+
+        Args:
+            path: Path to input file or remote URL
+            lock: Lock for reading local files opened with xr.open_dataset,
+                instead of the xarray default
+
+        Returns:
+            xarray Dataset
+        """
         path_str = str(path)
 
         # Check if this is a remote URL
@@ -1231,12 +1716,11 @@ class ZarrConverter:
             return self._open_remote_dataset(path_str)
 
         # Local file handling
-        if path_str.endswith(".nc") or path_str.endswith(".nc4"):
-            return xr.open_dataset(path_str)
-        elif path_str.endswith(".zarr"):
-            return xr.open_zarr(path_str)
-        else:
-            return xr.open_dataset(path_str)
+        opener_name = _OPENERS.get(Path(path_str).suffix, "open_dataset")
+        opener = getattr(xr, opener_name)
+        if lock is not None and opener_name == "open_dataset":
+            return opener(path_str, lock=lock)
+        return opener(path_str)
 
     def _process_dataset(
         self,
@@ -1271,22 +1755,41 @@ class ZarrConverter:
 
     def _setup_encoding(self, ds: xr.Dataset) -> Dict[str, Any]:
         """Setup encoding for Zarr storage."""
-        encoding = {}
-
-        # Setup compression
-        if self.config.compression:
-            compressor = self._create_compressor()
-            for var in ds.data_vars:
-                encoding[var] = {"compressor": compressor}
-
+        # Variables stored packed into the packer's integer container
+        variables_to_pack = []
         if self.config.packing.enabled and self.packer:
             exclude_vars = self.config.packing.exclude or []
             variables_to_pack = [
                 var
                 for var in ds.data_vars
-                if np.issubdtype(ds[var].dtype, np.number) and var not in exclude_vars
+                if ds.variables[var].dtype.kind in NUMERIC_KINDS
+                and var not in exclude_vars
             ]
 
+        # Setup compression for the stored data type; compressors with the
+        # same settings are shared
+        encoding = {}
+        if self.config.compression:
+            for var in ds.data_vars:
+                variable = ds.variables[var]
+                dtype = (
+                    np.dtype(self.packer.container_dtype)
+                    if var in variables_to_pack
+                    else variable.dtype
+                )
+                if variable.chunks:
+                    chunk_shape = tuple(c[0] for c in variable.chunks)
+                elif guess_chunks is not None and variable.ndim:
+                    # Left to zarr, which picks the chunks from the shape
+                    chunk_shape = guess_chunks(variable.shape, dtype.itemsize)
+                else:
+                    chunk_shape = variable.shape
+                chunk_nbytes = int(np.prod(chunk_shape)) * dtype.itemsize
+                encoding[var] = {
+                    "compressor": self._create_compressor(dtype, chunk_nbytes)
+                }
+
+        if self.config.packing.enabled and self.packer:
             packing_encoding = self.packer.setup_encoding(
                 ds,
                 variables=variables_to_pack,
@@ -1295,38 +1798,157 @@ class ZarrConverter:
                 check_range_exceeded=self.config.packing.check_range_exceeded,
                 range_exceeded_action=self.config.packing.range_exceeded_action,
             )
-            encoding.update(packing_encoding)
-
-        # Setup coordinate chunking
-        for coord_name in ds.coords:
-            if coord_name == self.config.time.append_dim:
-                encoding[coord_name] = {
-                    "chunks": (int(1e6),)
-                }  # Large chunk for append dim
+            for var, var_encoding in packing_encoding.items():
+                encoding.setdefault(var, {}).update(var_encoding)
+        elif self.packer:
+            # Bit-rounding without packing keeps the compressor
+            exclude_vars = self.config.packing.exclude or []
+            bitround_encoding = self.packer.setup_bitround_encoding(
+                ds, variables=[var for var in ds.data_vars if var not in exclude_vars]
+            )
+            for var, var_encoding in bitround_encoding.items():
+                encoding.setdefault(var, {}).update(var_encoding)
+
+        # Setup coordinate chunking from the dimension sizes, or the
+        # underlying variables for non-dimension coordinates, without
+        # building a DataArray per coordinate
+        append_dim = self.config.time.append_dim
+        sizes = ds.sizes
+        for coord_name, coord in ds.coords.variables.items():
+            if coord_name == append_dim:
+                # Large chunk for append dim
+                encoding[coord_name] = {"chunks": (int(1e6),)}
+            elif coord_name in sizes:
+                encoding[coord_name] = {"chunks": (sizes[coord_name],)}
             else:
-                encoding[coord_name] = {"chunks": (int(ds[coord_name].size),)}
+                encoding[coord_name] = {"chunks": (coord.size,)}
 
         return encoding
 
-    def _create_compressor(self):
-        """Create compressor from configuration."""
-        try:
-            import zarr
-            from zarr.codecs import BloscCodec
-
-            if self.config.compression and self.config.compression.method:
-                method = self.config.compression.method
-                if method.startswith("blosc:"):
-                    parts = method.split(":")
-                    cname = parts[1] if len(parts) > 1 else "zstd"
-                    clevel = int(parts[2]) if len(parts) > 2 else 1
-                    return BloscCodec(cname=cname, clevel=clevel, shuffle="shuffle")
-
-            # Default compressor
-            return BloscCodec(cname="zstd", clevel=1, shuffle="shuffle")
-        except ImportError:
+    def _create_compressor(
+        self, dtype: Optional[Any] = None, chunk_nbytes: Optional[int] = None
+    ):
+        """
+        Create compressor from configuration.
+
+        The method is given as ``blosc:<cname>:<clevel>[:<shuffle>]``, or as
+        ``bitshuffle`` for the fastest bit-shuffled compression,
+        ``blosc:lz4:1:bitshuffle``. Without an explicit shuffle, data of up to
+        4 bytes per element is bit-shuffled and wider data byte-shuffled. Blosc
+        blocks span the whole chunk up to
+        the configured block size, by default 256 KiB (L2 sized) or 1 MiB for
+        compression levels of 7 and above.
+
+        Args:
+            dtype: Data type of the variable the compressor is for, used for
+                the shuffle default and the Blosc typesize
+            chunk_nbytes: Size of one chunk of the variable in bytes
+
+        Returns:
+            Blosc compressor, or None if zarr is not available
+        """
+        cname, clevel, shuffle = "zstd", 1, None
+        if self.config.compression and self.config.compression.method:
+            method = self.config.compression.method
+            if method == "bitshuffle":
+                # The shuffle only pays off with a compressor after it; LZ4 at
+                # level 1 adds the least CPU time
+                cname, clevel, shuffle = "lz4", 1, "bitshuffle"
+            elif method.startswith("blosc:"):
+                parts = method.split(":")
+                cname = parts[1] if len(parts) > 1 else "zstd"
+                clevel = int(parts[2]) if len(parts) > 2 else 1
+                shuffle = parts[3] if len(parts) > 3 else None
+
+        itemsize = np.dtype(dtype).itemsize if dtype is not None else None
+        if shuffle is None:
+            shuffle = "shuffle" if itemsize and itemsize > 4 else "bitshuffle"
+
+        # Blocksize of 0 leaves the choice to Blosc
+        max_blocksize = (
+            self.config.compression.blocksize if self.config.compression else None
+        )
+        if max_blocksize is None:
+            max_blocksize = _BLOSC_BLOCKSIZE_HIGH if clevel >= 7 else _BLOSC_BLOCKSIZE
+        blocksize = min(chunk_nbytes, max_blocksize) if chunk_nbytes else 0
+
+        if not BLOSC_AVAILABLE:
             logger.warning("zarr not available, compression disabled")
             return None
+        return _make_blosc(cname, clevel, shuffle, blocksize, itemsize)
+
+
+@contextmanager
+def _blosc_threading(nthreads: Optional[int], use_threads: Optional[bool]):
+    """
+    Apply Blosc threading settings for the duration of a write.
+
+    Args:
+        nthreads: Number of Blosc threads, or None to leave it unchanged
+        use_threads: Whether Blosc uses threads, or None to leave it unchanged
+
+    Yields:
+        None
+    """
+    global _blosc_writes, _blosc_saved
+    with _BLOSC_LOCK:
+        if _blosc_writes == 0:
+            _blosc_saved = (blosc.get_nthreads(), blosc.use_threads)
+        _blosc_writes += 1
+        if nthreads is not None:
+            blosc.set_nthreads(nthreads)
+        if use_threads is not None:
+            blosc.use_threads = use_threads
+    try:
+        yield
+    finally:
+        with _BLOSC_LOCK:
+            _blosc_writes -= 1
+            if _blosc_writes == 0:
+                blosc.set_nthreads(_blosc_saved[0])
+                blosc.use_threads = _blosc_saved[1]
+
+
+@lru_cache(maxsize=32)
+def _make_blosc(
+    cname: str,
+    clevel: int,
+    shuffle: str,
+    blocksize: int,
+    typesize: Optional[int],
+):
+    """
+    Create a Blosc compressor, shared between calls with the same settings.
+
+    Args:
+        cname: Compression algorithm name
+        clevel: Compression level
+        shuffle: Shuffle type ('noshuffle', 'shuffle' or 'bitshuffle')
+        blocksize: Blosc block size in bytes (0 lets Blosc choose)
+        typesize: Element size in bytes, or None if unknown
+
+    Returns:
+        Blosc compressor, or None if neither zarr nor numcodecs provide one
+    """
+    if BloscCodec is not None:
+        kwargs = {"typesize": typesize} if typesize else {}
+        return BloscCodec(
+            cname=cname,
+            clevel=clevel,
+            shuffle=shuffle,
+            blocksize=blocksize,
+            **kwargs,
+        )
+
+    # The numcodecs compressor takes the typesize from the data it compresses
+    if Blosc is not None:
+        return Blosc(
+            cname=cname,
+            clevel=clevel,
+            shuffle=_BLOSC_SHUFFLE[shuffle],
+            blocksize=blocksize,
+        )
+    return None
 
 
 # Convenience functions
@@ -1410,7 +2032,7 @@ def convert_to_zarr(
 
 
 def append_to_zarr(
-    input_path: Union[str, Path],
+    input_path: Union[str, Path, List[Union[str, Path]]],
     zarr_path: Union[str, Path],
     chunking: Optional[Dict[str, int]] = None,
     variables: Optional[list] = None,
@@ -1427,7 +2049,7 @@ def append_to_zarr(
     Append data to an existing Zarr store with retry logic.
 
     Args:
-        input_path: Path to input file
+        input_path: Path to input file, or list of paths appended in order
         zarr_path: Path to existing Zarr store
         chunking: Dictionary specifying chunk sizes for dimensions
         variables: List of variables to include
@@ -2,6 +2,7 @@
 Pydantic models for zarrio configuration and data validation.
 """
 
+from functools import lru_cache
 from typing import Dict, Optional, List, Union, Any
 from pathlib import Path
 import yaml
@@ -10,6 +11,12 @@ from datetime import datetime, timedelta
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Try to import Datasource from oceanum, but make it optional
 try:
     from oceanum.datamesh.datasource import Datasource, Coordinates
@@ -36,7 +43,25 @@ class PackingConfig(BaseModel):
     """Configuration for data packing."""
 
     enabled: bool = Field(False, description="Whether to enable data packing")
-    bits: int = Field(16, description="Number of bits for packing", ge=8, le=32)
+    bits: int = Field(16, description="Number of bits for packing", ge=2, le=32)
+    keepbits: Optional[int] = Field(
+        None,
+        description="Float mantissa bits to keep when bit-rounding before packing "
+        "(None to disable)",
+        ge=0,
+        le=52,
+    )
+    store_as_int: bool = Field(
+        False,
+        description="Store packed variables as integers with CF "
+        "scale_factor/add_offset attributes instead of through a FixedScaleOffset "
+        "filter",
+    )
+    float_dtype: str = Field(
+        "float32",
+        description="Float dtype packed variables decode to ('float16', 'float32', "
+        "'float64')",
+    )
     manual_ranges: Optional[Dict[str, Dict[str, float]]] = Field(
         None,
         description="Manual min/max ranges for variables (e.g., {'temperature': {'min': 0, 'max': 100}})",
@@ -59,8 +84,17 @@ class PackingConfig(BaseModel):
     @field_validator("bits")
     @classmethod
     def validate_bits(cls, v: int) -> int:
-        if v not in [8, 16, 32]:
-            raise ValueError("bits must be one of 8, 16, or 32")
+        if not 2 <= v <= 32:
+            raise ValueError("bits must be between 2 and 32")
+        return v
+
+    @field_validator("float_dtype")
+    @classmethod
+    def validate_float_dtype(cls, v: str) -> str:
+        if v not in ["float16", "float32", "float64"]:
+            raise ValueError(
+                "float_dtype must be one of 'float16', 'float32', 'float64'"
+            )
         return v
 
     @field_validator("range_exceeded_action")
@@ -77,11 +111,48 @@ class CompressionConfig(BaseModel):
     """Configuration for data compression."""
 
     method: Optional[str] = Field(
-        None, description="Compression method (e.g., 'blosc:zstd:3')"
+        None,
+        description="Compression method (e.g., 'blosc:zstd:3', or 'bitshuffle' for "
+        "bit-shuffled LZ4 at level 1)",
     )
     cname: str = Field("zstd", description="Compression algorithm name")
     clevel: int = Field(1, description="Compression level", ge=0, le=9)
     shuffle: str = Field("shuffle", description="Shuffle type")
+    blocksize: Optional[int] = Field(
+        None,
+        description="Maximum Blosc block size in bytes (None for 256 KiB, or "
+        "1 MiB at compression levels of 7 and above; 0 lets Blosc choose)",
+        ge=0,
+    )
+    nthreads: Optional[int] = Field(
+        None,
+        description="Number of Blosc threads compressing each chunk (None for the "
+        "Blosc default)",
+        ge=1,
+    )
+    use_threads: Optional[bool] = Field(
+        None,
+        description="Whether Blosc uses its threads (None to use them only from the "
+        "main thread; set False when writing from several processes)",
+    )
+
+    @field_validator("method")
+    @classmethod
+    def validate_method(cls, v: Optional[str]) -> Optional[str]:
+        if v is None or not v.startswith("blosc:"):
+            return v
+        parts = v.split(":")
+        if len(parts) > 4:
+            raise ValueError(
+                "method must be of the form 'blosc:<cname>:<clevel>[:<shuffle>]'"
+            )
+        if len(parts) > 2 and not (parts[2].isdigit() and 0 <= int(parts[2]) <= 9):
+            raise ValueError("compression level must be between 0 and 9")
+        if len(parts) > 3 and parts[3] not in ["noshuffle", "shuffle", "bitshuffle"]:
+            raise ValueError(
+                "shuffle must be one of 'noshuffle', 'shuffle', 'bitshuffle'"
+            )
+        return v
 
 
 class TimeConfig(BaseModel):
@@ -119,6 +190,27 @@ class MissingDataConfig(BaseModel):
         "all",
         description="Data variables to check and ensure there are not missing values in region writing",
     )
+    base_s: float = Field(
+        0.25,
+        description="Base delay in seconds for exponential backoff between retries",
+        gt=0,
+    )
+    cap_s: float = Field(
+        30.0, description="Maximum delay in seconds between retries", gt=0
+    )
+    check_mode: str = Field(
+        "roundtrip",
+        description="How to check for missing values: 'roundtrip' reads the written "
+        "region back and compares it with the input, 'input' only checks the input "
+        "dataset",
+    )
+
+    @field_validator("check_mode")
+    @classmethod
+    def validate_check_mode(cls, v: str) -> str:
+        if v not in ["roundtrip", "input"]:
+            raise ValueError("check_mode must be one of 'roundtrip', 'input'")
+        return v
 
     @field_validator("check_vars")
     @classmethod
@@ -163,6 +255,14 @@ class DatameshConfig(BaseModel):
         True, description="Whether to use the datamesh zarr client for writing"
     )
 
+    @field_validator("datasource", mode="before")
+    @classmethod
+    def parse_datasource_json(cls, v: Any) -> Any:
+        # Accept the raw JSON string given on the command line
+        if isinstance(v, str):
+            return json.loads(v)
+        return v
+
 
 class RemoteFileConfig(BaseModel):
     """Configuration for remote file handling."""
@@ -188,6 +288,17 @@ class RemoteFileConfig(BaseModel):
         return v
 
 
+class IOConfig(BaseModel):
+    """Configuration for writing to Zarr stores."""
+
+    concurrency: Optional[int] = Field(
+        None,
+        description="Number of threads writing chunks concurrently (None for dask's "
+        "default)",
+        ge=1,
+    )
+
+
 class RollingArchiveConfig(BaseModel):
     """Configuration for rolling archive management."""
 
@@ -251,6 +362,9 @@ class ZarrConverterConfig(BaseModel):
         default_factory=RemoteFileConfig,
         description="Remote file handling configuration",
     )
+    io: IOConfig = Field(
+        default_factory=IOConfig, description="Write I/O configuration"
+    )
     attrs: Dict[str, Any] = Field(
         default_factory=dict, description="Additional global attributes"
     )
@@ -276,6 +390,14 @@ class ZarrConverterConfig(BaseModel):
         description="Data variables to check and ensure there are not missing values in region writing",
     )
 
+    @field_validator("attrs", mode="before")
+    @classmethod
+    def parse_attrs_json(cls, v: Any) -> Any:
+        # Accept the raw JSON string given on the command line
+        if isinstance(v, str):
+            return json.loads(v)
+        return v
+
     @field_validator("access_pattern")
     @classmethod
     def validate_access_pattern(cls, v: str) -> str:
@@ -320,7 +442,7 @@ class ZarrConverterConfig(BaseModel):
             raise FileNotFoundError(f"Configuration file {config_path} not found")
 
         with open(path, "r") as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml.load(f, Loader=YamlLoader)
 
         return cls(**config_dict)
 
@@ -350,15 +472,29 @@ class ZarrConverterConfig(BaseModel):
 
 
 def load_config_from_file(config_path: Union[str, Path]) -> ZarrConverterConfig:
-    """Load configuration from YAML or JSON file."""
+    """
+    Load configuration from YAML or JSON file.
+
+    Parsed configurations are cached per file path and modification time, so
+    repeated loads of an unchanged file skip parsing and validation.
+    """
     path = Path(config_path)
     if not path.exists():
         raise FileNotFoundError(f"Configuration file {config_path} not found")
 
+    config = _load_config_cached(str(path.resolve()), path.stat().st_mtime_ns)
+    # Hand out a copy so callers can't mutate the cached instance
+    return config.model_copy(deep=True)
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime_ns: int) -> ZarrConverterConfig:
+    """Parse and validate a configuration file; cached on (path, mtime_ns)."""
+    suffix = Path(path).suffix.lower()
     with open(path, "r") as f:
-        if path.suffix.lower() in [".yml", ".yaml"]:
-            config_dict = yaml.safe_load(f)
-        elif path.suffix.lower() == ".json":
+        if suffix in [".yml", ".yaml"]:
+            config_dict = yaml.load(f, Loader=YamlLoader)
+        elif suffix == ".json":
             config_dict = json.load(f)
         else:
             raise ValueError("Configuration file must be YAML or JSON")
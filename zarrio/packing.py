@@ -3,203 +3,626 @@ Data packing functionality for zarrio.
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Union, List
 
+import dask
+import dask.array as dsa
 import xarray as xr
 import numpy as np
 
 try:
     from zarr.codecs import FixedScaleOffset
+
     ZARR_AVAILABLE = True
 except ImportError:
     ZARR_AVAILABLE = False
     FixedScaleOffset = None
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+if NUMBA_AVAILABLE:
+
+    @njit(nogil=True, cache=True)
+    def _fused_range(flat):
+        """Compute the NaN-skipping min and max of a 1-D array in one pass."""
+        vmin = np.inf
+        vmax = -np.inf
+        for x in flat:
+            # Comparisons with NaN are false, so NaN is skipped
+            if x < vmin:
+                vmin = x
+            if x > vmax:
+                vmax = x
+        if vmin > vmax:
+            return np.nan, np.nan
+        return vmin, vmax
+
+
+# dtypes reduced by _fused_range
+_FUSED_RANGE_DTYPES = frozenset(
+    np.dtype(t)
+    for t in (
+        "float32",
+        "float64",
+        "int8",
+        "int16",
+        "int32",
+        "int64",
+        "uint8",
+        "uint16",
+        "uint32",
+        "uint64",
+    )
+)
+
+# Float dtypes packed variables can decode to
+FLOAT_DTYPES = ("float16", "float32", "float64")
+
+# dtype kinds of numeric (np.number) variables
+NUMERIC_KINDS = frozenset("iufc")
+
+# Elements reduced per block by _data_range, small enough for the block to
+# stay in cache between its min and max reductions
+_RANGE_BLOCK = 1 << 16
+
+
+def _data_range(data: Any) -> tuple:
+    """
+    Compute the NaN-skipping minimum and maximum of an array.
+
+    Dask arrays are reduced in a single graph so each chunk is loaded once.
+    NumPy arrays are reduced in one pass by a compiled kernel when numba is
+    installed, otherwise a cache-sized block at a time, so both reductions
+    still share one pass over memory.
+
+    Args:
+        data: NumPy or dask array
+
+    Returns:
+        Tuple of (vmin, vmax) as floats
+    """
+    if isinstance(data, dsa.Array):
+        vmin, vmax = dask.compute(*_lazy_range(data))
+        return float(vmin), float(vmax)
+    flat = np.ravel(data)
+    if NUMBA_AVAILABLE and flat.size and flat.dtype in _FUSED_RANGE_DTYPES:
+        vmin, vmax = _fused_range(flat)
+        return float(vmin), float(vmax)
+    if flat.size <= _RANGE_BLOCK:
+        return float(np.nanmin(flat)), float(np.nanmax(flat))
+    # fmin/fmax skip NaN, so all-NaN blocks need no special casing
+    vmin, vmax = np.nan, np.nan
+    for start in range(0, flat.size, _RANGE_BLOCK):
+        block = flat[start : start + _RANGE_BLOCK]
+        vmin = np.fmin(vmin, np.fmin.reduce(block))
+        vmax = np.fmax(vmax, np.fmax.reduce(block))
+    return float(vmin), float(vmax)
+
+
+def _lazy_range(data: dsa.Array) -> tuple:
+    """
+    Build the lazy min and max reductions of a dask array.
+
+    Only float data can hold NaN, so other dtypes use the plain reductions
+    without the NaN handling.
+
+    Args:
+        data: Dask array
+
+    Returns:
+        Tuple of lazy (vmin, vmax) arrays
+    """
+    if data.dtype.kind in "fc":
+        return dsa.nanmin(data), dsa.nanmax(data)
+    return data.min(), data.max()
+
+
+def _data_ranges(ds: xr.Dataset, variables: List[str]) -> Dict[str, tuple]:
+    """
+    Compute the NaN-skipping ranges of several variables.
+
+    Dask-backed variables are reduced together in a single graph, so the
+    scheduler loads each chunk once for all reductions. Large NumPy-backed
+    variables are reduced in a thread pool, as NumPy releases the GIL
+    during reductions.
+
+    Args:
+        ds: Dataset containing the variables
+        variables: Variables to compute ranges for
+
+    Returns:
+        Dictionary of (vmin, vmax) tuples by variable
+    """
+    ranges = {}
+    lazy_vars = [var for var in variables if ds.variables[var].chunks is not None]
+    if lazy_vars:
+        lazy_ranges = dask.compute(
+            *[_lazy_range(ds.variables[var].data) for var in lazy_vars]
+        )
+        for var, (vmin, vmax) in zip(lazy_vars, lazy_ranges):
+            ranges[var] = (float(vmin), float(vmax))
+    eager_vars = [var for var in variables if var not in ranges]
+    large_vars = [var for var in eager_vars if ds.variables[var].size > _RANGE_BLOCK]
+    if len(large_vars) > 1:
+        workers = min(len(large_vars), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            large_ranges = executor.map(
+                lambda var: _data_range(ds.variables[var].values), large_vars
+            )
+            ranges.update(zip(large_vars, large_ranges))
+    for var in eager_vars:
+        if var not in ranges:
+            ranges[var] = _data_range(ds.variables[var].values)
+    return ranges
+
+
+if ZARR_AVAILABLE:
+    from numcodecs import BitRound
+    from numcodecs.compat import ensure_ndarray
+
+    from .codecs import BitPack
+
+    class FusedScaleOffset(FixedScaleOffset):
+        """
+        FixedScaleOffset filter that encodes through a single work buffer.
+
+        The stock encode allocates a new array for the subtraction, the scaling
+        and the rounding. Here the rounding and scaling happen in place. The
+        codec id and config are inherited, so stores remain readable with the
+        standard FixedScaleOffset codec.
+        """
+
+        def encode(self, buf):
+            arr = ensure_ndarray(buf).view(self.dtype)
+            enc = np.subtract(arr, self.offset)
+            np.multiply(enc, self.scale, out=enc)
+            np.rint(enc, out=enc)
+            return enc.astype(self.astype, copy=False)
+
+else:
+    FusedScaleOffset = None
+    BitPack = None
+    BitRound = None
+
 
 class Packer:
     """Handles data packing using fixed-scale offset encoding."""
-    
-    def __init__(self, nbits: int = 16):
+
+    def __init__(
+        self,
+        nbits: int = 16,
+        keepbits: Optional[int] = None,
+        store_as_int: bool = False,
+        float_dtype: str = "float32",
+    ):
         """
         Initialize the Packer.
-        
+
         Args:
-            nbits: Number of bits for packing (8, 16, 32)
+            nbits: Number of bits for packing (2-32); widths other than 8, 16
+                and 32 are bit-packed into the smallest integer container
+            keepbits: Number of float mantissa bits to keep when bit-rounding
+                (None to disable). Rounding zeros the trailing mantissa bits,
+                which makes the data far more compressible
+            store_as_int: Store packed variables as integers with CF
+                scale_factor/add_offset attributes, unpacked by xarray on
+                read, instead of through a FixedScaleOffset filter
+            float_dtype: Float dtype packed variables decode to ('float16',
+                'float32' or 'float64'); float16 halves the decoded size of
+                float32 but only suits ranges it resolves to the packing step
         """
-        if nbits not in [8, 16, 32]:
-            raise ValueError("nbits must be one of 8, 16, or 32")
-        
+        # One bit would leave a single code next to the reserved fill value
+        if not 2 <= nbits <= 32:
+            raise ValueError("nbits must be between 2 and 32")
+        if keepbits is not None and not 0 <= keepbits <= 52:
+            raise ValueError("keepbits must be between 0 and 52")
+        if float_dtype not in FLOAT_DTYPES:
+            raise ValueError(f"float_dtype must be one of {', '.join(FLOAT_DTYPES)}")
+
         self.nbits = nbits
+        self.keepbits = keepbits
+        self.store_as_int = store_as_int
         self.dtype_map = {8: "int8", 16: "int16", 32: "int32"}
-        self.float_dtype = "float32"
-    
-    def compute_scale_and_offset(self, vmin: float, vmax: float) -> tuple:
+        self.container_dtype = self.dtype_map[
+            min(n for n in self.dtype_map if n >= nbits)
+        ]
+        # Widths without a native integer type are bit-packed by a filter that
+        # is the same for every variable
+        self._bitpack = (
+            BitPack(nbits=nbits, dtype=self.container_dtype)
+            if ZARR_AVAILABLE and nbits not in self.dtype_map
+            else None
+        )
+        self.float_dtype = float_dtype
+        # The lowest packed value, -2**(nbits-1), is reserved as fill value,
+        # so valid data spans 2**nbits - 2 steps centred on zero
+        self._half = 1 << (nbits - 1)
+        self._range = (1 << nbits) - 2
+        self.fill_int = -self._half
+
+    def compute_scale_and_offset(
+        self, vmin: Union[float, np.ndarray], vmax: Union[float, np.ndarray]
+    ) -> tuple:
         """
         Compute scale and offset for fixed-scale offset encoding.
-        
+
+        The range maps onto the packed values above the fill value, from
+        -2**(nbits-1) + 1 to 2**(nbits-1) - 1.
+
         Args:
-            vmin: Minimum value
-            vmax: Maximum value
-            
+            vmin: Minimum value, or array of minimum values
+            vmax: Maximum value, or array of maximum values
+
         Returns:
-            Tuple of (scale_factor, offset)
+            Tuple of (scale_factor, offset), as arrays if array input was given
         """
-        if vmax == vmin:
-            scale_factor = 1.0
-        else:
-            scale_factor = (vmax - vmin) / (2**self.nbits - 1)
-        offset = vmin + 2 ** (self.nbits - 1) * scale_factor
+        vmin = np.asarray(vmin, dtype=np.float64)
+        span = np.asarray(vmax, dtype=np.float64) - vmin
+        # Constant ranges get a unit scale
+        scale_factor = np.divide(
+            span, self._range, out=np.ones_like(span), where=span != 0
+        )
+        # The range midpoint packs to zero
+        offset = vmin + 0.5 * span
+        if scale_factor.ndim == 0:
+            return float(scale_factor), float(offset)
         return scale_factor, offset
-    
+
+    def compute_inv_scale_and_offset(
+        self, vmin: Union[float, np.ndarray], vmax: Union[float, np.ndarray]
+    ) -> tuple:
+        """
+        Compute the inverse scale and offset used by FixedScaleOffset.
+
+        The inverse scale is computed directly rather than by inverting the
+        result of compute_scale_and_offset.
+
+        Args:
+            vmin: Minimum value, or array of minimum values
+            vmax: Maximum value, or array of maximum values
+
+        Returns:
+            Tuple of (inv_scale, offset), as arrays if array input was given
+        """
+        vmin = np.asarray(vmin, dtype=np.float64)
+        span = np.asarray(vmax, dtype=np.float64) - vmin
+        # Constant ranges get a unit scale
+        inv_scale = np.divide(
+            self._range, span, out=np.ones_like(span), where=span != 0
+        )
+        offset = vmin + 0.5 * span
+        if inv_scale.ndim == 0:
+            return float(inv_scale), float(offset)
+        return inv_scale, offset
+
     def setup_encoding(
-        self, 
-        ds: xr.Dataset, 
+        self,
+        ds: xr.Dataset,
         variables: Optional[List[str]] = None,
         manual_ranges: Optional[Dict[str, Dict[str, float]]] = None,
         auto_buffer_factor: float = 0.01,
         check_range_exceeded: bool = True,
-        range_exceeded_action: str = "warn"
+        range_exceeded_action: str = "warn",
     ) -> Dict[str, Any]:
         """
         Setup encoding for dataset variables with enhanced packing options.
-        
+
         Priority order for determining min/max values:
         1. Manual ranges (if provided)
         2. Variable attributes (valid_min/valid_max)
         3. Automatic calculation from data
-        
+
         Args:
             ds: Dataset to setup encoding for
             variables: List of variables to pack (None for all numeric variables)
-            manual_ranges: Dictionary specifying manual min/max values 
+            manual_ranges: Dictionary specifying manual min/max values
                           e.g., {"temperature": {"min": 0, "max": 100}}
             auto_buffer_factor: Buffer factor for automatically calculated ranges
             check_range_exceeded: Whether to check if data exceeds specified ranges
             range_exceeded_action: Action when data exceeds range ("warn", "error", "ignore")
-            
+
         Returns:
             Dictionary of encoding specifications
         """
         if not ZARR_AVAILABLE:
             logger.warning("zarr not available, packing disabled")
             return {}
-        
+
         encoding = {}
         manual_ranges = manual_ranges or {}
-        
+
         # Determine which variables to pack
         if variables is None:
             # Pack all numeric variables
-            variables = [var for var in ds.data_vars 
-                        if np.issubdtype(ds[var].dtype, np.number)]
-        
+            variables = [
+                var
+                for var in ds.data_vars
+                if ds.variables[var].dtype.kind in NUMERIC_KINDS
+            ]
+
+        # Determine declared min/max values, then compute the data ranges
+        # needed for automatic ranges and range checks in one pass
+        declared = {
+            var: self._declared_range(ds, var, manual_ranges)
+            for var in variables
+            if var in ds.data_vars
+        }
+        check = check_range_exceeded and range_exceeded_action != "ignore"
+        data_ranges = _data_ranges(
+            ds, [var for var, (vmin, vmax) in declared.items() if check or vmin is None]
+        )
+
+        ranges = {}
+        for var, (vmin, vmax) in declared.items():
+            if vmin is None:
+                # Automatically calculate from data with warning
+                logger.warning(
+                    f"Variable {var} missing valid_min/valid_max attributes. "
+                    f"Automatically calculating range from data. "
+                    f"Note: These values may be inaccurate for archives written a region at a time."
+                )
+                vmin, vmax = self._calculate_range_from_data(
+                    ds, var, auto_buffer_factor, data_ranges[var]
+                )
+
+            # Check if data exceeds specified range
+            if check:
+                self._check_range_exceeded(
+                    ds, var, vmin, vmax, range_exceeded_action, data_ranges[var]
+                )
+            ranges[var] = (vmin, vmax)
+
+        if not ranges:
+            return encoding
+
+        # Compute scales and offsets for all variables at once
+        vmins, vmaxs = np.array(list(ranges.values()), dtype=np.float64).T
+        if self.store_as_int:
+            scale_factors, offsets = self.compute_scale_and_offset(vmins, vmaxs)
+            return self._setup_int_encoding(ranges, scale_factors, offsets)
+
+        inv_scales, offsets = self.compute_inv_scale_and_offset(vmins, vmaxs)
+        bitround_filters = self._bitround_filters(self.float_dtype)
+
+        for i, (var, (vmin, vmax)) in enumerate(ranges.items()):
+            self._check_float_precision(var, vmin, vmax, 1 / inv_scales[i])
+
+            # Create fixed scale-offset filter
+            filters = list(bitround_filters)
+            filters.append(
+                FusedScaleOffset(
+                    offset=float(offsets[i]),
+                    scale=float(inv_scales[i]),
+                    dtype=self.float_dtype,
+                    astype=self.container_dtype,
+                )
+            )
+            if self._bitpack:
+                filters.append(self._bitpack)
+
+            encoding[var] = {
+                "filters": filters,
+                "_FillValue": self._decoded_fill_value(inv_scales[i], offsets[i]),
+                "dtype": self.float_dtype,
+            }
+
+            logger.debug(
+                f"Setup packing for variable {var} with inverse "
+                f"scale={inv_scales[i]}, offset={offsets[i]}"
+            )
+
+        return encoding
+
+    def _setup_int_encoding(
+        self, ranges: Dict[str, tuple], scale_factors: np.ndarray, offsets: np.ndarray
+    ) -> Dict[str, Any]:
+        """
+        Setup CF integer encoding for packed variables.
+
+        xarray applies scale_factor and add_offset when writing and reading,
+        so readers that skip mask_and_scale get the packed integers directly.
+        Missing values are stored as the reserved packed fill value.
+
+        Args:
+            ranges: Dictionary of (vmin, vmax) by variable
+            scale_factors: Scale factor of each variable in ranges
+            offsets: Offset of each variable in ranges
+
+        Returns:
+            Dictionary of encoding specifications
+        """
+        encoding = {}
+        for i, var in enumerate(ranges):
+            encoding[var] = {
+                "dtype": self.container_dtype,
+                "scale_factor": float(scale_factors[i]),
+                "add_offset": float(offsets[i]),
+                "_FillValue": self.fill_int,
+            }
+            if self._bitpack:
+                encoding[var]["filters"] = [self._bitpack]
+            logger.debug(
+                f"Setup integer packing for variable {var} with "
+                f"scale={scale_factors[i]}, offset={offsets[i]}"
+            )
+        return encoding
+
+    def _check_float_precision(
+        self, var: str, vmin: float, vmax: float, scale_factor: float
+    ) -> None:
+        """
+        Check that a half-precision float dtype resolves the packing step.
+
+        Decoding to a float with a coarser spacing than the packing step
+        would lose precision, and the fill value (one step below vmin) would
+        not encode back to the reserved integer.
+
+        Args:
+            var: Variable name
+            vmin: Minimum of the packed range
+            vmax: Maximum of the packed range
+            scale_factor: Packing step
+
+        Raises:
+            ValueError: If the float dtype cannot hold the range at the step
+        """
+        finfo = np.finfo(self.float_dtype)
+        if finfo.bits >= 32:
+            return
+        magnitude = max(abs(vmin - scale_factor), abs(vmax))
+        if magnitude > finfo.max:
+            raise ValueError(
+                f"Range [{vmin}, {vmax}] of variable {var} exceeds {self.float_dtype}"
+            )
+        spacing = float(np.spacing(finfo.dtype.type(magnitude)))
+        if 2 * spacing > scale_factor:
+            raise ValueError(
+                f"{self.float_dtype} spacing {spacing} near {magnitude} is too coarse "
+                f"for the packing step {scale_factor} of variable {var}; use fewer "
+                f"bits or a wider float dtype"
+            )
+
+    def _decoded_fill_value(self, inv_scale: float, offset: float) -> float:
+        """
+        Get the float fill value that packs to the reserved fill integer.
+
+        The value is computed the way FixedScaleOffset decodes, so reading
+        the fill integer back gives exactly this value and xarray masks it.
+
+        Args:
+            inv_scale: Inverse scale of the FixedScaleOffset filter
+            offset: Offset of the FixedScaleOffset filter
+
+        Returns:
+            Fill value in the float dtype
+        """
+        return float(
+            np.dtype(self.float_dtype).type(self.fill_int / inv_scale + offset)
+        )
+
+    def setup_bitround_encoding(
+        self, ds: xr.Dataset, variables: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Setup bit-rounding encoding for floating point variables.
+
+        This is used when bit-rounding is requested without packing; the
+        variables keep their dtype and only have their mantissa rounded.
+
+        Args:
+            ds: Dataset to setup encoding for
+            variables: List of variables to round (None for all float variables)
+
+        Returns:
+            Dictionary of encoding specifications
+        """
+        if not ZARR_AVAILABLE or self.keepbits is None:
+            return {}
+
+        if variables is None:
+            variables = list(ds.data_vars)
+
+        encoding = {}
         for var in variables:
-            if var in ds.data_vars:
-                # Determine min/max values based on priority order
-                vmin, vmax = self._get_variable_range(ds, var, manual_ranges, auto_buffer_factor)
-                
-                if vmin is not None and vmax is not None:
-                    # Check if data exceeds specified range
-                    if check_range_exceeded:
-                        self._check_range_exceeded(ds, var, vmin, vmax, range_exceeded_action)
-                    
-                    # Compute scale and offset
-                    scale_factor, offset = self.compute_scale_and_offset(vmin, vmax)
-                    
-                    # Create FixedScaleOffset filter
-                    filt = FixedScaleOffset(
-                        offset=offset,
-                        scale=1 / scale_factor,
-                        dtype=self.float_dtype,
-                        astype=self.dtype_map[self.nbits]
-                    )
-                    
-                    encoding[var] = {
-                        "filters": [filt],
-                        "_FillValue": vmax,
-                        "dtype": self.float_dtype
-                    }
-                    
-                    logger.debug(f"Setup packing for variable {var} with scale={scale_factor}, offset={offset}")
-                else:
-                    logger.debug(f"Could not determine valid range for variable {var}, skipping packing")
-        
+            if var in ds.data_vars and ds[var].dtype.kind == "f":
+                encoding[var] = {"filters": self._bitround_filters(ds[var].dtype)}
         return encoding
-    
-    def _get_variable_range(
-        self, 
-        ds: xr.Dataset, 
-        var: str, 
-        manual_ranges: Dict[str, Dict[str, float]], 
-        auto_buffer_factor: float
+
+    def _bitround_filters(self, dtype: Union[str, np.dtype]) -> List[Any]:
+        """
+        Get the bit-rounding filter for a float dtype.
+
+        Args:
+            dtype: Floating point dtype the filter is applied to
+
+        Returns:
+            List with a BitRound filter, or an empty list if disabled
+        """
+        if self.keepbits is None:
+            return []
+        # Keeping every mantissa bit is a no-op
+        nmant = np.finfo(dtype).nmant
+        if self.keepbits >= nmant:
+            return []
+        return [BitRound(keepbits=self.keepbits)]
+
+    def _declared_range(
+        self, ds: xr.Dataset, var: str, manual_ranges: Dict[str, Dict[str, float]]
     ) -> tuple:
         """
-        Determine min/max values for a variable based on priority order.
-        
+        Determine the declared min/max values for a variable.
+
+        Manual ranges take priority over the valid_min/valid_max attributes.
+
         Args:
             ds: Dataset containing the variable
             var: Variable name
             manual_ranges: Manual ranges dictionary
-            auto_buffer_factor: Buffer factor for automatic calculation
-            
+
         Returns:
-            Tuple of (vmin, vmax) or (None, None) if unable to determine
+            Tuple of (vmin, vmax) or (None, None) if neither is given
         """
+        attrs = ds.variables[var].attrs
+
         # 1. Check for manual ranges
         if var in manual_ranges:
             manual_min = manual_ranges[var].get("min")
             manual_max = manual_ranges[var].get("max")
-            
+
             if manual_min is not None and manual_max is not None:
                 # Warn if manual ranges override existing attributes
-                attr_min = ds[var].attrs.get("valid_min")
-                attr_max = ds[var].attrs.get("valid_max")
+                attr_min = attrs.get("valid_min")
+                attr_max = attrs.get("valid_max")
                 if attr_min is not None and attr_max is not None:
                     logger.warning(
                         f"Using manually specified range [{manual_min}, {manual_max}] for variable {var} "
                         f"instead of attributes [{attr_min}, {attr_max}]"
                     )
                 return float(manual_min), float(manual_max)
-        
+
         # 2. Check for variable attributes
-        vmin = ds[var].attrs.get("valid_min")
-        vmax = ds[var].attrs.get("valid_max")
+        vmin = attrs.get("valid_min")
+        vmax = attrs.get("valid_max")
         if vmin is not None and vmax is not None:
-            # Add small buffer to vmax to avoid masking valid data
-            vmax = vmax + (vmax - vmin) * 0.001
-            return float(vmin), float(vmax)
-        
-        # 3. Automatically calculate from data with warning
-        logger.warning(
-            f"Variable {var} missing valid_min/valid_max attributes. "
-            f"Automatically calculating range from data. "
-            f"Note: These values may be inaccurate for archives written a region at a time."
-        )
-        return self._calculate_range_from_data(ds, var, auto_buffer_factor)
-    
+            # Pack to a slightly extended range, so values rounding just above
+            # valid_max don't overflow the top packed value; valid_max itself
+            # is left as it is
+            vmax_extended = vmax + (vmax - vmin) * 0.001
+            return float(vmin), float(vmax_extended)
+
+        return None, None
+
     def _calculate_range_from_data(
-        self, 
-        ds: xr.Dataset, 
-        var: str, 
-        buffer_factor: float
+        self,
+        ds: xr.Dataset,
+        var: str,
+        buffer_factor: float,
+        data_range: Optional[tuple] = None,
     ) -> tuple:
         """
         Calculate min/max values from data with buffer.
-        
+
         Args:
             ds: Dataset containing the variable
             var: Variable name
             buffer_factor: Buffer factor to extend range
-            
+            data_range: Precomputed (min, max) of the data, computed if None
+
         Returns:
             Tuple of (vmin, vmax)
         """
         # Compute min and max values
-        vmin = float(ds[var].min().values)
-        vmax = float(ds[var].max().values)
-        
+        vmin, vmax = data_range or _data_range(ds[var].data)
+
         # Apply buffer
         if vmin != vmax:
             range_size = vmax - vmin
@@ -215,98 +638,117 @@ class Packer:
                 buffer = abs(vmin) * buffer_factor
                 vmin -= buffer
                 vmax += buffer
-        
-        logger.debug(f"Calculated range for {var}: [{vmin}, {vmax}] with buffer factor {buffer_factor}")
+
+        logger.debug(
+            f"Calculated range for {var}: [{vmin}, {vmax}] with buffer factor "
+            f"{buffer_factor}"
+        )
         return vmin, vmax
-    
+
     def _check_range_exceeded(
-        self, 
-        ds: xr.Dataset, 
-        var: str, 
-        vmin: float, 
-        vmax: float, 
-        action: str
+        self,
+        ds: xr.Dataset,
+        var: str,
+        vmin: float,
+        vmax: float,
+        action: str,
+        data_range: Optional[tuple] = None,
     ) -> None:
         """
         Check if data exceeds specified range and take appropriate action.
-        
+
         Args:
             ds: Dataset containing the variable
             var: Variable name
             vmin: Specified minimum value
             vmax: Specified maximum value
             action: Action to take ("warn", "error", "ignore")
+            data_range: Precomputed (min, max) of the data, computed if None
         """
         if action == "ignore":
             return
-            
+
         # Compute actual min/max from data
-        data_min = float(ds[var].min().values)
-        data_max = float(ds[var].max().values)
-        
+        data_min, data_max = data_range or _data_range(ds[var].data)
+
         # Check if data exceeds range
         if data_min < vmin or data_max > vmax:
             message = (
                 f"Data for variable {var} exceeds specified range [{vmin}, {vmax}]. "
                 f"Actual range is [{data_min}, {data_max}]."
             )
-            
+
             if action == "warn":
                 logger.warning(message)
             elif action == "error":
                 raise ValueError(message)
-    
+
     def add_valid_range_attributes(
-        self, 
-        ds: xr.Dataset, 
+        self,
+        ds: xr.Dataset,
         buffer_factor: float = 0.01,
-        variables: Optional[List[str]] = None
+        variables: Optional[List[str]] = None,
+        inplace: bool = False,
     ) -> xr.Dataset:
         """
         Add valid_min and valid_max attributes to variables based on their data range.
-        
+
+        Unless inplace is set, the attributes are added to a shallow copy: the
+        data is shared with the input, the attribute dictionaries are not.
+
         Args:
             ds: Dataset to add attributes to
             buffer_factor: Factor to extend range by (e.g., 0.01 = 1% buffer)
             variables: List of variables to process (None for all numeric variables)
-            
+            inplace: Whether to add the attributes to ds itself
+
         Returns:
             Dataset with added attributes
         """
-        ds = ds.copy()
-        
+        if not inplace:
+            ds = ds.copy(deep=False)
+
         # Determine which variables to process
         if variables is None:
             # Process all numeric variables
-            variables = [var for var in ds.data_vars 
-                        if np.issubdtype(ds[var].dtype, np.number)]
-        
+            variables = [
+                var
+                for var in ds.data_vars
+                if ds.variables[var].dtype.kind in NUMERIC_KINDS
+            ]
+        else:
+            variables = [
+                var
+                for var in variables
+                if var in ds.data_vars and ds.variables[var].dtype.kind in NUMERIC_KINDS
+            ]
+
+        # Compute all ranges up front, lazy variables in a single dask graph
+        ranges = _data_ranges(ds, variables)
+
         for var in variables:
-            if var in ds.data_vars and np.issubdtype(ds[var].dtype, np.number):
-                # Compute min and max values
-                vmin = float(ds[var].min().values)
-                vmax = float(ds[var].max().values)
-                
-                # Apply buffer
-                if vmin != vmax:
-                    range_size = vmax - vmin
-                    buffer = range_size * buffer_factor
+            vmin, vmax = ranges[var]
+
+            # Apply buffer
+            if vmin != vmax:
+                range_size = vmax - vmin
+                buffer = range_size * buffer_factor
+                vmin -= buffer
+                vmax += buffer
+            else:
+                # For constant fields, add a small buffer
+                if vmin == 0:
+                    vmin = -0.01
+                    vmax = 0.01
+                else:
+                    buffer = abs(vmin) * buffer_factor
                     vmin -= buffer
                     vmax += buffer
-                else:
-                    # For constant fields, add a small buffer
-                    if vmin == 0:
-                        vmin = -0.01
-                        vmax = 0.01
-                    else:
-                        buffer = abs(vmin) * buffer_factor
-                        vmin -= buffer
-                        vmax += buffer
-                
-                # Add attributes
-                ds[var].attrs["valid_min"] = vmin
-                ds[var].attrs["valid_max"] = vmax
-                
-                logger.debug(f"Added valid range for {var}: [{vmin}, {vmax}]")
-        
-        return ds
\ No newline at end of file
+
+            # Add attributes
+            ds[var].attrs["valid_min"] = vmin
+            ds[var].attrs["valid_max"] = vmax
+
+            logger.debug(f"Added valid range for {var}: [{vmin}, {vmax}]")
+
+        return ds